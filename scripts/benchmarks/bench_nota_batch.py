@@ -0,0 +1,87 @@
+"""
+Benchmark of the month-end summaries over a NotaBatch.
+
+It builds the NotaBatch of many notas (NotaRecord records with Brazilian formatted values),
+then times the summaries (total ISSQN per prestador CNPJ and per competência)
+against the same summaries computed from the strings, in a Python loop.
+
+How to run (from the repository root):
+    LOG_DIR=logs python scripts/benchmarks/bench_nota_batch.py [number of notas]
+"""
+
+import random
+import sys
+import time
+
+from collections import defaultdict
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from packag.models.business.formats import parse_date  # noqa: E402
+from packag.models.business.notaBatch import NotaBatch  # noqa: E402
+from packag.models.business.records import NotaRecord  # noqa: E402
+
+NUMBER_OF_NOTAS = 1_000_000
+NUMBER_OF_PRESTADORES = 5_000
+MONTHS = ['01/2024', '02/2024', 'MAR/2024', '15/04/2024', '2024-05-31T10:00:00', '06/2024']
+
+
+def format_brl(centavos: int) -> str:
+    reais, centavos = divmod(centavos, 100)
+    return f'{reais:,}'.replace(',', '.') + f',{centavos:02d}'
+
+
+def create_notas(number_of_notas: int) -> tuple:
+    random.seed(0)
+    notas, cnpjs = [], []
+
+    for number in range(number_of_notas):
+        valor_total = random.randint(1_000, 10_000_000)
+        notas.append(NotaRecord.from_dict({
+            'numero_nfs': str(number), 'data_competencia': MONTHS[number % len(MONTHS)],
+            'valor_total': format_brl(valor_total), 'valor_liquido': format_brl(valor_total),
+            'valor_issqn': format_brl(valor_total // 20), 'base_calculo': format_brl(valor_total), 'aliquota': '5,00',
+            'valor_pis': '0,00', 'valor_cofins': '0,00', 'municipio': 'Penedo', 'estado': 'AL',
+        }))
+        cnpjs.append(f'{random.randrange(NUMBER_OF_PRESTADORES):08d}/0001-00')
+
+    return notas, cnpjs
+
+
+def summarize_in_python(notas: list, cnpjs: list) -> tuple:
+    by_prestador, by_competencia = defaultdict(Decimal), defaultdict(Decimal)
+
+    for nota, cnpj in zip(notas, cnpjs):
+        valor_issqn = Decimal(nota.valor_issqn.replace('.', '').replace(',', '.'))
+        by_prestador[cnpj] += valor_issqn
+        by_competencia[parse_date(nota.data_competencia).replace(day=1)] += valor_issqn
+
+    return by_prestador, by_competencia
+
+
+def timed(function, *args) -> tuple:
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    number_of_notas = int(sys.argv[1]) if len(sys.argv) > 1 else NUMBER_OF_NOTAS
+    notas, cnpjs = create_notas(number_of_notas)
+
+    batch, build_time = timed(NotaBatch.from_notas, notas, cnpjs)
+    print(f'build the NotaBatch of {number_of_notas} notas (parse every column): {build_time:.2f} s')
+
+    def summarize(batch: NotaBatch) -> tuple:
+        return batch.total_issqn_by_prestador(), batch.total_issqn_by_competencia()
+
+    (by_prestador, by_competencia), summary_time = timed(summarize, batch)
+    print(f'summaries over the NotaBatch: {summary_time:.2f} s')
+
+    (expected_by_prestador, expected_by_competencia), python_time = timed(summarize_in_python, notas, cnpjs)
+    print(f'summaries from the strings, in a Python loop: {python_time:.2f} s')
+
+    assert {cnpj: Decimal(total) / 100 for cnpj, total in by_prestador.items()} == expected_by_prestador
+    assert {month: Decimal(total) / 100 for month, total in by_competencia.items()} == expected_by_competencia
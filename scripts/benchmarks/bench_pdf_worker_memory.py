@@ -0,0 +1,100 @@
+"""
+Memory benchmark of a long-running extraction worker.
+
+It extracts the text of many small PDFs in the same process, printing the resident memory (RSS) every few documents,
+then the peak memory allocated while extracting a long PDF:
+    * before: the pages are kept open until the PDF is closed, so pdfplumber keeps their caches
+      (and its text map cache, shared by all the pages of the process).
+    * after: extract_text_from_pdf closes each page as soon as its text is extracted.
+
+A worker whose RSS still grows can be recycled with max_tasks_per_worker / max_worker_memory_mb (see pipeline/batch.py).
+
+How to run (from the repository root):
+    LOG_DIR=logs python scripts/benchmarks/bench_pdf_worker_memory.py [number of documents]
+"""
+
+import sys
+import tempfile
+import tracemalloc
+
+from pathlib import Path
+
+import pdfplumber
+
+from reportlab.pdfgen import canvas
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from packag.modules.pdf_operations import extract_text_from_pdf  # noqa: E402
+from packag.modules.pipeline.batch import get_rss_mb  # noqa: E402
+
+NUMBER_OF_DOCUMENTS = 10_000
+NUMBER_OF_PDFS = 50
+NUMBER_OF_PAGES = 1
+NUMBER_OF_LINES = 10
+NUMBER_OF_SAMPLES = 10
+NUMBER_OF_PAGES_OF_THE_LONG_PDF = 100
+
+
+def create_pdf(pdf_path: Path, number: int, number_of_pages: int, number_of_lines: int) -> Path:
+    c = canvas.Canvas(str(pdf_path))
+
+    for page in range(number_of_pages):
+        for line in range(number_of_lines):
+            c.drawString(40, 800 - line * 18, f'NFS-e {number} page {page} line {line} valor R$ {number * line},00')
+        c.showPage()
+
+    c.save()
+    return pdf_path
+
+
+def extract_keeping_the_pages(pdf_path: Path) -> str:
+    """
+    Emulates the previous behaviour: the pages are never closed.
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        return ''.join(page.extract_text() for page in pdf.pages)
+
+
+def measure_peak_mb(extract, pdf_path: Path) -> float:
+    tracemalloc.start()
+    extract(pdf_path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak / 1024 ** 2
+
+
+def measure(extract, pdf_paths: list, number_of_documents: int) -> list:
+    samples = []
+
+    for document in range(1, number_of_documents + 1):
+        extract(pdf_paths[document % len(pdf_paths)])
+
+        if document % (number_of_documents // NUMBER_OF_SAMPLES) == 0:
+            samples.append(get_rss_mb())
+
+    return samples
+
+
+if __name__ == '__main__':
+    number_of_documents = int(sys.argv[1]) if len(sys.argv) > 1 else NUMBER_OF_DOCUMENTS
+
+    with tempfile.TemporaryDirectory() as directory:
+        pdf_paths = [
+            create_pdf(Path(directory) / f'{number}.pdf', number, NUMBER_OF_PAGES, NUMBER_OF_LINES)
+            for number in range(NUMBER_OF_PDFS)
+        ]
+        long_pdf_path = create_pdf(Path(directory) / 'long.pdf', 0, NUMBER_OF_PAGES_OF_THE_LONG_PDF, 40)
+
+        # warm up the imports and the allocator before the first sample
+        measure(extract_text_from_pdf, pdf_paths, NUMBER_OF_SAMPLES)
+
+        for name, extract in (('before', extract_keeping_the_pages), ('after', extract_text_from_pdf)):
+            samples = measure(extract, pdf_paths, number_of_documents)
+            print(f'{name:<6} RSS (MB) every {number_of_documents // NUMBER_OF_SAMPLES} documents:', ' '.join(f'{sample:.0f}' for sample in samples))
+            print(f'{name:<6} growth from the first to the last sample: {samples[-1] - samples[0]:+.1f} MB')
+
+        for name, extract in (('before', extract_keeping_the_pages), ('after', extract_text_from_pdf)):
+            peak = measure_peak_mb(extract, long_pdf_path)
+            print(f'{name:<6} peak memory allocated while extracting a {NUMBER_OF_PAGES_OF_THE_LONG_PDF}-page PDF: {peak:.1f} MB')
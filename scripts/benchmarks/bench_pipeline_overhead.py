@@ -0,0 +1,77 @@
+"""
+Micro-benchmark of the per-run overhead of a Pipeline.
+
+It runs a pipeline of cheap tasks many times and compares:
+    * before: the tasks are resolved (get_tasks) and the operation classes validated on every run.
+    * after: the compiled plan built on initialization is reused by every run.
+
+How to run (from the repository root):
+    LOG_DIR=logs python scripts/benchmarks/bench_pipeline_overhead.py
+"""
+
+import logging
+import sys
+import timeit
+
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'src'))
+
+from packag.modules.pipeline import Pipeline, Task, Operation  # noqa: E402
+from packag.modules.pipeline.tasks import ExtractDataTask  # noqa: E402
+from packag.modules.pipeline.utils.exceptions import PipelineError, TaskError  # noqa: E402
+
+NUMBER_OF_TASKS = 5
+NUMBER_OF_RUNS = 100_000
+
+
+class IdentityOperation(Operation):
+    def run(self, input_data=None):
+        return input_data
+
+class IdentityTask(Task):
+    _validate_operation_cls = ExtractDataTask._validate_operation_cls
+
+    def _validate_input(self, input_data):
+        return input_data
+
+    def _validate_output(self, output_data):
+        return output_data
+
+class CompiledPipeline(Pipeline):
+    def get_tasks(self):
+        return [IdentityTask(IdentityOperation) for _ in range(NUMBER_OF_TASKS)]
+
+class UncompiledPipeline(CompiledPipeline):
+    """
+    Emulates the previous behaviour: the tasks are built and validated again on every run.
+    """
+    def run(self, input_data=None):
+        previous_task_result = input_data
+
+        try:
+            # new tasks are not compiled, so each one validates its operation class on run
+            for task in self.get_tasks():
+                previous_task_result = task.run(previous_task_result)
+        except TaskError as e:
+            raise PipelineError(message=e.message, pipeline_name=self.__class__.__name__, original_exception=e)
+
+        return previous_task_result
+
+
+def measure(pipeline):
+    seconds = min(timeit.repeat(lambda: pipeline.run('input'), number=NUMBER_OF_RUNS, repeat=3))
+    return seconds / NUMBER_OF_RUNS * 1e6
+
+
+if __name__ == '__main__':
+    # the pipeline logs every run; it is not part of the measured overhead
+    logging.disable(logging.CRITICAL)
+
+    before = measure(UncompiledPipeline())
+    after = measure(CompiledPipeline())
+
+    print(f'{NUMBER_OF_TASKS} tasks, {NUMBER_OF_RUNS} runs')
+    print(f'before (tasks resolved and validated on every run): {before:.2f} us/run')
+    print(f'after  (compiled plan reused):                      {after:.2f} us/run')
+    print(f'speedup: {before / after:.2f}x')
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+from packag.models.business.dtoNota import NotaExtractedInfo
+from packag.models.business.dtoPrestador import PrestadorExtractedInfo
+from packag.models.business.dtoTomador import TomadorExtractedInfo
+
+
+class NfseExtractedInfo(BaseModel):
+    """
+    The three blocks of a NFS-e (Nota, Prestador and Tomador), extracted from the same document and validated together.
+    """
+    nota: NotaExtractedInfo
+    prestador: PrestadorExtractedInfo
+    tomador: TomadorExtractedInfo
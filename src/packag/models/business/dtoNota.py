@@ -3,6 +3,7 @@ from pydantic import (
     ConfigDict
 )
 from typing import Optional
+from decimal import Decimal
 
 import datetime
 
@@ -41,8 +42,40 @@ class NotaExtractedInfo(BaseModel):
     municipio: str
 
 
-    
+class NotaNormalizedInfo(BaseModel):
+    """
+    The values of NotaExtractedInfo as typed values (see normalizers/notaNormalizer.py):
+    the values in reais (Decimal with 2 decimal places), the dates, and the aliquota in basis points (5,00% is 500).
+    The missing or invalid values are None.
+    """
+    numero_nfs: str
+    codigo_autenticidade: str
 
-    
-    
-    
+    data_competencia: Optional[datetime.date] = None
+
+    valor_liquido: Optional[Decimal] = None
+    valor_total: Optional[Decimal] = None
+    valor_deducoes: Optional[Decimal] = None
+    valor_pis: Optional[Decimal] = None
+    valor_cofins: Optional[Decimal] = None
+    valor_inss: Optional[Decimal] = None
+    valor_irrf: Optional[Decimal] = None
+    valor_csll: Optional[Decimal] = None
+    valor_issqn: Optional[Decimal] = None
+    base_calculo: Optional[Decimal] = None
+    aliquota: Optional[int] = None
+    issqn_a_reter: str
+
+    estado: str
+
+    codigo_tributacao: str
+    discriminacao_servico: str
+    opt_simples_nacional: str
+
+    serie: Optional[str] = None
+    nfse_substituida: Optional[str] = None
+    valor_outras_retencoes: Optional[Decimal] = None
+    data_emissao: Optional[datetime.date] = None
+
+    atv_economica: str
+    municipio: str
@@ -0,0 +1,67 @@
+"""
+Formats Module
+
+This module parses the dates of the NFS-e, as the extractors return them.
+
+Why does it exist?
+Each municipality writes its dates in its own format, and each consumer of the notas parsed them on its own.
+
+How it works:
+The formats found in the NFS-e are:
+    * 31/05/2024, 31/05/2024 - 10:00:00 (emissão, Arapiraca) and 31/05/2024 10:00:00 (emissão, Penedo);
+    * 05/2024 and MAI/2024 (competência, Penedo);
+    * 2024-05-31 and 2024-05-31T10:00:00 (XML files of Maceió and Delmiro).
+A competência without a day is the first day of its month; the time of the emissão is dropped.
+
+How to use:
+    parse_date('MAI/2024')  # datetime.date(2024, 5, 1)
+"""
+
+import datetime
+import re
+
+MONTHS = {
+    'JAN': 1, 'FEV': 2, 'MAR': 3, 'ABR': 4, 'MAI': 5, 'JUN': 6,
+    'JUL': 7, 'AGO': 8, 'SET': 9, 'OUT': 10, 'NOV': 11, 'DEZ': 12,
+}
+
+DAY_MONTH_YEAR_PATTERN = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})(?:(?: - | )\d{1,2}:\d{2}(?::\d{2})?)?')
+MONTH_YEAR_PATTERN = re.compile(r'(\d{1,2})/(\d{4})')
+MONTH_NAME_YEAR_PATTERN = re.compile(r'([A-Za-z]{3})/(\d{4})')
+ISO_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})(?:[T ].*)?')
+
+
+def parse_date(value: str):
+    """
+    Returns the date of a NFS-e date or competência, or None if the value is None or empty.
+
+    Raises:
+        ValueError: If the value is not a date in one of the formats of the NFS-e.
+    """
+    if value is None:
+        return None
+
+    value = value.strip()
+    if not value:
+        return None
+
+    match = ISO_PATTERN.fullmatch(value)
+    if match:
+        year, month, day = match.groups()
+        return datetime.date(int(year), int(month), int(day))
+
+    match = DAY_MONTH_YEAR_PATTERN.fullmatch(value)
+    if match:
+        day, month, year = match.groups()
+        return datetime.date(int(year), int(month), int(day))
+
+    match = MONTH_YEAR_PATTERN.fullmatch(value)
+    if match:
+        month, year = match.groups()
+        return datetime.date(int(year), int(month), 1)
+
+    match = MONTH_NAME_YEAR_PATTERN.fullmatch(value)
+    if match and match.group(1).upper() in MONTHS:
+        return datetime.date(int(match.group(2)), MONTHS[match.group(1).upper()], 1)
+
+    raise ValueError(f'{value!r} is not a date of a NFS-e')
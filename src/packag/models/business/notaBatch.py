@@ -0,0 +1,371 @@
+"""
+Nota Batch Module
+
+This module defines the NotaBatch: the notas of a lot (or of a month) stored by column, in NumPy arrays.
+
+Why does it exist?
+The values of NotaExtractedInfo are strings as written in the NFS-e ("1.234,56"),
+so every sum or filter over the notas parsed them again, one at a time, in Python loops.
+
+How it works:
+The batch parses each column once, when it is built:
+    * the monetary columns (valor_*, base_calculo, aliquota) are int64 arrays of centavos
+      (aliquota "5,00" is 500: hundredths of percent), parsed by parse_brl_centavos over the characters of the whole column;
+      the decimal separator is given by the source of the notas: the comma for the text of the PDF files ("1.234,56"),
+      the dot for the XML files ("1234.56", "5.0000"), see DECIMAL_SEPARATORS;
+    * the dates are datetime64[D] arrays; their few distinct values are parsed once each (see formats.py);
+    * the other columns are arrays of strings (objects).
+A missing or invalid value is 0 / NaT, and is flagged in the `missing` mask of its column.
+The aggregations group the rows by the integer codes of their key (computed once per column),
+then sum the centavos of each group with NumPy.
+
+How to use:
+    batch = NotaBatch.from_nfses(nfses)                                 # notas of PDF files
+    batch = NotaBatch.from_nfses(nfses, decimal_separator='.')          # notas of XML files
+    batch.total('valor_issqn')                  # centavos
+    batch.total_issqn_by_prestador()            # {cnpj: centavos}
+    batch.total_issqn_by_competencia()          # {datetime.date(2024, 5, 1): centavos}
+    batch.filter(batch['valor_total'] > 100_000)
+"""
+
+from operator import attrgetter, itemgetter, methodcaller
+
+import numpy as np
+
+from packag.models.business.dtoNota import NotaExtractedInfo
+from packag.models.business.formats import parse_date
+
+MONEY_COLUMNS = (
+    'valor_liquido', 'valor_total', 'valor_deducoes', 'valor_pis', 'valor_cofins', 'valor_inss', 'valor_irrf',
+    'valor_csll', 'valor_issqn', 'valor_outras_retencoes', 'base_calculo', 'aliquota',
+)
+DATE_COLUMNS = ('data_competencia', 'data_emissao')
+NOTA_COLUMNS = tuple(NotaExtractedInfo.model_fields)
+PRESTADOR_COLUMN = 'prestador_cnpj'
+
+# decimal separator of the monetary values, by file extension of the NFS-e
+DECIMAL_SEPARATORS = {'pdf': ',', 'xml': '.'}
+
+# rows parsed at once by parse_brl_centavos: bounds the memory of the character matrix
+PARSE_CHUNK_SIZE = 65536
+# the columns with at most 1 distinct value in LOW_CARDINALITY_RATIO values are parsed by distinct value
+LOW_CARDINALITY_RATIO = 4
+CARDINALITY_SAMPLE_SIZE = 1000
+# more digits would overflow int64
+MAX_DIGITS = 18
+_POWERS_OF_10 = 10 ** np.arange(MAX_DIGITS + 1, dtype=np.int64)
+
+# classes of the characters of the monetary values
+_OTHER, _DIGIT, _COMMA, _DOT, _MINUS, _IGNORED = range(6)
+_CHARACTER_CLASSES = np.full(257, _OTHER, dtype=np.uint8)
+_CHARACTER_CLASSES[ord('0'):ord('9') + 1] = _DIGIT
+_CHARACTER_CLASSES[ord(',')] = _COMMA
+_CHARACTER_CLASSES[ord('.')] = _DOT
+_CHARACTER_CLASSES[ord('-')] = _MINUS
+# padding, spaces, "R$" and "%"
+_CHARACTER_CLASSES[[0, ord(' '), 0xA0, ord('R'), ord('$'), ord('%')]] = _IGNORED
+
+
+def _parse_chunk(values: np.ndarray, dot_is_decimal: bool) -> tuple:
+    characters = values.astype(np.str_)
+    width = characters.dtype.itemsize // 4
+    if width == 0:
+        return np.zeros(len(values), dtype=np.int64), np.zeros(len(values), dtype=bool)
+
+    # one row per position of the characters, so each step of the loop reads a contiguous row
+    codes = characters.view(np.uint32).reshape(len(values), width).T.copy()
+    classes = _CHARACTER_CLASSES[np.minimum(codes, 256)]
+
+    number = np.zeros(len(values), dtype=np.int64)
+    number_of_digits = np.zeros(len(values), dtype=np.int64)
+    decimals = np.zeros(len(values), dtype=np.int64)
+    after_separator = np.zeros(len(values), dtype=bool)
+    # the other separator only groups the thousands ("1.234,56", "1,234.56")
+    decimal_class = _DOT if dot_is_decimal else _COMMA
+
+    # reads the digits from left to right (Horner), counting the digits after the decimal separator
+    for position in range(width):
+        position_classes = classes[position]
+        is_digit = position_classes == _DIGIT
+
+        number = np.where(is_digit, number * 10 + (codes[position].astype(np.int64) - ord('0')), number)
+        number_of_digits += is_digit
+        after_separator |= position_classes == decimal_class
+        decimals += is_digit & after_separator
+
+    separators = (classes == decimal_class).sum(axis=0)
+    minus = (classes == _MINUS).sum(axis=0)
+
+    # to centavos: 2 decimals (the extra decimals are rounded half up)
+    extra_decimals = np.clip(decimals - 2, 0, MAX_DIGITS)
+    centavos = np.where(
+        decimals <= 2,
+        number * _POWERS_OF_10[np.clip(2 - decimals, 0, 2)],
+        (number + 5 * _POWERS_OF_10[np.maximum(extra_decimals - 1, 0)]) // _POWERS_OF_10[extra_decimals],
+    )
+    centavos = np.where(minus == 1, -centavos, centavos)
+
+    valid = (classes != _OTHER).all(axis=0) & (number_of_digits > 0) & (number_of_digits <= MAX_DIGITS) \
+        & (minus <= 1) & (separators <= 1)
+
+    return np.where(valid, centavos, 0), valid
+
+
+def _factorize(values) -> tuple:
+    """
+    Returns the codes of the values (int64 array) and the array of their distinct values, by code.
+    """
+    uniques = dict.fromkeys(values)
+    for code, value in enumerate(uniques):
+        uniques[value] = code
+
+    codes = np.fromiter(map(uniques.__getitem__, values), dtype=np.int64, count=len(values))
+
+    distinct = np.empty(len(uniques), dtype=object)
+    distinct[:] = list(uniques)
+
+    return codes, distinct
+
+
+def _parse_brl_centavos(values: np.ndarray, dot_is_decimal: bool) -> tuple:
+    is_none = np.equal(values, None)
+    values = np.where(is_none, '', values)
+
+    centavos = np.zeros(len(values), dtype=np.int64)
+    valid = np.zeros(len(values), dtype=bool)
+
+    for start in range(0, len(values), PARSE_CHUNK_SIZE):
+        chunk = slice(start, start + PARSE_CHUNK_SIZE)
+        centavos[chunk], valid[chunk] = _parse_chunk(values[chunk], dot_is_decimal)
+
+    return centavos, ~valid | is_none
+
+
+def _parse_by_decimal_separator(values, decimal_separators) -> tuple:
+    if len(decimal_separators) != len(values):
+        raise ValueError(f'Expected a decimal separator for each of the {len(values)} values, got {len(decimal_separators)}')
+
+    centavos = np.zeros(len(values), dtype=np.int64)
+    missing = np.ones(len(values), dtype=bool)
+
+    separators = np.asarray(decimal_separators, dtype=object)
+    for decimal_separator in set(decimal_separators):
+        rows = np.flatnonzero(separators == decimal_separator)
+        centavos[rows], missing[rows] = parse_brl_centavos([values[row] for row in rows], decimal_separator)
+
+    return centavos, missing
+
+
+def parse_brl_centavos(values, decimal_separator=',') -> tuple:
+    """
+    Parses monetary values written as in the NFS-e into centavos.
+    The decimal separator is not guessed from the values: "5.000" is 5000 reais in the text of a PDF file,
+    and 5 reais in a XML file.
+    The columns with few distinct values (aliquota, the taxes that are mostly "0,00") parse each distinct value once.
+
+    Args:
+        values: the values ("1.234,56", "R$ 10,00", "2,00%", "5.0000", None).
+        decimal_separator: ',' (the text of the PDF files) or '.' (the XML files), see DECIMAL_SEPARATORS;
+            or the list of the decimal separators of each value, for the notas of a lot of both sources.
+
+    Returns:
+        (centavos, missing): an int64 array of the centavos (0 when missing),
+        and the mask of the values that are None, empty or not a number.
+
+    Raises:
+        ValueError: If a decimal separator is not ',' nor '.'.
+    """
+    if not isinstance(decimal_separator, str):
+        return _parse_by_decimal_separator(values, decimal_separator)
+
+    if decimal_separator not in (',', '.'):
+        raise ValueError(f"decimal_separator must be ',' or '.', got {decimal_separator!r}")
+
+    dot_is_decimal = decimal_separator == '.'
+
+    # the cardinality of the column is estimated on its first values
+    if len(set(values[:CARDINALITY_SAMPLE_SIZE])) * LOW_CARDINALITY_RATIO <= min(len(values), CARDINALITY_SAMPLE_SIZE):
+        codes, distinct = _factorize(values)
+        centavos, missing = _parse_brl_centavos(distinct, dot_is_decimal)
+        return centavos[codes], missing[codes]
+
+    return _parse_brl_centavos(np.asarray(values, dtype=object), dot_is_decimal)
+
+
+def parse_dates(values) -> tuple:
+    """
+    Parses the dates of the NFS-e (see formats.py); each distinct value is parsed once.
+
+    Returns:
+        (dates, missing): a datetime64[D] array (NaT when missing), and the mask of the values that are None or not a date.
+    """
+    codes, distinct = _factorize(values)
+
+    parsed = np.empty(len(distinct), dtype='datetime64[D]')
+    for code, value in enumerate(distinct):
+        try:
+            date = parse_date(value)
+        except ValueError:
+            date = None
+        parsed[code] = np.datetime64('NaT') if date is None else np.datetime64(date, 'D')
+
+    dates = parsed[codes]
+    return dates, np.isnat(dates)
+
+
+def _get_field_getter(notas: list, index: int, name: str):
+    if not notas or isinstance(notas[0], tuple):
+        return itemgetter(index)
+
+    if isinstance(notas[0], dict):
+        return methodcaller('get', name)
+
+    return attrgetter(name)
+
+
+def get_columns(notas: list) -> dict:
+    """
+    Returns the lists of the raw values of each field of the notas: NotaExtractedInfo models,
+    NotaRecord records (see records.py) or dicts of fields (all the notas of the same type).
+    """
+    return {
+        name: list(map(_get_field_getter(notas, index, name), notas))
+        for index, name in enumerate(NOTA_COLUMNS)
+    }
+
+
+def _as_object_array(values) -> np.ndarray:
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+class NotaBatch:
+    """
+    Notas stored by column.
+
+    Attributes:
+        columns: the arrays of the columns, by name (the fields of NotaExtractedInfo, and prestador_cnpj if known).
+        missing: the masks of the missing or invalid values of the monetary and date columns.
+    """
+
+    def __init__(self, columns: dict, missing: dict):
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f'The columns of a NotaBatch must have the same length, got {sorted(lengths)}')
+
+        self.columns = columns
+        self.missing = missing
+        self._codes = {}
+
+    @classmethod
+    def from_columns(cls, values: dict, decimal_separator=','):
+        """
+        Builds the batch from the raw values (strings) of each column.
+        The decimal separator of the monetary values is ',' or '.', or the list of the separators of each row
+        (see parse_brl_centavos).
+        """
+        columns, missing = {}, {}
+
+        for name, column_values in values.items():
+            if name in MONEY_COLUMNS:
+                columns[name], missing[name] = parse_brl_centavos(column_values, decimal_separator)
+            elif name in DATE_COLUMNS:
+                columns[name], missing[name] = parse_dates(column_values)
+            else:
+                columns[name] = _as_object_array(column_values)
+
+        return cls(columns, missing)
+
+    @classmethod
+    def from_notas(cls, notas: list, prestador_cnpjs: list = None, decimal_separator=','):
+        """
+        Builds the batch from NotaExtractedInfo models, NotaRecord records (see records.py) or dicts of fields
+        (all the notas of the same type), extracted from PDF files (decimal_separator=',') or XML files ('.').
+        """
+        values = get_columns(notas)
+        if prestador_cnpjs is not None:
+            values[PRESTADOR_COLUMN] = list(prestador_cnpjs)
+
+        return cls.from_columns(values, decimal_separator)
+
+    @classmethod
+    def from_nfses(cls, nfses: list, decimal_separator=','):
+        """
+        Builds the batch from NfseExtractedInfo objects; prestador_cnpj is the cnpj (or cpf) of their prestador.
+        """
+        return cls.from_notas(
+            [nfse.nota for nfse in nfses],
+            prestador_cnpjs=[nfse.prestador.cnpj or nfse.prestador.cpf for nfse in nfses],
+            decimal_separator=decimal_separator,
+        )
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def filter(self, mask: np.ndarray):
+        """
+        Returns a batch with the rows of the mask (a boolean array, or an array of row indexes).
+        """
+        return NotaBatch(
+            {name: column[mask] for name, column in self.columns.items()},
+            {name: column_missing[mask] for name, column_missing in self.missing.items()},
+        )
+
+    def total(self, column: str) -> int:
+        """
+        Returns the sum of a monetary column, in centavos.
+        """
+        if column not in MONEY_COLUMNS:
+            raise ValueError(f'{column} is not a monetary column')
+
+        return int(self.columns[column].sum())
+
+    def _get_codes(self, key: str) -> tuple:
+        """
+        Returns the codes of the rows by the values of the key column, and the key of each code (computed once per key).
+        The key 'competencia' is the month of data_competencia.
+        """
+        if key not in self._codes:
+            column = self.columns['data_competencia'].astype('datetime64[M]') if key == 'competencia' else self.columns[key]
+
+            if column.dtype == object:
+                self._codes[key] = _factorize(column)
+            else:
+                distinct, codes = np.unique(column, return_inverse=True)
+                self._codes[key] = codes.reshape(-1), distinct
+
+        return self._codes[key]
+
+    def sum_by(self, column: str, key: str) -> dict:
+        """
+        Returns the sum of a monetary column (in centavos) by value of the key column.
+        """
+        if column not in MONEY_COLUMNS:
+            raise ValueError(f'{column} is not a monetary column')
+
+        if key not in self.columns and key != 'competencia':
+            raise ValueError(f'The batch has no column {key}')
+
+        codes, keys = self._get_codes(key)
+        if len(codes) == 0:
+            return {}
+
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        totals = np.add.reduceat(self.columns[column][order], starts)
+
+        return dict(zip(keys[sorted_codes[starts]].tolist(), totals.tolist()))
+
+    def total_issqn_by_prestador(self) -> dict:
+        return self.sum_by('valor_issqn', PRESTADOR_COLUMN)
+
+    def total_issqn_by_competencia(self) -> dict:
+        """
+        Returns the total ISSQN by month of competência ({first day of the month: centavos}).
+        """
+        return self.sum_by('valor_issqn', 'competencia')
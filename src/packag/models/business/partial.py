@@ -0,0 +1,27 @@
+from functools import lru_cache
+from typing import Type
+
+from pydantic import BaseModel, create_model
+
+
+@lru_cache(maxsize=None)
+def get_partial_model(model: Type[BaseModel], fields: tuple) -> Type[BaseModel]:
+    """
+    Returns a model with only the given fields of `model` (same types, defaults and required fields),
+    used to validate the output of an extractor that extracted only those fields.
+    
+    The model validators of `model` are not kept, since they may need fields that were not extracted
+    (e.g. at least one of cnpj or cpf).
+    The partial models are built once per model and set of fields.
+    
+    Raises:
+        ValueError: If a field is not a field of `model`.
+    """
+    unknown_fields = [field for field in fields if field not in model.model_fields]
+    if unknown_fields:
+        raise ValueError(f'{model.__name__} has no fields {unknown_fields}')
+    
+    return create_model(
+        f'{model.__name__}Partial',
+        **{field: (model.model_fields[field].annotation, model.model_fields[field]) for field in fields},
+    )
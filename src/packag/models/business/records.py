@@ -0,0 +1,88 @@
+"""
+Records Module
+
+This module defines compact records of the extracted Nota, Prestador and Tomador:
+tuples with the fields of the models, for the programs holding many of them in memory (e.g. the month-end reconciliation).
+
+Why does it exist?
+Each NotaExtractedInfo is a pydantic model with a __dict__ of its 25 fields, and each of its values is a string of its own,
+even when it is the same for most of the notas (municipio, estado, aliquota, ...).
+A record has no __dict__ (it is a named tuple), and its values of low cardinality are interned:
+the records share a single string for each municipio, estado, aliquota, ...
+
+How to use:
+    record = NotaRecord.from_model(nota)
+    record.valor_total
+    record.to_model() == nota  # the conversion keeps every value
+"""
+
+import sys
+
+from collections import namedtuple
+from typing import Type
+
+from pydantic import BaseModel
+
+from packag.models.business.dtoNota import NotaExtractedInfo
+from packag.models.business.dtoPrestador import PrestadorExtractedInfo
+from packag.models.business.dtoTomador import TomadorExtractedInfo
+
+
+class CompactRecord:
+    """
+    Base class of the records: a subclass must also inherit from the named tuple of the fields of MODEL,
+    and list its fields of low cardinality in INTERNED_FIELDS.
+    """
+    __slots__ = ()
+
+    MODEL: Type[BaseModel] = None
+    INTERNED_FIELDS: frozenset = frozenset()
+
+    @classmethod
+    def from_dict(cls, values: dict):
+        """
+        Returns the record of a dict of fields (e.g. the output of an extractor); the missing fields are None.
+        """
+        return cls._make(
+            sys.intern(value) if name in cls.INTERNED_FIELDS and type(value) is str else value
+            for name, value in ((name, values.get(name)) for name in cls._fields)
+        )
+
+    @classmethod
+    def from_model(cls, model: BaseModel):
+        if not isinstance(model, cls.MODEL):
+            raise ValueError(f'Expected a {cls.MODEL.__name__} object, got {type(model)} instead')
+
+        return cls.from_dict(model.__dict__)
+
+    def to_dict(self) -> dict:
+        return dict(zip(self._fields, self))
+
+    def to_model(self) -> BaseModel:
+        return self.MODEL.model_validate(self.to_dict())
+
+
+class NotaRecord(CompactRecord, namedtuple('NotaRecord', NotaExtractedInfo.model_fields)):
+    __slots__ = ()
+
+    MODEL = NotaExtractedInfo
+    INTERNED_FIELDS = frozenset({
+        'data_competencia', 'aliquota', 'issqn_a_reter', 'estado', 'codigo_tributacao',
+        'opt_simples_nacional', 'serie', 'atv_economica', 'municipio',
+        # mostly zero
+        'valor_deducoes', 'valor_pis', 'valor_cofins', 'valor_inss', 'valor_irrf', 'valor_csll', 'valor_outras_retencoes',
+    })
+
+
+class PrestadorRecord(CompactRecord, namedtuple('PrestadorRecord', PrestadorExtractedInfo.model_fields)):
+    __slots__ = ()
+
+    MODEL = PrestadorExtractedInfo
+    INTERNED_FIELDS = frozenset({'municipio', 'uf', 'cep', 'bairro'})
+
+
+class TomadorRecord(CompactRecord, namedtuple('TomadorRecord', TomadorExtractedInfo.model_fields)):
+    __slots__ = ()
+
+    MODEL = TomadorExtractedInfo
+    INTERNED_FIELDS = frozenset({'municipio', 'uf', 'cep', 'bairro'})
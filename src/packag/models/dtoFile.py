@@ -1,6 +1,14 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 from pathlib import Path
 from enum import Enum
+from typing import Any, Optional
+
+import io
+import mmap
+
+
+# types of the content of a file received in memory (object store, message queue...)
+IN_MEMORY_TYPES = (bytes, bytearray, memoryview, io.BytesIO, mmap.mmap)
 
 
 class FileExtensionEnum(str, Enum):
@@ -16,10 +24,32 @@ class File(BaseModel):
     """
     This is the base class for all files.
     It is used to validate the file path and the file extension.
+    
+    A file is either on disk (`file_path`) or in memory (`content`: bytes, bytearray, memoryview, BytesIO or mmap),
+    so the files received from an object store or a queue are read without a temporary file.
     """
-    file_path: Path
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    file_path: Optional[Path] = None
     file_extension: FileExtensionEnum
+    content: Optional[Any] = None
     
+    @field_validator('content')
+    @classmethod
+    def content_must_be_in_memory(cls, content):
+        if content is not None and not isinstance(content, IN_MEMORY_TYPES):
+            raise ValueError('content must be bytes, bytearray, memoryview, BytesIO or mmap.')
+        return content
     
+    @model_validator(mode='after')
+    def path_or_content(self):
+        if self.file_path is None and self.content is None:
+            raise ValueError('One of file_path or content must be provided.')
+        return self
     
-
+    @property
+    def source(self):
+        """
+        What the loaders read: the content of an in-memory file, or the path of a file on disk.
+        """
+        return self.content if self.content is not None else self.file_path
@@ -4,4 +4,10 @@ from .pipeline_config import (
 
 from .config import (
     LOG_DIR,
-)
\ No newline at end of file
+    PDF_TEXT_CACHE_DIR,
+    PDF_TEXT_CACHE_MAX_BYTES,
+    PDF_PAGE_WORKERS,
+    MMAP_MIN_BYTES,
+    VALIDATION_MODE,
+    VALIDATION_SAMPLE_EVERY,
+)
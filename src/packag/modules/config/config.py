@@ -4,4 +4,19 @@ from pathlib import Path
 
 load_dotenv()
 
-LOG_DIR = Path(os.getenv('LOG_DIR'))
\ No newline at end of file
+LOG_DIR = Path(os.getenv('LOG_DIR'))
+
+# persistent cache of extracted PDF text (disabled when PDF_TEXT_CACHE_DIR is not set)
+PDF_TEXT_CACHE_DIR = Path(os.getenv('PDF_TEXT_CACHE_DIR')) if os.getenv('PDF_TEXT_CACHE_DIR') else None
+PDF_TEXT_CACHE_MAX_BYTES = int(os.getenv('PDF_TEXT_CACHE_MAX_BYTES', 1024 * 1024 * 1024))
+
+# number of processes extracting the pages of a long PDF in parallel (1: the pages are extracted one after another)
+PDF_PAGE_WORKERS = int(os.getenv('PDF_PAGE_WORKERS', 1))
+
+# files on disk bigger than this are memory-mapped by the loaders instead of read into memory
+MMAP_MIN_BYTES = int(os.getenv('MMAP_MIN_BYTES', 1024 * 1024))
+
+# validation of the extractor outputs: 'full' (every document), 'sampled' (1 in VALIDATION_SAMPLE_EVERY documents,
+# and every document missing a required field) or 'trusted' (no validation, see extractors/validation.py)
+VALIDATION_MODE = os.getenv('VALIDATION_MODE', 'full')
+VALIDATION_SAMPLE_EVERY = int(os.getenv('VALIDATION_SAMPLE_EVERY', 100))
@@ -0,0 +1,27 @@
+from .document import (
+    ParsedDocument,
+    DocumentCache,
+    document_cache,
+    get_document,
+)
+from .files import build_file, iter_files
+from .line_index import LineIndex, get_line_index
+from .scanner import LineScanner
+from .xml_index import XmlIndex
+from .xml_stream import ElementDocument, iter_elements, iter_element_documents
+
+__all__ = [
+    'ParsedDocument',
+    'DocumentCache',
+    'document_cache',
+    'get_document',
+    'build_file',
+    'iter_files',
+    'LineIndex',
+    'get_line_index',
+    'LineScanner',
+    'XmlIndex',
+    'ElementDocument',
+    'iter_elements',
+    'iter_element_documents',
+]
@@ -0,0 +1,266 @@
+"""
+Document Module
+
+This module defines the ParsedDocument class, the parsed content of a single NFS-e file.
+
+Why does it exist?
+A NFS-e is read by three extractor families (Nota, Prestador and Tomador).
+Parsing the file (pdfplumber for PDFs, ElementTree for XMLs) is by far the most expensive step of the extraction,
+so it must happen only once per document, and the result must be shared by all the extractors.
+
+How to use:
+    document = get_document(file)
+    document.text   # text of a PDF file
+    document.lines  # text split in lines
+    document.line_index  # index of the lines (see line_index.py)
+    document.root   # root element of a XML file
+    document.xml_index  # elements of a XML file by tag path (see xml_index.py)
+"""
+
+import hashlib
+import threading
+import xml.etree.ElementTree as ET
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Optional
+
+from packag.models import dtoFile
+from packag.models.dtoFile import FileExtensionEnum
+from packag.modules.document_operations.line_index import LineIndex
+from packag.modules.document_operations.xml_index import XmlIndex
+from packag.modules.config import MMAP_MIN_BYTES
+from packag.modules.pdf_operations import extract_text_from_pdf
+from packag.modules.utils.buffers import as_buffer, iter_chunks, map_file
+
+DOCUMENT_CACHE_MAX_SIZE = 32
+
+# size of the slices of a XML file fed to the parser
+XML_FEED_CHUNK_SIZE = 1024 * 1024
+
+
+def _parse_xml(content):
+    """
+    Parses the XML content (bytes-like or mmap), feeding the parser with zero-copy slices of it.
+    """
+    parser = ET.XMLParser()
+    chunks = iter_chunks(content, XML_FEED_CHUNK_SIZE)
+
+    try:
+        for chunk in chunks:
+            with chunk:
+                parser.feed(chunk)
+    finally:
+        # releases the views of the content, so a memory map can be closed even if the XML is not valid
+        chunks.close()
+
+    return parser.close()
+
+
+class locked_cached_property(cached_property):
+    """
+    cached_property computed under the lock of its instance (`_lock`), so the attribute is computed once
+    even when many threads read it at the same time.
+    Since Python 3.12, cached_property has no lock of its own
+    (and the one of Python 3.8 - 3.11 is shared by all the instances of the class).
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        cache = instance.__dict__
+        try:
+            return cache[self.attrname]
+        except KeyError:
+            pass
+
+        with instance._lock:
+            # another thread may have computed it while this one was waiting for the lock
+            if self.attrname not in cache:
+                cache[self.attrname] = self.func(instance)
+
+            return cache[self.attrname]
+
+
+class ParsedDocument:
+    """
+    Parsed content of a dtoFile.File.
+
+    Every attribute is computed on first access and kept for the lifetime of the object,
+    so the extractors can read it as many times as they need.
+    The attributes are computed under a lock of the document, so the threads sharing it parse the file only once.
+
+    For PDFs, only the first `max_pages` pages are extracted (all of them if None).
+    The content of an in-memory file (file.content) is read directly, without a temporary file,
+    and the files on disk bigger than MMAP_MIN_BYTES are memory-mapped instead of read.
+    """
+
+    def __init__(self, file: dtoFile.File, max_pages: Optional[int] = None):
+        self.file = file
+        self.max_pages = max_pages
+        # reentrant: line_index reads text, and xml_index reads root, under the lock
+        self._lock = threading.RLock()
+
+    @property
+    def is_pdf(self):
+        return self.file.file_extension == FileExtensionEnum.PDF
+
+    @property
+    def is_xml(self):
+        return self.file.file_extension == FileExtensionEnum.XML
+
+    @property
+    def is_in_memory(self):
+        return self.file.content is not None
+
+    @locked_cached_property
+    def content(self):
+        """
+        Raw bytes of the file (for an in-memory file, a bytes-like object over its content, not a copy).
+        """
+        if self.is_in_memory:
+            return as_buffer(self.file.content)
+
+        return self.file.file_path.read_bytes()
+
+    @property
+    def is_mapped(self):
+        """
+        True if the file is read through a memory map (a file on disk of at least MMAP_MIN_BYTES).
+        """
+        return not self.is_in_memory and self.file.file_path.stat().st_size >= MMAP_MIN_BYTES
+
+    @contextmanager
+    def _open_content(self):
+        """
+        Yields the content of the file as a bytes-like object: the memory map of a large file
+        (valid only inside the block, and never kept), or the content otherwise.
+        """
+        if not self.is_mapped:
+            yield self.content
+            return
+
+        with map_file(self.file.file_path) as mapped:
+            yield mapped
+
+    @locked_cached_property
+    def text(self) -> str:
+        """
+        Text of the document.
+        For PDFs, it is the text extracted by pdfplumber; for the other files, the decoded content.
+        """
+        if self.is_pdf and not self.is_mapped:
+            return extract_text_from_pdf(self.file.source, max_pages=self.max_pages)
+
+        with self._open_content() as content:
+            if self.is_pdf:
+                return extract_text_from_pdf(content, max_pages=self.max_pages)
+
+            return str(content, 'utf-8')
+
+    @locked_cached_property
+    def line_index(self) -> LineIndex:
+        """
+        Index of the lines of the text (next non-empty line, lines containing a keyword, ...).
+        """
+        return LineIndex(self.text)
+
+    @property
+    def lines(self) -> list:
+        return self.line_index.lines
+
+    @locked_cached_property
+    def root(self):
+        """
+        Root element of a XML document, or None if the file is empty.
+        """
+        with self._open_content() as content:
+            if not len(content):
+                return None
+
+            return _parse_xml(content)
+
+    @locked_cached_property
+    def xml_index(self):
+        """
+        Index of the elements of a XML document by tag path (see xml_index.py), or None if the file is empty.
+        """
+        if self.root is None:
+            return None
+
+        return XmlIndex(self.root)
+
+
+class DocumentCache:
+    """
+    Keeps the last parsed documents, so the extractors that receive the same file share the same ParsedDocument.
+
+    The key is the file path plus its modification time and size,
+    so a file that changes on disk is parsed again, and the number of pages read.
+    For an in-memory file, the path is replaced by a hash of its content.
+    """
+
+    def __init__(self, max_size: int = DOCUMENT_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_key(self, file: dtoFile.File, max_pages: Optional[int] = None):
+        if file.content is not None:
+            content_hash = hashlib.blake2b(as_buffer(file.content), digest_size=16).hexdigest()
+            return (content_hash, file.file_extension, max_pages)
+
+        file_path = file.file_path
+        stat = file_path.stat()
+
+        return (str(file_path.resolve()), file.file_extension, stat.st_mtime_ns, stat.st_size, max_pages)
+
+    def get(self, file: dtoFile.File, max_pages: Optional[int] = None) -> ParsedDocument:
+        key = self._get_key(file, max_pages)
+
+        with self._lock:
+            document = self._documents.get(key)
+
+            if document is not None:
+                self._documents.move_to_end(key)
+                return document
+
+            document = ParsedDocument(file, max_pages=max_pages)
+            self._documents[key] = document
+
+            if len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+
+            return document
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+    def __len__(self):
+        return len(self._documents)
+
+
+document_cache = DocumentCache()
+
+
+def get_document(file: dtoFile.File, max_pages: Optional[int] = None) -> ParsedDocument:
+    """
+    Returns the ParsedDocument of the file, parsing it only if it was not parsed before.
+
+    Args:
+        file (dtoFile.File): the file to be parsed.
+        max_pages (int, optional): for PDFs, the number of pages the extractors need. Defaults to all the pages.
+
+    Raises:
+        ValueError: If `file` is not a dtoFile.File object.
+        FileNotFoundError: If the file does not exist.
+    Returns:
+        ParsedDocument: the document shared by all the extractors of the file.
+    """
+    if not isinstance(file, dtoFile.File):
+        raise ValueError('file must be a dtoFile.File object')
+
+    return document_cache.get(file, max_pages=max_pages)
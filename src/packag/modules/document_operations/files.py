@@ -0,0 +1,71 @@
+"""
+Files Module
+
+Lazily builds dtoFile.File objects from a directory or from an iterable of paths,
+so a batch of NFS-e files never needs to be fully loaded in memory.
+
+Example:
+    for file in iter_files(Path('static/notas_fiscais'), pattern='**/*.pdf'):
+        ...
+"""
+
+import os
+
+from pathlib import Path
+
+from packag.models import dtoFile
+from packag.models.dtoFile import FileExtensionEnum
+from packag.modules.utils.logger import get_logger
+
+logger = get_logger('operations')
+
+SUPPORTED_EXTENSIONS = {extension.value for extension in FileExtensionEnum}
+
+
+def build_file(file_path: Path) -> dtoFile.File:
+    """
+    Builds the dtoFile.File of a path, using its suffix as the file extension.
+
+    Raises:
+        ValueError: If the suffix of the path is not a supported file extension.
+    """
+    file_extension = file_path.suffix.lstrip('.').lower()
+
+    if file_extension not in SUPPORTED_EXTENSIONS:
+        raise ValueError(f'File {file_path} does not have a supported extension: {sorted(SUPPORTED_EXTENSIONS)}')
+
+    return dtoFile.File(file_path=file_path, file_extension=file_extension)
+
+
+def iter_files(source, pattern: str = '*'):
+    """
+    Yields a dtoFile.File for each file of the source, one at a time.
+
+    Args:
+        source: a directory, as a str or a Path (its files matching `pattern` are used),
+            or an iterable of Path / dtoFile.File objects.
+        pattern (str): glob pattern used when source is a directory (e.g. '**/*.xml').
+
+    Files with an unsupported extension are skipped (and logged).
+
+    Raises:
+        ValueError: If source is a str or a Path but not a directory.
+    """
+    # a str is a path, not an iterable of paths (its characters)
+    if isinstance(source, (str, os.PathLike)):
+        source = Path(source)
+
+        if not source.is_dir():
+            raise ValueError(f'{source} must be a directory')
+
+        source = (path for path in source.glob(pattern) if path.is_file())
+
+    for item in source:
+        if isinstance(item, dtoFile.File):
+            yield item
+            continue
+
+        try:
+            yield build_file(Path(item))
+        except ValueError as e:
+            logger.warning(f'Skipping file: {e}')
@@ -0,0 +1,126 @@
+"""
+Line Index Module
+
+This module defines the LineIndex class, an index of the lines of the text of a document.
+
+Why does it exist?
+Most PDF field extractors follow the same recipe: find a header line, then read the value
+on the next line (or the next non-empty line). Done with nested loops, every field splits the text again,
+walks it looking for its header and then walks forward looking for a non-empty line.
+The LineIndex does this work once per document:
+    * the text is split in lines once;
+    * the next non-empty line of every line is precomputed, so "value on next non-empty line" is O(1);
+    * the lines containing a keyword are found once and kept, so looking a header up again is O(1).
+
+The index of a document is built by ParsedDocument.line_index and shared by all the extractors of the document,
+which read it through their `line_index` property.
+
+How to use:
+    line_index = LineIndex(text)
+    header = line_index.first_with('Valor Líquido da Nota')
+    value_line = line_index.next_non_empty(header)
+    line_index.lines[value_line]
+"""
+
+from bisect import bisect_right
+
+
+class LineIndex:
+    """
+    Index of the lines of a text.
+
+    Attributes:
+        text: the indexed text.
+        lines: the text split in lines.
+        next_non_empty_lines: for each line, the number of the next non-empty line (or None).
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lines = text.splitlines()
+        self.next_non_empty_lines = self._build_next_non_empty_lines(self.lines)
+        self._keyword_lines = {}
+        self._scans = {}
+
+    @staticmethod
+    def _build_next_non_empty_lines(lines: list) -> list:
+        next_non_empty_lines = [None] * len(lines)
+        next_non_empty = None
+
+        for line_number in range(len(lines) - 1, -1, -1):
+            next_non_empty_lines[line_number] = next_non_empty
+            if lines[line_number].strip():
+                next_non_empty = line_number
+
+        return next_non_empty_lines
+
+    def __len__(self):
+        return len(self.lines)
+
+    def next_non_empty(self, line_number: int):
+        """
+        Returns the number of the first non-empty line after `line_number`, or None.
+        """
+        return self.next_non_empty_lines[line_number]
+
+    def index_keywords(self, keywords):
+        """
+        Finds, in a single pass, the lines containing each keyword not indexed yet.
+        """
+        keywords = [keyword for keyword in dict.fromkeys(keywords) if keyword not in self._keyword_lines]
+        if not keywords:
+            return
+
+        keyword_lines = {keyword: [] for keyword in keywords}
+        for line_number, line in enumerate(self.lines):
+            for keyword in keywords:
+                if keyword in line:
+                    keyword_lines[keyword].append(line_number)
+
+        self._keyword_lines.update(keyword_lines)
+
+    def lines_with(self, keyword: str) -> list:
+        """
+        Returns the numbers of the lines containing the keyword (indexed on first lookup).
+        """
+        if keyword not in self._keyword_lines:
+            self.index_keywords([keyword])
+        return self._keyword_lines[keyword]
+
+    def first_with(self, keyword: str, after: int = -1):
+        """
+        Returns the number of the first line after `after` containing the keyword, or None.
+        """
+        line_numbers = self.lines_with(keyword)
+        position = bisect_right(line_numbers, after)
+        return line_numbers[position] if position < len(line_numbers) else None
+
+    def scan(self, scanner):
+        """
+        Returns scanner.scan(self) (e.g. the LineHits of a LineScanner, the sections of a SectionSegmenter),
+        scanning the lines only on the first call.
+        """
+        if scanner not in self._scans:
+            self._scans[scanner] = scanner.scan(self)
+        return self._scans[scanner]
+
+
+def get_line_index(extractor) -> LineIndex:
+    """
+    Returns the line index of the text of an extractor.
+
+    When the extractor works on the text of its document, the index of the document is used,
+    so all the extractors of a document share it. Otherwise (e.g. a text set by hand),
+    a private index is kept on the extractor and rebuilt when its text changes.
+    """
+    text = getattr(extractor, 'text', None)
+    document = getattr(extractor, 'document', None)
+
+    if document is not None and (text is None or text is document.text):
+        return document.line_index
+
+    line_index = getattr(extractor, '_line_index', None)
+    if line_index is None or line_index.text is not text:
+        line_index = extractor._line_index = LineIndex(text)
+
+    return line_index
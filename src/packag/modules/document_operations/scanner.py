@@ -0,0 +1,109 @@
+r"""
+Scanner Module
+
+This module defines the LineScanner class, used by the PDF extractors to find all the lines they need in a single pass.
+
+Why does it exist?
+Each field extractor used to split the text and walk all its lines looking for its own header,
+so a document with ~25 fields was walked ~25 times (some fields walked it twice).
+A LineScanner receives all the patterns of an extractor, walks the lines once,
+and records the line numbers where each pattern matched.
+The field extractors then read those line numbers instead of walking the text again.
+
+How to use:
+    SCANNER = LineScanner({
+        'pis_header': 'PIS',                              # substring
+        'codigo': re.compile(r'\d{2}\.\d{2}'),            # compiled regex (search)
+        'inss_header': lambda line: 'INSS' in line.upper(),  # any predicate
+    })
+    hits = SCANNER.scan(line_index)  # or line_index.scan(SCANNER), which scans a document only once
+    hits['pis_header']  # [3, 27]: numbers of the lines that contain 'PIS'
+"""
+
+import re
+
+from bisect import bisect_right
+
+from packag.modules.document_operations.line_index import LineIndex
+
+
+class LineScanner:
+    """
+    Matches a set of named patterns against every line of a document in a single pass.
+
+    A pattern can be:
+        * a str: the line must contain it.
+        * a compiled regex: regex.search(line) must match.
+        * a callable: callable(line) must be truthy.
+    """
+
+    def __init__(self, patterns: dict):
+        if not isinstance(patterns, dict):
+            raise ValueError('patterns must be a dict of pattern name -> pattern')
+
+        self.patterns = patterns
+        self._predicates = [(name, self._get_predicate(pattern)) for name, pattern in patterns.items()]
+
+    def _get_predicate(self, pattern):
+        if isinstance(pattern, str):
+            return lambda line: pattern in line
+
+        if isinstance(pattern, re.Pattern):
+            return pattern.search
+
+        if callable(pattern):
+            return pattern
+
+        raise ValueError(f'pattern must be a str, a compiled regex or a callable, got {type(pattern)} instead')
+
+    def scan(self, line_index: LineIndex) -> 'LineHits':
+        """
+        Walks the lines once and returns the line numbers where each pattern matched.
+        """
+        if not isinstance(line_index, LineIndex):
+            raise ValueError(f'line_index must be a LineIndex, got {type(line_index)} instead')
+
+        hits = {name: [] for name in self.patterns}
+        predicates = self._predicates
+
+        for line_number, line in enumerate(line_index.lines):
+            for name, predicate in predicates:
+                if predicate(line):
+                    hits[name].append(line_number)
+
+        return LineHits(line_index, hits)
+
+
+class LineHits:
+    """
+    Result of a LineScanner: the line index of the document and, for each pattern, the numbers of the lines it matched.
+    """
+
+    def __init__(self, line_index: LineIndex, hits: dict):
+        self.line_index = line_index
+        self.lines = line_index.lines
+        self.hits = hits
+
+    def __getitem__(self, name) -> list:
+        return self.hits[name]
+
+    def first(self, name):
+        """
+        Returns the number of the first line matched by the pattern, or None.
+        """
+        line_numbers = self.hits[name]
+        return line_numbers[0] if line_numbers else None
+
+    def first_after(self, name, line_number):
+        """
+        Returns the number of the first line after `line_number` matched by the pattern, or None.
+        """
+        line_numbers = self.hits[name]
+        position = bisect_right(line_numbers, line_number)
+        return line_numbers[position] if position < len(line_numbers) else None
+
+    def next_non_empty(self, line_number):
+        """
+        Returns the number of the first non-empty line after `line_number`, or None.
+        """
+        return self.line_index.next_non_empty(line_number)
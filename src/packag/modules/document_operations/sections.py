@@ -0,0 +1,108 @@
+"""
+Sections Module
+
+This module splits the lines of a document into named sections (e.g. PRESTADOR, TOMADOR, SERVIÇO, VALORES).
+
+Why does it exist?
+A NFS-e has the same labels in several blocks: "CPF/CNPJ:", "Endereço:" and "UF:" appear for the Prestador
+and again for the Tomador. Searching the whole text for them makes a field of one block leak into the other,
+and walking the whole text for every field repeats the same work.
+The SectionSegmenter finds the heading of each block once and gives each block its line offsets,
+so a field extractor only searches the few lines of its own section.
+
+How it works:
+Each section starts at the first line containing its heading and ends right before the next heading
+(or at the end of the document). Sections whose heading is not found are left out.
+
+How to use:
+    sections = line_index.scan(PENEDO_SECTIONS)  # segmented once per document
+    tomador = sections.get('TOMADOR')
+    if tomador is not None:
+        match = tomador.search(r'CPF/CNPJ:\\s*(\\S+)')
+"""
+
+import re
+
+from functools import cached_property
+
+from packag.modules.document_operations.line_index import LineIndex
+
+
+class Section:
+    """
+    A block of lines of a document.
+
+    Attributes:
+        name: name of the section (e.g. 'TOMADOR').
+        start: number of the heading line of the section.
+        end: number of the line right after the section.
+    """
+
+    def __init__(self, name: str, line_index: LineIndex, start: int, end: int):
+        self.name = name
+        self.line_index = line_index
+        self.start = start
+        self.end = end
+
+    @property
+    def lines(self) -> list:
+        return self.line_index.lines[self.start:self.end]
+
+    @cached_property
+    def text(self) -> str:
+        return '\n'.join(self.lines)
+
+    def search(self, pattern):
+        """
+        Searches the pattern in the text of the section. Returns the match or None.
+        """
+        return re.search(pattern, self.text)
+
+    def __repr__(self):
+        return f'Section(name={self.name!r}, start={self.start}, end={self.end})'
+
+
+class SectionSegmenter:
+    """
+    Splits the lines of a document into sections, given the heading of each section.
+
+    Args:
+        headings (dict): section name -> text of its heading line.
+    """
+
+    def __init__(self, headings: dict):
+        if not isinstance(headings, dict) or not headings:
+            raise ValueError('headings must be a non-empty dict of section name -> heading')
+
+        self.headings = headings
+
+    def scan(self, line_index: LineIndex) -> dict:
+        """
+        Returns the sections found in the document, by name.
+        """
+        if not isinstance(line_index, LineIndex):
+            raise ValueError(f'line_index must be a LineIndex, got {type(line_index)} instead')
+
+        line_index.index_keywords(self.headings.values())
+
+        starts = []
+        for name, heading in self.headings.items():
+            start = line_index.first_with(heading)
+            if start is not None:
+                starts.append((start, name))
+        starts.sort()
+
+        sections = {}
+        for position, (start, name) in enumerate(starts):
+            end = starts[position + 1][0] if position + 1 < len(starts) else len(line_index)
+            sections[name] = Section(name, line_index, start, end)
+
+        return sections
+
+
+PENEDO_SECTIONS = SectionSegmenter({
+    'PRESTADOR': 'PRESTADOR DE SERVIÇOS',
+    'TOMADOR': 'TOMADOR DE SERVIÇOS',
+    'SERVICO': 'DISCRIMINAÇÃO DOS SERVIÇOS',
+    'VALORES': 'VALOR TOTAL DA NOTA',
+})
@@ -0,0 +1,133 @@
+"""
+XML Index Module
+
+This module defines the XmlIndex class, an index of the elements of a XML document by tag.
+
+Why does it exist?
+The XML extractors (Maceió, Delmiro) read each field with root.find('.//ns2:InfNfse/ns2:Numero', namespaces).
+Every './/' search walks the whole tree, so a document was walked ~25 times by the Nota extractor
+and again by the Prestador and Tomador extractors.
+The XmlIndex walks the tree once, keeping the elements of each tag, the parent and the position of every element,
+and answers the './/a/b/c' lookups from that index (each answer is kept, so a repeated lookup is a dict read).
+
+How it works:
+For a lookup './/a/b/c', the candidates are the elements with tag c whose parent is a b whose parent is an a.
+The candidate returned is the one ElementTree.find would return (same order),
+so the outputs are the same as root.find. Any path the index does not understand
+(predicates, wildcards, '..', absolute or relative paths...) is delegated to root.find.
+
+How to use:
+    xml_index = XmlIndex(root)
+    xml_index.find_text('.//ns2:InfNfse/ns2:Numero', {'ns2': 'http://www.giss.com.br/tipos-v2_04.xsd'})
+"""
+
+import re
+
+from functools import lru_cache
+
+STEP_PATTERN = re.compile(r'^(?:([\w.-]+):)?([\w.-]+)$')
+
+
+@lru_cache(maxsize=1024)
+def _parse_path(path: str, namespace_items: tuple):
+    """
+    Returns the qualified tags of a './/a/b' path, or None if the index cannot answer it.
+    """
+    if not path.startswith('.//'):
+        return None
+
+    namespaces = dict(namespace_items)
+    tags = []
+
+    for step in path[3:].split('/'):
+        match = STEP_PATTERN.match(step)
+        if match is None:
+            return None
+
+        prefix, tag = match.groups()
+        if prefix is not None:
+            if prefix not in namespaces:
+                return None
+            tags.append(f'{{{namespaces[prefix]}}}{tag}')
+        elif namespaces.get(''):
+            tags.append(f'{{{namespaces[""]}}}{tag}')
+        else:
+            tags.append(tag)
+
+    return tuple(tags)
+
+
+class XmlIndex:
+    """
+    Index of the elements of a XML tree by tag, built in a single walk of the tree.
+
+    Attributes:
+        root: the root element of the tree.
+        elements_by_tag: qualified tag -> elements with that tag, in document order.
+        parents: element -> its parent element.
+        positions: element -> its position in document order.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.elements_by_tag = {}
+        self.parents = {}
+        self.positions = {}
+        self._found = {}
+
+        for position, element in enumerate(root.iter()):
+            self.positions[element] = position
+            self.elements_by_tag.setdefault(element.tag, []).append(element)
+            self.parents.update(dict.fromkeys(element, element))
+
+    def find(self, path: str, namespaces=None):
+        """
+        Same as root.find(path, namespaces), reading the index for './/a/b' paths.
+        """
+        suffix = _parse_path(path, tuple(namespaces.items()) if namespaces else ())
+        if suffix is None:
+            return self.root.find(path, namespaces)
+
+        if suffix not in self._found:
+            self._found[suffix] = self._find_suffix(suffix)
+
+        return self._found[suffix]
+
+    def _get_key(self, element, suffix: tuple):
+        """
+        Returns the positions of the elements matching the suffix, from its first step to the element,
+        or None if the ancestors of the element do not match the suffix.
+        """
+        key = [self.positions[element]]
+
+        for tag in reversed(suffix[:-1]):
+            element = self.parents.get(element)
+            if element is None or element.tag != tag:
+                return None
+            key.append(self.positions[element])
+
+        # './/' only looks at the descendants of the root
+        if element is self.root:
+            return None
+
+        key.reverse()
+        return key
+
+    def _find_suffix(self, suffix: tuple):
+        first_key, first_element = None, None
+
+        # ElementTree walks the first step in document order, then the children of each step in order,
+        # so the first element found is the one with the smallest positions along the suffix
+        for element in self.elements_by_tag.get(suffix[-1], ()):
+            key = self._get_key(element, suffix)
+            if key is not None and (first_key is None or key < first_key):
+                first_key, first_element = key, element
+
+        return first_element
+
+    def find_text(self, path: str, namespaces=None):
+        """
+        Returns the text of the element found by the path, or None.
+        """
+        element = self.find(path, namespaces)
+        return element.text if element is not None else None
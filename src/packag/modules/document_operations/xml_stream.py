@@ -0,0 +1,87 @@
+"""
+XML Stream Module
+
+This module reads the invoices of a lot XML file (many NFS-e in one file) one at a time.
+
+Why does it exist?
+The municipal portals (GISS for Maceió, Delmiro's system) export the invoices of a month as one large XML
+with thousands of CompNfse elements. Parsing it with ET.fromstring keeps the whole tree in memory
+and gives a single root, so each file could only yield one nota.
+Here the file is parsed with ET.iterparse: each invoice element is yielded as soon as it is complete,
+then cleared and detached from its parent, so the memory stays flat whatever the size of the file.
+
+How to use:
+    for document in iter_element_documents(Path('lote.xml'), 'CompNfse'):
+        nota = MaceioFileToNotaExtractor(file, document=document).run(file)
+
+The yielded elements are cleared when the iteration resumes: use them (or copy them) before asking for the next one.
+"""
+
+import xml.etree.ElementTree as ET
+
+from functools import cached_property
+from pathlib import Path
+
+from packag.modules.document_operations.xml_index import XmlIndex
+from packag.modules.utils.buffers import as_stream, is_in_memory
+
+
+class ElementDocument:
+    """
+    A single invoice element of a lot file, seen as a parsed document by the XML extractors
+    (they read its `root` and `xml_index`, like a ParsedDocument).
+    """
+
+    def __init__(self, root):
+        self.root = root
+
+    @cached_property
+    def xml_index(self) -> XmlIndex:
+        return XmlIndex(self.root)
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def iter_elements(source, tag: str):
+    """
+    Yields the elements of the XML file with the tag, one at a time, clearing each one after it is used.
+
+    Args:
+        source: path, binary file object or content (bytes, bytearray, memoryview, BytesIO, mmap) of the XML file.
+        tag: qualified tag ('{namespace}CompNfse') or local name ('CompNfse') of the elements.
+    """
+    if isinstance(source, Path) and not source.is_file():
+        raise FileNotFoundError(f'File {source} not found')
+
+    if is_in_memory(source):
+        source = as_stream(source)
+
+    match_local_name = not tag.startswith('{')
+    parents = []
+
+    for event, element in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            parents.append(element)
+            continue
+
+        parents.pop()
+        element_tag = _local_name(element.tag) if match_local_name else element.tag
+        if element_tag != tag:
+            continue
+
+        yield element
+
+        # release the invoice: its content and its reference in the parent
+        element.clear()
+        if parents:
+            parents[-1].remove(element)
+
+
+def iter_element_documents(source, tag: str):
+    """
+    Yields an ElementDocument for each element of the XML file with the tag (see iter_elements).
+    """
+    for element in iter_elements(source, tag):
+        yield ElementDocument(element)
@@ -1 +1,2 @@
-from .functions import extract_text_from_pdf
\ No newline at end of file
+from .functions import extract_text_from_pdf, iter_pdf_page_texts
+from .cache import PdfTextCache
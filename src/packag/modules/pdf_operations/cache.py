@@ -0,0 +1,176 @@
+"""
+PDF Text Cache Module
+
+This module defines the PdfTextCache class, a persistent, content-addressed cache for the text extracted from PDFs.
+
+How it works:
+The key of an entry is a hash of:
+    * the content of the PDF (so a renamed or copied file still hits the cache);
+    * the pdfplumber version (a new version may extract a different text);
+    * the extraction parameters.
+Each entry is a text file inside the cache directory.
+Entries are written to a temporary file and then renamed, so many workers can share the same directory.
+When the total size of the entries is bigger than the byte budget, the least recently used entries are removed.
+The cache keeps a running total of the size of its entries, so a write scans the directory only
+when the total is over the budget, or every EVICT_SCAN_EVERY writes (to count the entries written by the other workers).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from pathlib import Path
+from typing import Optional
+
+import pdfplumber
+
+from packag.modules.utils.buffers import as_buffer, is_in_memory
+
+CACHE_FORMAT_VERSION = 1
+CACHE_ENTRY_SUFFIX = '.txt'
+
+# the directory is scanned again every EVICT_SCAN_EVERY writes, even under the budget
+EVICT_SCAN_EVERY = 256
+
+
+class PdfTextCache:
+    """
+    On-disk cache of extracted PDF text, bounded by `max_bytes`.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        if not isinstance(cache_dir, Path):
+            raise ValueError('cache_dir must be a Path object')
+
+        if max_bytes <= 0:
+            raise ValueError('max_bytes must be a positive integer')
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+        # total size of the entries, known after the first scan of the directory
+        self._total_bytes = None
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get_key(self, pdf_path: Path, **parameters) -> str:
+        """
+        Returns the key of a PDF: a hash of its content, of the pdfplumber version and of the extraction parameters.
+        `pdf_path` is the path of the PDF, or its content (bytes, bytearray, memoryview, BytesIO or mmap).
+        """
+        if is_in_memory(pdf_path):
+            content_hash = hashlib.sha256(as_buffer(pdf_path)).hexdigest()
+        else:
+            with open(pdf_path, 'rb') as pdf_file:
+                content_hash = hashlib.file_digest(pdf_file, 'sha256').hexdigest()
+
+        key_data = json.dumps(
+            {
+                'content': content_hash,
+                'pdfplumber': pdfplumber.__version__,
+                'format': CACHE_FORMAT_VERSION,
+                'parameters': parameters,
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+        return hashlib.sha256(key_data.encode('utf-8')).hexdigest()
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}{CACHE_ENTRY_SUFFIX}'
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns the cached text of the key, or None if it is not cached.
+        A hit marks the entry as recently used.
+        """
+        entry_path = self._get_entry_path(key)
+
+        try:
+            text = entry_path.read_text(encoding='utf-8')
+            os.utime(entry_path)
+        except FileNotFoundError:
+            # the entry does not exist or was evicted by another worker
+            return None
+
+        return text
+
+    def set(self, key: str, text: str):
+        """
+        Stores the text of the key and evicts old entries if the cache is bigger than its byte budget.
+        """
+        entry_path = self._get_entry_path(key)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+
+        try:
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as temporary_file:
+                temporary_file.write(text)
+                temporary_file.flush()
+                size = os.fstat(file_descriptor).st_size
+
+            try:
+                replaced_size = entry_path.stat().st_size
+            except FileNotFoundError:
+                replaced_size = 0
+
+            os.replace(temporary_path, entry_path)
+        except BaseException:
+            Path(temporary_path).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._writes += 1
+            if self._total_bytes is not None:
+                self._total_bytes += size - replaced_size
+
+            should_evict = self._total_bytes is None \
+                or self._total_bytes > self.max_bytes \
+                or self._writes % EVICT_SCAN_EVERY == 0
+
+        if should_evict:
+            self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache fits in its byte budget.
+        """
+        entries = []
+        total_size = 0
+
+        for entry_path in self.cache_dir.glob(f'*{CACHE_ENTRY_SUFFIX}'):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+            total_size += stat.st_size
+
+        if total_size <= self.max_bytes:
+            with self._lock:
+                self._total_bytes = total_size
+            return
+
+        entries.sort(key=lambda entry: entry[0])
+
+        for _, size, entry_path in entries:
+            if total_size <= self.max_bytes:
+                break
+
+            entry_path.unlink(missing_ok=True)
+            total_size -= size
+
+        with self._lock:
+            self._total_bytes = total_size
+
+    def clear(self):
+        for entry_path in self.cache_dir.glob(f'*{CACHE_ENTRY_SUFFIX}'):
+            entry_path.unlink(missing_ok=True)
+
+        with self._lock:
+            self._total_bytes = 0
@@ -1,40 +1,206 @@
+import math
 import pdfplumber
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import Optional
 
-def extract_text_from_pdf(pdf_path: Path):
+from packag.modules.config import PDF_PAGE_WORKERS, PDF_TEXT_CACHE_DIR, PDF_TEXT_CACHE_MAX_BYTES
+
+from packag.modules.utils.buffers import as_buffer, as_stream, is_in_memory, read_head
+
+from .cache import PdfTextCache
+
+default_cache = PdfTextCache(PDF_TEXT_CACHE_DIR, PDF_TEXT_CACHE_MAX_BYTES) if PDF_TEXT_CACHE_DIR else None
+
+# the PDF header must be in the first 1024 bytes of the file
+PDF_HEADER = b'%PDF-'
+PDF_HEADER_MAX_OFFSET = 1024
+
+# below this number of pages, starting the worker processes costs more than extracting the pages one after another
+PAGE_PARALLEL_MIN_PAGES = 16
+
+def _validate_pdf_path(pdf_path: Path):
+    if is_in_memory(pdf_path):
+        if PDF_HEADER not in read_head(pdf_path, PDF_HEADER_MAX_OFFSET):
+            raise ValueError('pdf_path content must be a PDF document')
+        return
+    
+    if not isinstance(pdf_path, Path):
+        raise ValueError('pdf_path must be a Path object or the content of a PDF (bytes, bytearray, memoryview, BytesIO or mmap)')
+    
+    if not pdf_path.exists():
+        raise FileNotFoundError(f'File {pdf_path} not found')
+    
+    if not pdf_path.is_file() or not pdf_path.suffix == '.pdf':
+        raise ValueError('pdf_path must be a file and must have a .pdf extension')
+
+def _validate_page_selection(pages, max_pages):
+    if pages is not None:
+        if not isinstance(pages, (list, tuple, range)) or not pages:
+            raise ValueError('pages must be a non-empty list of page numbers')
+        if not all(isinstance(page, int) and page >= 1 for page in pages):
+            raise ValueError('pages must contain only page numbers starting at 1')
+    
+    if max_pages is not None and (not isinstance(max_pages, int) or max_pages < 1):
+        raise ValueError('max_pages must be a positive integer')
+
+def _validate_page_workers(page_workers):
+    if not isinstance(page_workers, int) or page_workers < 1:
+        raise ValueError('page_workers must be a positive integer')
+
+def _get_page_numbers(pages, max_pages):
+    """
+    Returns the numbers of the pages pdfplumber must load, or None for all the pages.
+    """
+    if pages is not None:
+        return sorted(set(pages))[:max_pages]
+    
+    if max_pages is not None:
+        return list(range(1, max_pages + 1))
+    
+    return None
+
+def iter_pdf_page_texts(pdf_path: Path, pages=None, max_pages: Optional[int] = None):
+    """
+    Yields the text of each selected page of a PDF file, one page at a time.
+    
+    Only the selected pages are loaded and extracted, so the pages nobody reads
+    (attachments, scanned images...) cost nothing, and a caller can stop early.
+    The caches of each page are released as soon as its text is extracted.
+
+    Args:
+        pdf_path (Path | bytes | bytearray | memoryview | BytesIO | mmap): The path to the PDF file, or its content.
+        pages (list[int], optional): The numbers of the pages to read, starting at 1. Defaults to all the pages.
+        max_pages (int, optional): The maximum number of pages to read. Defaults to no limit.
+
+    Raises:
+        ValueError: If `pdf_path` is not a PDF file or PDF content, or if `pages` or `max_pages` are not valid.
+        FileNotFoundError: If the file at `pdf_path` does not exist.
+    """
+    _validate_pdf_path(pdf_path)
+    _validate_page_selection(pages, max_pages)
+    
+    with _open_pdf(pdf_path, pages=_get_page_numbers(pages, max_pages)) as pdf:
+        for page in pdf.pages:
+            try:
+                yield page.extract_text()
+            finally:
+                # pdfplumber keeps the chars, layout objects and text map of a page until it is closed,
+                # so a long-running worker would keep the pages of every document it extracted
+                page.close()
+
+def _open_pdf(pdf_path, pages=None):
+    # pdfplumber reads a path itself, and the content of an in-memory PDF through a file object
+    source = as_stream(pdf_path) if is_in_memory(pdf_path) else pdf_path
+    
+    return pdfplumber.open(source, pages=pages)
+
+def _count_pages(pdf_path) -> int:
+    with _open_pdf(pdf_path) as pdf:
+        return len(pdf.pages)
+
+def _split_pages(page_numbers: list, parts: int) -> list:
+    """
+    Splits the page numbers in at most `parts` ranges of consecutive pages, of the same size (but the last one).
+    """
+    size = math.ceil(len(page_numbers) / parts)
+    
+    return [page_numbers[start:start + size] for start in range(0, len(page_numbers), size)]
+
+def _extract_pages_text(pdf_path, page_numbers: list) -> str:
+    """
+    Runs on a worker process: opens the PDF and extracts the text of its range of pages.
+    """
+    return ''.join(iter_pdf_page_texts(pdf_path, pages=page_numbers))
+
+def _extract_text(pdf_path, pages, max_pages, page_workers: int) -> str:
+    """
+    Extracts the text of the selected pages, on `page_workers` processes if the PDF has enough pages.
+    Each process extracts a range of consecutive pages, and the texts of the ranges are joined in page order.
+    """
+    selected_pages = _get_page_numbers(pages, max_pages)
+    
+    # a selection too short to be split is extracted serially, without opening the PDF to count its pages
+    if page_workers > 1 and (selected_pages is None or len(selected_pages) >= PAGE_PARALLEL_MIN_PAGES):
+        page_count = _count_pages(pdf_path)
+        page_numbers = [
+            page_number for page_number in (selected_pages or range(1, page_count + 1))
+            if page_number <= page_count
+        ]
+        
+        if len(page_numbers) >= PAGE_PARALLEL_MIN_PAGES:
+            if is_in_memory(pdf_path):
+                # a BytesIO or a mmap cannot be sent to another process; bytes are sent as they are
+                pdf_path = bytes(as_buffer(pdf_path))
+            
+            page_ranges = _split_pages(page_numbers, page_workers)
+            
+            with ProcessPoolExecutor(max_workers=len(page_ranges)) as executor:
+                # map yields the results in the order of the ranges, whatever the order they finish
+                return ''.join(executor.map(_extract_pages_text, repeat(pdf_path), page_ranges))
+    
+    return ''.join(iter_pdf_page_texts(pdf_path, pages=pages, max_pages=max_pages))
+
+def extract_text_from_pdf(
+    pdf_path: Path,
+    cache: Optional[PdfTextCache] = None,
+    pages=None,
+    max_pages: Optional[int] = None,
+    page_workers: Optional[int] = None,
+):
     """
     Extracts and returns the text content from a PDF file.
 
     This function validates the input path to ensure it is a valid Path object
     pointing to an existing PDF file. It then opens the PDF using `pdfplumber`
-    and extracts the text from all pages, concatenating it into a single string.
+    and extracts the text from the selected pages (all of them by default), concatenating it into a single string.
+    
+    The content of a PDF received in memory (bytes, bytearray, memoryview, BytesIO or mmap)
+    can be given instead of a path: it is read directly, without a temporary file.
+    
+    If a cache is given (or configured with PDF_TEXT_CACHE_DIR), the text of a PDF
+    whose content was already extracted (with the same pages) is read from the cache instead.
+    
+    With more than one page worker, the pages of a long PDF (at least PAGE_PARALLEL_MIN_PAGES pages)
+    are split in ranges extracted on a pool of processes, and the text is reassembled in page order.
 
     Args:
-        pdf_path (Path): The path to the PDF file to be read.
+        pdf_path (Path | bytes | bytearray | memoryview | BytesIO | mmap): The path to the PDF file, or its content.
+        cache (PdfTextCache, optional): The cache to be used. Defaults to the configured cache.
+        pages (list[int], optional): The numbers of the pages to read, starting at 1. Defaults to all the pages.
+        max_pages (int, optional): The maximum number of pages to read. Defaults to no limit.
+        page_workers (int, optional): The number of processes extracting the pages. Defaults to PDF_PAGE_WORKERS.
 
     Raises:
-        ValueError: If `pdf_path` is not a Path object, is not a file, or does not have a '.pdf' extension.
+        ValueError: If `pdf_path` is not a Path object, is not a file, or does not have a '.pdf' extension,
+            if the content given is not a PDF, or if `pages`, `max_pages` or `page_workers` are not valid.
         FileNotFoundError: If the file at `pdf_path` does not exist.
         PermissionError: If the file cannot be accessed due to insufficient permissions.
     Returns:
-        str: The concatenated text extracted from all pages of the PDF.
+        str: The concatenated text extracted from the selected pages of the PDF.
     """
-    if not isinstance(pdf_path, Path):
-        raise ValueError('pdf_path must be a Path object')
+    page_workers = PDF_PAGE_WORKERS if page_workers is None else page_workers
     
-    if not pdf_path.exists():
-        raise FileNotFoundError(f'File {pdf_path} not found')
+    _validate_pdf_path(pdf_path)
+    _validate_page_selection(pages, max_pages)
+    _validate_page_workers(page_workers)
     
-    if not pdf_path.is_file() or not pdf_path.suffix == '.pdf':
-        raise ValueError('pdf_path must be a file and must have a .pdf extension')
+    cache = cache or default_cache
     
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            text = ''
-            for page in pdf.pages:
-                text += page.extract_text()
+    if cache is not None:
+        # the page selection is part of the key only when it is given, so the keys of full texts do not change
+        parameters = {name: value for name, value in (('pages', pages), ('max_pages', max_pages)) if value is not None}
+        key = cache.get_key(pdf_path, **parameters)
+        text = cache.get(key)
+        
+        if text is not None:
             return text
-    except PermissionError as e: # pragma: no cover
-        raise 
-    
\ No newline at end of file
+    
+    text = _extract_text(pdf_path, pages, max_pages, page_workers)
+    
+    if cache is not None:
+        cache.set(key, text)
+    
+    return text
@@ -1,5 +1,7 @@
 from .operation import Operation
 from .pipeline import Pipeline
+from .dagPipeline import DagPipeline
 from .task import Task
+from .batch import PipelineResult
 
-__all__ = ['Pipeline', 'Task', 'Operation']
\ No newline at end of file
+__all__ = ['Pipeline', 'DagPipeline', 'Task', 'Operation', 'PipelineResult']
\ No newline at end of file
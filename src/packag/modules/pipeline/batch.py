@@ -0,0 +1,275 @@
+"""
+Batch Module
+
+This module defines the helpers used by Pipeline.run_many and Pipeline.iter_many to run a pipeline over many inputs.
+
+How it works:
+Each input is run by the pipeline run method, on one of the backends:
+    * serial: in the current thread, one input after the other.
+    * thread: on a pool of threads (for pipelines that wait on I/O).
+    * process: on a pool of processes (for CPU-bound pipelines, like PDF extraction).
+       The pipeline is sent once to each worker process, so it must be picklable
+       (its class, tasks and operation classes must be defined at module level).
+
+A failing input does not abort the batch: its exception (usually a PipelineError) is kept on its PipelineResult.
+If a worker process dies (the pool is broken), its inputs fail with the BrokenProcessPool error
+and the next inputs run on a new pool.
+The inputs are consumed lazily and the number of inputs in flight is bounded (see iter_map),
+so a batch can be a generator over a huge number of files.
+
+On the process backend, the workers can be recycled (see iter_map): the memory a long-running worker
+keeps (caches of the parsing libraries, fragmented heap) is returned to the OS when it exits.
+"""
+
+import os
+import resource
+
+from concurrent.futures import FIRST_COMPLETED, BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+
+BACKENDS = ('serial', 'thread', 'process')
+
+
+class PipelineResult:
+    """
+    Result of a single input of a batch.
+
+    Attributes:
+        index: position of the input in the batch.
+        input_data: the input given to the pipeline.
+        output_data: the result of the last task, or None if the pipeline failed.
+        error: the exception raised by the pipeline (a PipelineError for the failures of its tasks), or None if it succeeded.
+    """
+
+    def __init__(self, index, input_data, output_data=None, error=None):
+        self.index = index
+        self.input_data = input_data
+        self.output_data = output_data
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return f'PipelineResult(index={self.index}, ok={self.ok})'
+
+
+def run_one(pipeline, index, input_data) -> PipelineResult:
+    try:
+        output_data = pipeline.run(input_data)
+    except Exception as e:
+        # an unexpected error of an operation must not abort the batch either
+        return PipelineResult(index, input_data, error=e)
+
+    return PipelineResult(index, input_data, output_data=output_data)
+
+
+# pipeline of the current worker process (see init_worker)
+_worker_pipeline = None
+
+def init_worker(pipeline):
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+def run_one_in_worker(index, input_data) -> PipelineResult:
+    return run_one(_worker_pipeline, index, input_data)
+
+def get_failed_result(index, input_data, error) -> PipelineResult:
+    return PipelineResult(index, input_data, error=error)
+
+
+def get_rss_mb() -> float:
+    """
+    Returns the resident memory of the current process, in MB
+    (the peak resident memory where /proc is not available).
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+    except OSError: # pragma: no cover
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# resident memory of the current worker process when it started (see init_recycled_worker)
+_worker_start_rss_mb = None
+
+def init_recycled_worker(initializer, initargs):
+    global _worker_start_rss_mb
+    _worker_start_rss_mb = get_rss_mb()
+
+    if initializer is not None:
+        initializer(*initargs)
+
+def run_and_measure_memory(function, index, input_data):
+    """
+    Runs function(index, input_data) on a worker, returning its result and how much the worker grew since it started (MB).
+    """
+    return function(index, input_data), get_rss_mb() - _worker_start_rss_mb
+
+
+def validate_backend(backend: str, workers, max_in_flight=None):
+    if backend not in BACKENDS:
+        raise ValueError(f'backend must be one of {BACKENDS}, got {backend!r} instead')
+
+    if workers is not None and (not isinstance(workers, int) or workers < 1):
+        raise ValueError('workers must be a positive integer')
+
+    if max_in_flight is not None and (not isinstance(max_in_flight, int) or max_in_flight < 1):
+        raise ValueError('max_in_flight must be a positive integer')
+
+
+def validate_recycling(max_tasks_per_worker=None, max_worker_memory_mb=None):
+    if max_tasks_per_worker is not None and (not isinstance(max_tasks_per_worker, int) or max_tasks_per_worker < 1):
+        raise ValueError('max_tasks_per_worker must be a positive integer')
+
+    if max_worker_memory_mb is not None and (not isinstance(max_worker_memory_mb, (int, float)) or max_worker_memory_mb <= 0):
+        raise ValueError('max_worker_memory_mb must be a positive number')
+
+
+def iter_map(
+    function,
+    inputs,
+    workers=None,
+    backend='serial',
+    max_in_flight=None,
+    initializer=None,
+    initargs=(),
+    max_tasks_per_worker=None,
+    max_worker_memory_mb=None,
+    on_error=None,
+):
+    """
+    Calls function(index, input_data) for each input on the backend, yielding the results as soon as they finish.
+
+    If the call of an input fails on the pool (e.g. its worker process died), on_error(index, input_data, error)
+    is yielded as its result (the error is raised if on_error is None).
+    A broken pool is replaced by a new one for the next inputs.
+
+    The inputs are consumed lazily: at most `max_in_flight` inputs (by default, twice the number of workers)
+    are submitted and not yet yielded, so the memory used does not grow with the number of inputs.
+    On the process backend, the function must be picklable and `initializer(*initargs)` runs once on each worker.
+
+    On the process backend, the pool of workers is recycled (the running inputs finish on the old workers,
+    which then exit, and the next inputs go to new workers):
+        * after `max_tasks_per_worker` inputs per worker;
+        * as soon as a worker has grown by more than `max_worker_memory_mb` MB since it started.
+    """
+    validate_backend(backend, workers, max_in_flight)
+    validate_recycling(max_tasks_per_worker, max_worker_memory_mb)
+
+    if backend == 'serial':
+        for index, input_data in enumerate(inputs):
+            yield function(index, input_data)
+        return
+
+    workers = workers or os.cpu_count()
+    max_in_flight = max_in_flight or workers * 2
+
+    measure_memory = backend == 'process' and max_worker_memory_mb is not None
+    max_tasks_per_pool = max_tasks_per_worker * workers if backend == 'process' and max_tasks_per_worker else None
+
+    if measure_memory:
+        function = partial(run_and_measure_memory, function)
+        initializer, initargs = init_recycled_worker, (initializer, initargs)
+
+    def new_executor():
+        if backend == 'thread':
+            return ThreadPoolExecutor(max_workers=workers)
+
+        return ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+
+    executor = new_executor()
+    retired_executors = []
+    submitted_to_executor = 0
+    recycle = False
+    pending = set()
+    # index and input of the futures in pending
+    inputs_of = {}
+
+    def get_result(future):
+        nonlocal recycle
+
+        index, input_data = inputs_of.pop(future)
+
+        try:
+            result = future.result()
+        except Exception as e:
+            if isinstance(e, BrokenExecutor):
+                recycle = True
+
+            if on_error is None:
+                raise
+
+            return on_error(index, input_data, e)
+
+        if not measure_memory:
+            return result
+
+        result, worker_growth_mb = result
+        recycle = recycle or worker_growth_mb > max_worker_memory_mb
+        return result
+
+    def submit(index, input_data):
+        nonlocal executor, submitted_to_executor
+
+        try:
+            future = executor.submit(function, index, input_data)
+        except BrokenExecutor:
+            # the pool broke before its failed futures were collected
+            executor.shutdown(wait=False)
+            retired_executors.append(executor)
+            executor, submitted_to_executor = new_executor(), 0
+            future = executor.submit(function, index, input_data)
+
+        inputs_of[future] = (index, input_data)
+        pending.add(future)
+        submitted_to_executor += 1
+
+    try:
+        for index, input_data in enumerate(inputs):
+            if recycle or (max_tasks_per_pool and submitted_to_executor >= max_tasks_per_pool):
+                # the old workers finish their running inputs and exit; their futures are still in pending
+                executor.shutdown(wait=False)
+                retired_executors.append(executor)
+                executor, submitted_to_executor, recycle = new_executor(), 0, False
+
+            submit(index, input_data)
+
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    yield get_result(future)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                yield get_result(future)
+    finally:
+        # if the caller stops iterating, the inputs that did not start are not run
+        for retired_executor in retired_executors:
+            retired_executor.shutdown(wait=True, cancel_futures=True)
+
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_results(
+    pipeline, inputs, workers=None, backend='serial', max_in_flight=None, max_tasks_per_worker=None, max_worker_memory_mb=None,
+):
+    """
+    Runs the pipeline over the inputs, yielding each PipelineResult as soon as it finishes.
+    """
+    if backend == 'process':
+        return iter_map(
+            run_one_in_worker, inputs, workers=workers, backend=backend, max_in_flight=max_in_flight,
+            initializer=init_worker, initargs=(pipeline,),
+            max_tasks_per_worker=max_tasks_per_worker, max_worker_memory_mb=max_worker_memory_mb,
+            on_error=get_failed_result,
+        )
+
+    return iter_map(
+        partial(run_one, pipeline), inputs, workers=workers, backend=backend, max_in_flight=max_in_flight,
+        on_error=get_failed_result,
+    )
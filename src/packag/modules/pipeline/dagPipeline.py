@@ -0,0 +1,319 @@
+"""
+DAG Pipeline Module
+
+This module defines the DagPipeline class, a pipeline whose tasks form a directed acyclic graph (DAG)
+instead of a linear sequence.
+
+Why does it exist?
+Some tasks do not depend on each other. For example, extracting the Nota, the Prestador and the Tomador
+of a NFS-e are three independent tasks that only share the input file.
+On a linear Pipeline they run one after the other; on a DagPipeline they run concurrently,
+so the latency of a run is the latency of the slowest branch, not the sum of all of them.
+
+How it works:
+    * get_tasks returns a dict of task name -> Task.
+    * get_dependencies returns a dict of task name -> names of the tasks it depends on.
+      A task without dependencies receives the input data of the run.
+      A task with one dependency receives the result of that task.
+      A task with many dependencies receives a dict of dependency name -> result.
+    * The graph is validated once, on initialization (unknown tasks and cycles raise a PipelineError).
+    * On each run, a task is submitted to the executor as soon as all its dependencies finished.
+    * join receives the results of all the tasks and returns the result of the run.
+      By default, it returns a dict with the results of the tasks that no other task depends on.
+If any task fails, the pipeline stops and raises an exception (PipelineError).
+Inside an event loop, use the arun coroutine instead: the ready tasks are awaited concurrently (see Task.arun).
+A DagPipeline is a Pipeline, so it runs over many inputs with run_many and iter_many too.
+
+Backends:
+    * thread (the default): the tasks share the input data, so the extractors of a file share its parsed document
+      (see document_operations) and the file is parsed once per run.
+    * process: each task receives a pickled copy of its input in a worker process, so the tasks do not share
+      the parsed document: the file is parsed again by each task that reads it. Use it only for tasks that do
+      not read the same document, or whose work is CPU-bound enough to pay for the repeated parsing.
+    * serial: the tasks run one after the other, in the current thread.
+
+Example:
+
+class ExtractNfsePipeline(DagPipeline):
+    def get_tasks(self):
+        return {
+            'nota': ExtractDataTask(NotaExtractor),
+            'prestador': ExtractDataTask(PrestadorExtractor),
+            'tomador': ExtractDataTask(TomadorExtractor),
+        }
+
+with ExtractNfsePipeline(workers=3) as pipeline:
+    result = pipeline.run(file)  # {'nota': ..., 'prestador': ..., 'tomador': ...}
+"""
+
+import asyncio
+import os
+import threading
+
+from abc import abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from packag.modules.utils import get_logger
+
+from packag.modules.pipeline import batch
+from packag.modules.pipeline.pipeline import Pipeline
+from packag.modules.pipeline.task import Task
+
+from packag.modules.pipeline.utils.exceptions import (
+    PipelineError,
+    TaskError
+)
+pipeline_logger = get_logger('pipeline_logger')
+
+
+class DagPipeline(Pipeline):
+    """
+    Generic pipeline class that orchestrates a graph of tasks.
+    The executor of the tasks is created on the first concurrent run and shared by the runs of all the threads.
+    """
+
+    def __init__(self, workers=None, backend='thread'):
+        batch.validate_backend(backend, workers)
+
+        self.workers = workers
+        self.backend = backend
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+        tasks = self.get_tasks()
+        dependencies = self.get_dependencies()
+
+        if not isinstance(tasks, dict) or not all(isinstance(task, Task) for task in tasks.values()):
+            self._raise_pipeline_error('Tasks must be a dict of task name -> Task object. Please implement the get_tasks method correctly.')
+
+        if not isinstance(dependencies, dict):
+            self._raise_pipeline_error('Dependencies must be a dict of task name -> list of task names. Please implement the get_dependencies method correctly.')
+
+        for name, task_dependencies in dependencies.items():
+            if name not in tasks:
+                self._raise_pipeline_error(f'Dependencies declared for an unknown task: {name}')
+
+            for dependency in task_dependencies:
+                if dependency not in tasks:
+                    self._raise_pipeline_error(f'Task {name} depends on an unknown task: {dependency}')
+
+        # validates the operation class of each task once, instead of on every run
+        try:
+            for task in tasks.values():
+                task.compile()
+        except TaskError as e:
+            pipeline_logger.error(f'Error on pipeline: {e}')
+            raise PipelineError(message=e.message, pipeline_name=self.__class__.__name__, original_exception=e)
+
+        self.tasks = tasks
+        self.dependencies = {name: list(dependencies.get(name, [])) for name in tasks}
+        self.dependents = {name: [] for name in tasks}
+
+        for name, task_dependencies in self.dependencies.items():
+            for dependency in task_dependencies:
+                self.dependents[dependency].append(name)
+
+        self.order = self._get_topological_order()
+        self.sinks = [name for name in self.order if not self.dependents[name]]
+
+    def _raise_pipeline_error(self, message):
+        pipeline_logger.error(message)
+        raise PipelineError(message=message, pipeline_name=self.__class__.__name__)
+
+    def _get_topological_order(self):
+        """
+        Returns the task names in an order where every task comes after its dependencies.
+        Raises a PipelineError if the graph has a cycle.
+        """
+        remaining = {name: len(task_dependencies) for name, task_dependencies in self.dependencies.items()}
+        ready = [name for name, count in remaining.items() if count == 0]
+        order = []
+
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+
+            for dependent in self.dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(self.tasks):
+            cycle = sorted(name for name, count in remaining.items() if count > 0)
+            self._raise_pipeline_error(f'The task graph has a cycle between the tasks: {cycle}')
+
+        return order
+
+    @abstractmethod
+    def get_tasks(self): # pragma: no cover
+        pass
+
+    def get_dependencies(self):
+        """
+        Returns a dict of task name -> names of the tasks it depends on.
+        By default, no task depends on another one.
+        """
+        return {}
+
+    def join(self, results: dict):
+        """
+        Builds the result of the run from the results of all the tasks.
+        By default, it returns a dict with the results of the tasks that no other task depends on.
+        """
+        return {name: results[name] for name in self.sinks}
+
+    def _get_task_input(self, name, input_data, results):
+        task_dependencies = self.dependencies[name]
+
+        if not task_dependencies:
+            return input_data
+
+        if len(task_dependencies) == 1:
+            return results[task_dependencies[0]]
+
+        return {dependency: results[dependency] for dependency in task_dependencies}
+
+    def _get_executor(self):
+        # created under the lock, so the threads running the pipeline at the same time share a single executor
+        with self._executor_lock:
+            if self._executor is None:
+                workers = self.workers or min(len(self.tasks), os.cpu_count())
+
+                if self.backend == 'thread':
+                    self._executor = ThreadPoolExecutor(max_workers=workers)
+                else:
+                    self._executor = ProcessPoolExecutor(max_workers=workers)
+
+            return self._executor
+
+    def close(self):
+        """
+        Shuts down the executor of the pipeline, if it was created.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _run_serial(self, input_data):
+        results = {}
+
+        for name in self.order:
+            results[name] = self.tasks[name].run(self._get_task_input(name, input_data, results))
+
+        return results
+
+    def _run_concurrent(self, input_data):
+        executor = self._get_executor()
+
+        results = {}
+        remaining = {name: len(task_dependencies) for name, task_dependencies in self.dependencies.items()}
+        futures = {}
+
+        def submit(name):
+            task_input = self._get_task_input(name, input_data, results)
+            futures[executor.submit(self.tasks[name].run, task_input)] = name
+
+        for name in self.order:
+            if remaining[name] == 0:
+                submit(name)
+
+        try:
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = futures.pop(future)
+                    results[name] = future.result()
+
+                    for dependent in self.dependents[name]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            submit(dependent)
+        except TaskError:
+            for future in futures:
+                future.cancel()
+            raise
+
+        return results
+
+    def run(self, input_data=None):
+        """
+        Runs the graph of tasks starting with the input data.
+        Args:
+            input_data: The input data for the tasks without dependencies. Can be None
+        Returns:
+            The result of the join method.
+        """
+        pipeline_logger.info(f'Running pipeline: {self.__class__.__name__}')
+
+        try:
+            if self.backend == 'serial':
+                results = self._run_serial(input_data)
+            else:
+                results = self._run_concurrent(input_data)
+
+            pipeline_logger.info(f'Pipeline: {self.__class__.__name__} completed successfully')
+        except TaskError as e:
+            pipeline_logger.error(f'Error on pipeline: {e}')
+            raise PipelineError(message=e.message, pipeline_name=self.__class__.__name__, original_exception=e)
+
+        return self.join(results)
+
+    async def arun(self, input_data=None, executor=None):
+        """
+        Coroutine version of the run method, to be used inside an event loop.
+        Each task is awaited as soon as all its dependencies finished (see Task.arun),
+        so the independent tasks run concurrently on the executor.
+        Args:
+            input_data: The input data for the tasks without dependencies. Can be None
+            executor: The executor of the blocking operations. Defaults to the default executor of the loop.
+        Returns:
+            The result of the join method.
+        """
+        pipeline_logger.info(f'Running pipeline: {self.__class__.__name__}')
+
+        results = {}
+        running = {}
+
+        async def run_task(name):
+            for dependency in self.dependencies[name]:
+                await running[dependency]
+
+            task_input = self._get_task_input(name, input_data, results)
+            results[name] = await self.tasks[name].arun(task_input, executor=executor)
+
+        # in topological order, so the dependencies of a task are running before it awaits them
+        for name in self.order:
+            running[name] = asyncio.ensure_future(run_task(name))
+
+        try:
+            await asyncio.gather(*running.values())
+
+            pipeline_logger.info(f'Pipeline: {self.__class__.__name__} completed successfully')
+        except TaskError as e:
+            for task in running.values():
+                task.cancel()
+
+            pipeline_logger.error(f'Error on pipeline: {e}')
+            raise PipelineError(message=e.message, pipeline_name=self.__class__.__name__, original_exception=e)
+
+        return self.join(results)
+
+    def __getstate__(self):
+        # the executor and its lock are not sent to worker processes (e.g. by run_many)
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        del state['_executor_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._executor_lock = threading.Lock()
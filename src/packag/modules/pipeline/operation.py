@@ -2,6 +2,9 @@
 class Operation:
     """
     Abstract base class for all operations.
+    
+    An operation may also define an async arun(input_data) method.
+    If it does, Task.arun awaits it instead of running the run method on an executor.
     """
     
     def run(self, input_data=None):
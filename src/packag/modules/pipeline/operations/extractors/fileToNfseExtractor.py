@@ -0,0 +1,116 @@
+"""
+File To Nfse Extractor Module
+
+This module defines the FileToNfseExtractor operation, which extracts the Nota, Prestador and Tomador of a NFS-e
+in a single operation, returned as one dtoNfse.NfseExtractedInfo.
+
+Why does it exist?
+A full invoice record needed three operations (FileToNotaExtractor, FileToPrestadorExtractor, FileToTomadorExtractor),
+so three pipeline runs, three validations and three error wrappings for the same document.
+
+How it works:
+It runs the field extraction methods of the municipality's extractors (see registry.py), which share the same
+parsed document (see document.py). Each block is then built by the validate_output of its extractor,
+so the validation policy of the extractor (full, sampled or trusted, see validation.py) applies and counts it.
+The municipality is found by the MunicipalityRouter, unless the family is given.
+
+How to use:
+    nfse = FileToNfseExtractor(file).run(file)
+    nfse.nota.numero_nfs, nfse.prestador.cnpj, nfse.tomador.razao_social
+"""
+
+from packag.models import dtoFile
+from packag.models.business import dtoNfse
+from packag.modules.pipeline.operation import Operation
+from packag.modules.pipeline.operations.extractors.registry import ExtractorFamily
+from packag.modules.pipeline.operations.extractors.router import MunicipalityRouter
+from packag.modules.pipeline.utils.exceptions import OperationError, ValidationError
+from packag.modules.utils.logger import get_logger
+from packag.modules.utils.messages import OperationErrorMessage, ValidationErrorMessages
+
+logger_operation = get_logger('operation_logger')
+
+# the blocks of a NFS-e, in the order of the extractors of a family
+NFSE_BLOCKS = ('nota', 'prestador', 'tomador')
+
+
+class FileToNfseExtractor(Operation):
+    """
+    Extract the Nota, Prestador and Tomador of a NFS-e file.
+
+    This operation expects to receive a dtoFile Object as a input;
+    the output is a dtoNfse.NfseExtractedInfo object.
+
+    Args:
+        file: the NFS-e file.
+        family: the ExtractorFamily of the file's municipality. Defaults to the one found by the MunicipalityRouter.
+        document: an already parsed document (e.g. an invoice of a lot file, see xml_stream.py).
+    """
+
+    def __init__(self, file: dtoFile.File, family: ExtractorFamily = None, document=None):
+        self.file = file
+        self.family = family
+        self.document = document
+        self._extractors = None
+
+    def _get_extractors(self) -> tuple:
+        if self._extractors is None:
+            family = self.family or MunicipalityRouter().run(self.file)
+            extractor_kwargs = {'document': self.document} if self.document is not None else {}
+
+            # the extractors of the same file share its ParsedDocument, so the file is loaded once
+            self._extractors = tuple(extractor_cls(self.file, **extractor_kwargs) for extractor_cls in family.extractors)
+
+        return self._extractors
+
+    def _validate_input(self, input_data: dtoFile.File):
+        if not isinstance(input_data, dtoFile.File):
+            raise ValidationError(
+                ValidationErrorMessages(
+                    function_name='_validate_input',
+                    input_name='input_data',
+                    received_type=type(input_data),
+                    expected_type=dtoFile.File,
+                )
+            )
+
+        return input_data
+
+    def get_all_extracted_info(self) -> dict:
+        return {
+            block: extractor.get_all_extracted_info()
+            for block, extractor in zip(NFSE_BLOCKS, self._get_extractors())
+        }
+
+    def validate_output(self, output_data: dict):
+        """
+        Builds each block with the validate_output of its extractor (and its validation policy).
+        The blocks are models already: the NfseExtractedInfo does not validate them again.
+
+        Raises:
+            ValidationError: If a validated block is not valid.
+        """
+        blocks = {
+            block: extractor.validate_output(output_data[block])
+            for block, extractor in zip(NFSE_BLOCKS, self._get_extractors())
+        }
+
+        return dtoNfse.NfseExtractedInfo(**blocks)
+
+    def run(self, input_data: dtoFile.File):
+        try:
+            input_data = self._validate_input(input_data)
+
+            output_data = self.get_all_extracted_info()
+
+            return self.validate_output(output_data)
+        except (ValidationError, OperationError) as e:
+            message = OperationErrorMessage(
+                operation_name='FileToNfseExtractor',
+                original_exception=e
+            )
+            logger_operation.error(message.get_message())
+            raise OperationError(
+                message=message,
+                original_exception=e
+            ) from e
@@ -1,17 +1,23 @@
-from ...operation import Operation
+from ....operation import Operation
 
 from packag.models import dtoFile
 
 from packag.modules.utils.logger import get_logger
+from packag.modules.document_operations.line_index import LineIndex, get_line_index
 from packag.models.business import dtoNota
+from packag.models.business.partial import get_partial_model
+from packag.modules.pipeline.operations.extractors.validation import new_default_policy
 
-from ...utils.exceptions import ValidationError, OperationError
+from ....utils.exceptions import ValidationError, OperationError
 
 from abc import ABC, abstractmethod
 
 from pydantic import ValidationError as pydantic_ValidationError
 
-from packag.modules.utils.messages import ValidationErrorMessages
+from packag.modules.utils.messages import (
+    ValidationErrorMessages,
+    OperationErrorMessage
+)
 
 logger_operation = get_logger('operation_logger')
 
@@ -27,6 +33,26 @@ class FileToNotaExtractor(Operation, ABC):
     
     
     """
+    # number of PDF pages the extractor needs (None: all the pages); the other pages are never extracted
+    PDF_MAX_PAGES = None
+
+    # how the outputs are validated (full, sampled or trusted, see validation.py)
+    validation_policy = new_default_policy()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # each extractor samples and counts its own documents, unless it sets its own policy
+        if 'validation_policy' not in cls.__dict__:
+            cls.validation_policy = new_default_policy()
+
+    @property
+    def line_index(self) -> LineIndex:
+        """
+        Index of the lines of the text of the file, shared by every extractor of the same document.
+        Use it to look up header lines and the next non-empty line without walking the text again.
+        """
+        return get_line_index(self)
+
     def _validate_input(self, input_data: dtoFile):
         if not isinstance(input_data, dtoFile.File):
             raise ValidationError(
@@ -172,17 +198,60 @@ class FileToNotaExtractor(Operation, ABC):
         }
     
     
-    def get_all_extracted_info(self):
+    def _validate_fields(self, fields, extract_methods: dict):
+        # a str would be read as the fields of its characters
+        if isinstance(fields, str):
+            raise ValidationError(ValidationErrorMessages(
+                function_name='get_all_extracted_info',
+                input_name='fields',
+                received_type=type(fields),
+                expected_type='a list of field names',
+            ))
+        
+        unknown_fields = [field for field in fields if field not in extract_methods]
+        if unknown_fields:
+            raise ValidationError(ValidationErrorMessages(
+                function_name='get_all_extracted_info',
+                input_name='fields',
+                received_type=f'unknown fields {unknown_fields}',
+                expected_type=f'fields of {list(extract_methods)}',
+            ))
+        
+        return fields
+    
+    def get_all_extracted_info(self, fields=None):
+        """
+        Runs the extract method of each field, or only of the given fields (a projection).
+        
+        Raises:
+            ValidationError: If fields is a str, or has a field the extractor cannot extract.
+        """
+        extract_methods = self.get_extract_methods()
+        
+        if fields is None:
+            fields = extract_methods
+        else:
+            fields = self._validate_fields(fields, extract_methods)
+        
         info_dict = {}
         
-        for field, method in self.get_extract_methods().items():
-            info_dict[field] = method()
+        for field in fields:
+            info_dict[field] = extract_methods[field]()
         
         return info_dict
     
-    def validate_output(self, output_data: dict):
+    def get_output_model(self, fields=None):
+        """
+        Returns the model of the output: dtoNota.NotaExtractedInfo, or its partial model with only the given fields.
+        """
+        if fields is None:
+            return dtoNota.NotaExtractedInfo
+        
+        return get_partial_model(dtoNota.NotaExtractedInfo, tuple(fields))
+    
+    def validate_output(self, output_data: dict, fields=None):
         try:
-            return dtoNota.NotaExtractedInfo(**output_data)
+            return self.validation_policy.build(self.get_output_model(fields), output_data)
         except pydantic_ValidationError as e:
             
             validation_error = ValidationErrorMessages(
@@ -196,18 +265,38 @@ class FileToNotaExtractor(Operation, ABC):
             logger_operation.error(error_message)
             raise ValidationError(validation_error)
             
-    def run(self, input_data: dtoFile):
+    def run(self, input_data: dtoFile, fields=None):
+        """
+        Extracts and validates the Nota.
+        If `fields` is given, only those fields are extracted, and the output is a partial model with only those fields.
+        """
         try:
             input_data = self._validate_input(input_data)
             
-            output_data = self.get_all_extracted_info()
+            output_data = self.get_all_extracted_info(fields)
             
-            nota = self.validate_output(output_data)
+            nota = self.validate_output(output_data, fields)
             return nota
         except ValidationError as e:
-            raise OperationError(e)
+            message = OperationErrorMessage(
+                operation_name='FileToNotaExtractor',
+                original_exception=e
+            )
+            logger_operation.error(message.get_message())
+            raise OperationError(
+                message=message,
+                original_exception=e
+            ) from e
         except OperationError as e:
-            raise OperationError(e)
+            message = OperationErrorMessage(
+                operation_name='FileToNotaExtractor',
+                original_exception=e
+            )
+            logger_operation.error(message.get_message())
+            raise OperationError(
+                message=message,
+                original_exception=e
+            ) from e
         
         
 if __name__ == '__main__':
@@ -1,4 +1,5 @@
-from packag.modules.pdf_operations import extract_text_from_pdf
+from packag.modules.document_operations import get_document
+from packag.modules.document_operations.scanner import LineScanner
 from pathlib import Path
 import re
 from packag.modules.pipeline.operations.extractors.fileToNotaExtractor import FileToNotaExtractor
@@ -10,15 +11,62 @@ from typing import Type
 
 logger = get_logger('operations')
 
+NUMBER_PATTERN = re.compile(r'[\d.,]+')
+LEADING_NUMBER_PATTERN = re.compile(r'\s*([\d.,]+)')
+MULTIPLE_SPACES_PATTERN = re.compile(r'\s{2,}')
+CODIGO_VERIFICACAO_PATTERN = re.compile(r'([A-Z0-9]{4}\.[A-Z0-9]{4}\.[A-Z0-9]{4})', re.IGNORECASE)
+CODIGO_ATIVIDADE_PATTERN = re.compile(r'\s*(\d{2}\.\d{2})')
+NUMERO_NFS_PATTERN = re.compile(r'Retenção Simples\s*(\d+)')
+DATA_COMPETENCIA_PATTERN = re.compile(r'Data de Competência\s*:\s*(\d{2}/\d{2}/\d{4})')
+VALOR_TOTAL_PATTERN = re.compile(r'VALOR TOTAL DA NOTA = R\$ ([\d.,]+)')
+ESTADO_PATTERN = re.compile(r'-\s*([A-Z]{2})\s*-\s*BRASIL')
+OPTANTE_SIMPLES_PATTERN = re.compile(r'optante\s+.*simples\s+nacional', re.IGNORECASE)
+DATA_EMISSAO_PATTERN = re.compile(r'Data/Hora da emissão.*?(\d{2}/\d{2}/\d{4} - \d{2}:\d{2}:\d{2})', re.DOTALL)
+MUNICIPIO_PATTERN = re.compile(r'Cidade\s+([A-ZÇÃÕÁÉÍÓÚ ]+)\s*-\s*[A-Z]{2}')
+ISS_RETIDO_PATTERN = re.compile(r'ISS Retido:\s*SIM')
+RETENCOES_HEADER_KEYWORDS = ["INSS", "PIS", "Cofins", "C.S.L.L", "IRRF"]
+
+# every line the field extractors look for, found in a single pass over the text
+LINE_SCANNER = LineScanner({
+    'codigo_header': lambda line: "código de verificação" in line.lower(),
+    'codigo_value': CODIGO_VERIFICACAO_PATTERN,
+    'liquido_header': "Valor Líquido da Nota",
+    'starts_with_number': LEADING_NUMBER_PATTERN.match,
+    'has_number': re.compile(r'[\d.,]'),
+    'has_two_numbers': re.compile(r'[\d.,][^\d.,]+[\d.,]'),
+    'deducao_header': "Dedução(R$)",
+    'pis_header': "PIS",
+    'retencoes_header': lambda line: all(keyword in line.replace(" ", "") for keyword in RETENCOES_HEADER_KEYWORDS),
+    'inss_header': lambda line: "INSS" in line.replace(" ", "").upper(),
+    'inss_irrf_header': lambda line: "INSS" in line and "IRRF" in line,
+    'servico_header': "Valor do Serviço",
+    'discriminacao_header': "Discriminação do Serviço",
+    'discriminacao_end': lambda line: "Valor do Serviço" in line or "VALOR TOTAL DA NOTA" in line,
+    'codigo_atividade': CODIGO_ATIVIDADE_PATTERN.match,
+    'contrato': lambda line: line.strip().startswith("Contrato"),
+    'outras_header': "Outras Retenções(R$)",
+})
+
 class ArapiracaFileToNotaExtractor(FileToNotaExtractor):
+    # the NFS-e data is on the first page; the next pages are attachments
+    PDF_MAX_PAGES = 1
+
     def __init__(self, file: Type[File]):
         self.file = file
         self.file_path = file.file_path
         self.text = self.extract_data()
 
+    @property
+    def line_hits(self):
+        """
+        Lines matched by each pattern of LINE_SCANNER, scanned once per document.
+        """
+        return self.line_index.scan(LINE_SCANNER)
+
     def extract_data(self):
         try:
-            self.text = extract_text_from_pdf(self.file_path)
+            self.document = get_document(self.file, max_pages=self.PDF_MAX_PAGES)
+            self.text = self.document.text
             return self.text
         
         except FileNotFoundError as e:
@@ -50,226 +98,118 @@ class ArapiracaFileToNotaExtractor(FileToNotaExtractor):
         return match.group(1) if match else None
 
     def _extract_numero_nfs(self):
-        match = re.search(r'Retenção Simples\s*(\d+)', self.text)
+        match = NUMERO_NFS_PATTERN.search(self.text)
         if match:
             return match.group(1)
         return None
 
     def _extract_codigo_autenticidade(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "código de verificação" in line.lower():
-                # Search in next non-empty line
-                for j in range(i + 1, len(lines)):
-                    next_line = lines[j].strip()
-                    if next_line:
-                        match = re.search(r'([A-Z0-9]{4}\.[A-Z0-9]{4}\.[A-Z0-9]{4})', next_line, re.IGNORECASE)
-                        if match:
-                            return match.group(1)
-        return None
+        # first code found after the first "código de verificação" header
+        header = self.line_hits.first('codigo_header')
+        if header is None:
+            return None
+        line_number = self.line_hits.first_after('codigo_value', header)
+        if line_number is None:
+            return None
+        return CODIGO_VERIFICACAO_PATTERN.search(self.line_hits.lines[line_number]).group(1)
 
     def _extract_data_competencia(self):
-        match = re.search(r'Data de Competência\s*:\s*(\d{2}/\d{2}/\d{4})', self.text)
+        match = DATA_COMPETENCIA_PATTERN.search(self.text)
         if match:
             return match.group(1)
         return None
 
     def _extract_valor_liquido(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Valor Líquido da Nota" in line:  # match substring (ignore accents if OCR removed)
-                # Get next non-empty line
-                for j in range(i + 1, len(lines)):
-                    next_line = lines[j].strip()
-                    if next_line:
-                        match = re.match(r'([\d.,]+)', next_line)
-                        if match:
-                            return match.group(1)
-        return None
+        # first line starting with a number after the first "Valor Líquido da Nota" header
+        header = self.line_hits.first('liquido_header')
+        if header is None:
+            return None
+        line_number = self.line_hits.first_after('starts_with_number', header)
+        if line_number is None:
+            return None
+        return LEADING_NUMBER_PATTERN.match(self.line_hits.lines[line_number]).group(1)
 
     def _extract_valor_total(self):
-        return self._find(r'VALOR TOTAL DA NOTA = R\$ ([\d.,]+)')
+        return self._find(VALOR_TOTAL_PATTERN)
 
     def _extract_valor_deducoes(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Dedução(R$)" in line:
-                # Get next non-empty line
-                for j in range(i + 1, len(lines)):
-                    next_line = lines[j].strip()
-                    if next_line:
-                        values = re.findall(r'[\d.,]+', next_line)
-                        index = line.split().index("Dedução(R$)")
-                        if index < len(values):
-                            return values[index]
-                        break
+        lines = self.line_hits.lines
+        for i in self.line_hits['deducao_header']:
+            # values are in the next non-empty line
+            j = self.line_hits.next_non_empty(i)
+            if j is None:
+                continue
+            values = NUMBER_PATTERN.findall(lines[j])
+            index = lines[i].split().index("Dedução(R$)")
+            if index < len(values):
+                return values[index]
         return None
 
-
     def _extract_valor_pis(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "PIS" in line:  # fuzzy match
-                for j in range(i + 1, len(lines)):
-                    next_line = lines[j].strip()
-                    if next_line:
-                        values = re.findall(r'[\d.,]+', next_line)
-                        if len(values) >= 2:
-                            return values[1]  # PIS is second column
-        return None
+        # PIS is the second column of the first line with 2+ numbers after the first "PIS" header
+        return self._number_after_first('pis_header', 'has_two_numbers', 1)
 
     def _extract_valor_cofins(self):
-        lines = self.text.splitlines()
-        header_keywords = ["INSS", "PIS", "Cofins", "C.S.L.L", "IRRF"]
-        for i, line in enumerate(lines):
-            if all(keyword in line.replace(" ", "") for keyword in header_keywords):
-                # Found header line
-                for j in range(i + 1, len(lines)):
-                    next_line = lines[j].strip()
-                    if next_line:
-                        # Try splitting on 2+ spaces
-                        values = re.split(r'\s{2,}', next_line)
-                        if len(values) >= 3:
-                            return values[2]  # third column = Cofins
-                        # fallback: regex multiple numbers
-                        values = re.findall(r'[\d.,]+', next_line)
-                        if len(values) >= 3:
-                            return values[2]
-                        break
+        lines = self.line_hits.lines
+        for i in self.line_hits['retencoes_header']:
+            j = self.line_hits.next_non_empty(i)
+            if j is None:
+                continue
+            next_line = lines[j].strip()
+            # Try splitting on 2+ spaces
+            values = MULTIPLE_SPACES_PATTERN.split(next_line)
+            if len(values) >= 3:
+                return values[2]  # third column = Cofins
+            # fallback: regex multiple numbers
+            values = NUMBER_PATTERN.findall(next_line)
+            if len(values) >= 3:
+                return values[2]
         return None
 
     def _extract_valor_inss(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "INSS" in line.replace(" ", "").upper():
-                for j in range(i + 1, len(lines)):
-                    next_line = lines[j].strip()
-                    if next_line:
-                        values = re.findall(r'[\d.,]+', next_line)
-                        if len(values) >= 1:
-                            return values[0]  # first value = INSS
-        return None
-
+        # INSS is the first number after the first "INSS" header
+        return self._number_after_first('inss_header', 'has_number', 0)
 
     def _extract_valor_irrf(self):
-        for line in self.text.splitlines():
-            if "INSS" in line and "IRRF" in line:
-                # try extracting numbers from same line
-                numbers = re.findall(r'[\d.,]+', line)
-                if len(numbers) >= 5:
-                    return numbers[4]  # 5th = IRRF
-        # fallback: try next line if not merged
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "INSS" in line and "IRRF" in line:
-                for j in range(i+1, len(lines)):
-                    next_line = lines[j].strip()
-                    if next_line:
-                        numbers = re.findall(r'[\d.,]+', next_line)
-                        if len(numbers) >= 5:
-                            return numbers[4]
-                        break
-        return None
-
+        return self._retencoes_value(5, 4)  # 5th = IRRF
 
     def _extract_valor_csll(self):
-        for line in self.text.splitlines():
-            if "INSS" in line and "IRRF" in line:
-                numbers = re.findall(r'[\d.,]+', line)
-                if len(numbers) >= 4:
-                    return numbers[3]  # 4th = C.S.L.L
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "INSS" in line and "IRRF" in line:
-                for j in range(i+1, len(lines)):
-                    next_line = lines[j].strip()
-                    if next_line:
-                        numbers = re.findall(r'[\d.,]+', next_line)
-                        if len(numbers) >= 4:
-                            return numbers[3]
-                        break
-        return None
+        return self._retencoes_value(4, 3)  # 4th = C.S.L.L
 
     def _extract_valor_issqn(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Valor do Serviço" in line:
-                # Found header line → values in next line
-                if i + 1 < len(lines):
-                    value_line = lines[i + 1].strip()
-                    values = value_line.split()
-                    if len(values) >= 7:
-                        return values[6]  # index 6 = Valor do ISS(R$)
-        return None
+        return self._servico_value(6)  # index 6 = Valor do ISS(R$)
 
     def _extract_base_calculo(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Valor do Serviço" in line:
-                # Found header → next line is values
-                if i + 1 < len(lines):
-                    value_line = lines[i + 1].strip()
-                    values = value_line.split()
-                    if len(values) >= 5:
-                        return values[4]  # index 4 = Base de Cálculo (R$)
-        return None
+        return self._servico_value(4)  # index 4 = Base de Cálculo (R$)
 
     def _extract_aliquota(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Valor do Serviço" in line:
-                if i + 1 < len(lines):
-                    value_line = lines[i + 1].strip()
-                    values = value_line.split()
-                    if len(values) >= 6:
-                        return values[5]  # index 5 = Aliquota(%)
-        return None
-
+        return self._servico_value(5)  # index 5 = Aliquota(%)
 
     def _extract_issqn_a_reter(self):
-        return '1' if 'ISS Retido:\s*SIM' in self.text else '0'
+        return '1' if ISS_RETIDO_PATTERN.search(self.text) else '0'
 
     def _extract_estado(self):
-        match = re.search(r'-\s*([A-Z]{2})\s*-\s*BRASIL', self.text)
+        match = ESTADO_PATTERN.search(self.text)
         return match.group(1) if match else None
 
     def _extract_codigo_tributacao(self):
-        lines = self.text.splitlines()
-        capture = False
-        for line in lines:
-            if "Discriminação do Serviço" in line:
-                capture = True
-                continue
-            if capture:
-                # Look for line starting with number pattern
-                match = re.match(r'\s*(\d{2}\.\d{2})', line)
-                if match:
-                    return match.group(1)
-                # stop search if passed that block
-                if "Valor do Serviço" in line or "VALOR TOTAL DA NOTA" in line:
-                    break
-        return None
+        # first line starting with a code (e.g. 17.01) in the "Discriminação do Serviço" block
+        line_number = self._first_in_discriminacao_block('codigo_atividade', 'discriminacao_end')
+        if line_number is None:
+            return None
+        return CODIGO_ATIVIDADE_PATTERN.match(self.line_hits.lines[line_number]).group(1)
 
     def _extract_discriminacao_servico(self):
-        lines = self.text.splitlines()
-        capture = False
-        for line in lines:
-            if "Discriminação do Serviço" in line:
-                capture = True
-                continue
-            if capture and line.strip().startswith("Contrato"):
-                return line.strip()
-            if capture and "Valor do Serviço" in line:
-                break  # exit if reached table
-        return None
+        line_number = self._first_in_discriminacao_block('contrato', 'servico_header')
+        if line_number is None:
+            return None
+        return self.line_hits.lines[line_number].strip()
 
-    
     def _extract_opt_simples_nacional(self):
         # regex case-insensitive, optional spaces, accents tolerant
-        match = re.search(r'optante\s+.*simples\s+nacional', self.text, re.IGNORECASE)
+        match = OPTANTE_SIMPLES_PATTERN.search(self.text)
         return '1' if match else '0'
 
-
     def _extract_serie(self):
         return None
 
@@ -277,56 +217,104 @@ class ArapiracaFileToNotaExtractor(FileToNotaExtractor):
         return None  # Not present in Arapiraca's PDF
 
     def _extract_valor_outras_retencoes(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Outras Retenções(R$)" in line:
-                # Get the next line (values)
-                if i + 1 < len(lines):
-                    values_line = lines[i + 1]
-                    # Extract all numbers
-                    values = re.findall(r'[\d.,]+', values_line)
-                    header_fields = re.findall(r'[^\s]+', line)
-                    # Find index of 'Outras Retenções(R$)' in header
-                    try:
-                        index = header_fields.index('Outras')
-                    except ValueError:
-                        index = header_fields.index('OutrasRetenções(R$)') if 'OutrasRetenções(R$)' in header_fields else None
-                    if index is not None and index < len(values):
-                        return values[index]
-                    elif len(values) >= 2:
-                        return values[1]  # fallback: second value
+        lines = self.line_hits.lines
+        for i in self.line_hits['outras_header']:
+            # Get the next line (values)
+            if i + 1 < len(lines):
+                line = lines[i]
+                values = NUMBER_PATTERN.findall(lines[i + 1])
+                header_fields = line.split()
+                # Find index of 'Outras Retenções(R$)' in header
+                try:
+                    index = header_fields.index('Outras')
+                except ValueError:
+                    index = header_fields.index('OutrasRetenções(R$)') if 'OutrasRetenções(R$)' in header_fields else None
+                if index is not None and index < len(values):
+                    return values[index]
+                elif len(values) >= 2:
+                    return values[1]  # fallback: second value
         return None
 
     def _extract_data_emissao(self):
-        match = re.search(r'Data/Hora da emissão.*?(\d{2}/\d{2}/\d{4} - \d{2}:\d{2}:\d{2})', self.text, re.DOTALL)
+        match = DATA_EMISSAO_PATTERN.search(self.text)
         if match:
             return match.group(1)
         return None
 
     def _extract_atv_economica(self):
-        lines = self.text.splitlines()
-        capture = False
-        for line in lines:
-            if "Discriminação do Serviço" in line:
-                capture = True
-                continue
-            if capture:
-                # Look for line starting with number pattern
-                match = re.match(r'\s*(\d{2}\.\d{2})', line)
-                if match:
-                    return match.group(1)
-                # stop search if passed that block
-                if "Valor do Serviço" in line or "VALOR TOTAL DA NOTA" in line:
-                    break
-        return None
+        return self._extract_codigo_tributacao()
 
     def _extract_municipio(self):
-        match = re.search(r'Cidade\s+([A-ZÇÃÕÁÉÍÓÚ ]+)\s*-\s*[A-Z]{2}', self.text)
-        print(f"[DEBUG match]: {match.group(0) if match else 'No match'}")
+        match = MUNICIPIO_PATTERN.search(self.text)
         if match:
             return match.group(1).strip().title()
         return None
 
+    def _number_after_first(self, header_name, numbers_name, position):
+        """
+        Returns the number at `position` of the first line matched by `numbers_name` after the first header.
+        """
+        header = self.line_hits.first(header_name)
+        if header is None:
+            return None
+        line_number = self.line_hits.first_after(numbers_name, header)
+        if line_number is None:
+            return None
+        return NUMBER_PATTERN.findall(self.line_hits.lines[line_number])[position]
+
+    def _retencoes_value(self, min_values, position):
+        """
+        Returns a value of the "INSS ... IRRF" table, either merged in its header line or in the next non-empty line.
+        """
+        lines = self.line_hits.lines
+        header_lines = self.line_hits['inss_irrf_header']
+        for i in header_lines:
+            # try extracting numbers from same line
+            numbers = NUMBER_PATTERN.findall(lines[i])
+            if len(numbers) >= min_values:
+                return numbers[position]
+        # fallback: try next line if not merged
+        for i in header_lines:
+            j = self.line_hits.next_non_empty(i)
+            if j is None:
+                continue
+            numbers = NUMBER_PATTERN.findall(lines[j])
+            if len(numbers) >= min_values:
+                return numbers[position]
+        return None
+
+    def _servico_value(self, position):
+        """
+        Returns a column of the line right below a "Valor do Serviço" header.
+        """
+        lines = self.line_hits.lines
+        for i in self.line_hits['servico_header']:
+            if i + 1 < len(lines):
+                values = lines[i + 1].split()
+                if len(values) > position:
+                    return values[position]
+        return None
+
+    def _first_in_discriminacao_block(self, value_name, end_name):
+        """
+        Returns the number of the first line matched by `value_name` after the first "Discriminação do Serviço" header,
+        or None if a line matched by `end_name` comes first. Header lines are skipped.
+        """
+        line_number = self.line_hits.first('discriminacao_header')
+        if line_number is None:
+            return None
+        header_lines = set(self.line_hits['discriminacao_header'])
+        while True:
+            value_line = self.line_hits.first_after(value_name, line_number)
+            end_line = self.line_hits.first_after(end_name, line_number)
+            candidates = [n for n in (value_line, end_line) if n is not None]
+            if not candidates:
+                return None
+            line_number = min(candidates)
+            if line_number in header_lines:
+                continue
+            return line_number if line_number == value_line else None
+
 
 
 if __name__ == "__main__":
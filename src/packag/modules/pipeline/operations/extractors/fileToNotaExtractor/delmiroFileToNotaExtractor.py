@@ -1,5 +1,5 @@
 from packag.modules.pipeline.operations.extractors.fileToNotaExtractor import FileToNotaExtractor
-import xml.etree.ElementTree as ET
+from packag.modules.document_operations import get_document
 from packag.models.business import dtoNota
 
 from packag.models.dtoFile import File
@@ -10,21 +10,19 @@ from typing import Type
 
 
 class DelmiroFileToNotaExtractor(FileToNotaExtractor):
-    def __init__(self, file: Type[File]):
+    def __init__(self, file: Type[File], document=None):
         self.file = file
-        self.xml_content = file.file_path.read_text()
+        # document: an already parsed document (e.g. an invoice of a lot file, see xml_stream.py)
+        self.document = document if document is not None else get_document(file)
         self.ns = {
             '': 'http://www.agili.com.br/nfse_v_1.00.xsd'
         }
-        if self.xml_content:
-            self.root = ET.fromstring(self.xml_content)
-        else:
-            self.root = None
+        self.root = self.document.root
 
     def _find(self, path):
         if self.root is None:
             return None
-        el = self.root.find(path, self.ns)
+        el = self.document.xml_index.find(path, self.ns)
         return el.text if el is not None else None
 
     def _extract_numero_nfs(self):
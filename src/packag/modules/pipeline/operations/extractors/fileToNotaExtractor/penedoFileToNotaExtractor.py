@@ -1,4 +1,5 @@
-from packag.modules.pdf_operations import extract_text_from_pdf
+from packag.modules.document_operations import get_document
+from packag.modules.document_operations.scanner import LineScanner
 from pathlib import Path
 import re
 from packag.modules.pipeline.operations.extractors.fileToNotaExtractor import FileToNotaExtractor
@@ -11,15 +12,69 @@ from pathlib import Path
 
 logger = get_logger('operations')
 
+NUMBER_PATTERN = re.compile(r'[\d.,]+')
+LEADING_NUMBER_PATTERN = re.compile(r'([\d.,]+)')
+LEADING_DIGITS_PATTERN = re.compile(r'(\d+)')
+NUMERO_NFS_PATTERN = re.compile(r'\d{5,}')
+CODIGO_AUTENTICIDADE_PATTERN = re.compile(r'Código de Verificação:\s*([A-Z0-9-]+)')
+DATA_COMPETENCIA_PATTERN = re.compile(r'Nota Fiscal.*?([A-Z]{3}/\d{4})', re.DOTALL)
+VALOR_TOTAL_PATTERN = re.compile(r'VALOR TOTAL DA NOTA = R\$ ([\d.,]+)')
+VALOR_ISSQN_PATTERN = re.compile(r'Valor do ISS \(R\$\)\s*([\d.,]+)')
+ESTADO_PATTERN = re.compile(r'UF:\s*([A-Z]{2})')
+CODIGO_TRIBUTACAO_PATTERN = re.compile(r'Código CNAE:\s*(\d+)')
+DISCRIMINACAO_PATTERN = re.compile(r'DISCRIMINAÇÃO DOS SERVIÇOS\s*(.*?)(?=VALOR TOTAL DA NOTA)', re.DOTALL)
+CONTRATO_PATTERN = re.compile(r'CONTRATO\s+\S+.*?\(.*?\)')
+OUTRAS_RETENCOES_PATTERN = re.compile(r'Outras Retenções\(R\$\)\s*([\d.,]+)')
+DATA_EMISSAO_PATTERN = re.compile(r'Data e Hora Emissão:\s*\n\s*(\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2})')
+MUNICIPIO_PATTERN = re.compile(r'([A-ZÇÃÕÁÉÍÓÚ]+) - [A-Z]{2}')
+ISS_RETIDO_PATTERN = re.compile(r'ISS Retido:\s*SIM')
+
+# every line the field extractors look for, found in a single pass over the text
+LINE_SCANNER = LineScanner({
+    'numero_header': "Número da Nota:",
+    'liquido_header': "Valor Liquido (R$)",
+    'pis_header': "PIS (R$)",
+    'cofins_header': "COFINS (R$)",
+    'inss_header': "INSS (R$)",
+    'irrf_header': "IRRF (R$)",
+    'csll_header': "CSLL (R$)",
+    'base_calculo_header': "Base de Cálculo (R$)",
+    'aliquota_header': "Alíquota (%)",
+    'cnae_header': "Código CNAE:",
+    'municipio_header': "Município de Incidência do ISS:",
+})
+
 class PenedoFileToNotaExtractor(FileToNotaExtractor):
+    # the NFS-e data is on the first page; the next pages are attachments
+    PDF_MAX_PAGES = 1
+
     def __init__(self, file: Type[File]):
         self.file = file
         self.file_path = file.file_path
+        # the document is read on the first field extracted (see _get_text)
         self.text = None
 
+    @property
+    def line_hits(self):
+        """
+        Lines matched by each pattern of LINE_SCANNER, scanned once per document.
+        """
+        self._get_text()
+        return self.line_index.scan(LINE_SCANNER)
+
+    def _get_text(self):
+        """
+        Returns the text of the document, reading it on the first call,
+        so any field can be extracted first (e.g. by a projection, see get_all_extracted_info).
+        """
+        if self.text is None:
+            self.extract_data()
+        return self.text
+
     def extract_data(self):
         try:
-            self.text = extract_text_from_pdf(self.file_path)
+            self.document = get_document(self.file, max_pages=self.PDF_MAX_PAGES)
+            self.text = self.document.text
             return self.text
         
         except FileNotFoundError as e:
@@ -44,156 +99,87 @@ class PenedoFileToNotaExtractor(FileToNotaExtractor):
             ) from e
 
     def _find(self, pattern):
-        if not self.text:
-            self.extract_data()
-        
-
-        match = re.search(pattern, self.text)
+        match = re.search(pattern, self._get_text())
         return match.group(1) if match else None
 
     def _extract_numero_nfs(self):
-        if self.text is None:
-            self.extract_data()
-            
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Número da Nota:" in line:
-                # Look at the next 1-3 lines after this
-                for j in range(i + 1, min(i + 4, len(lines))):
-                    match = re.search(r'\d{5,}', lines[j])
-                    if match:
-                        return match.group(0)
+        lines = self.line_hits.lines
+        for i in self.line_hits['numero_header']:
+            # Look at the next 1-3 lines after this
+            for j in range(i + 1, min(i + 4, len(lines))):
+                match = NUMERO_NFS_PATTERN.search(lines[j])
+                if match:
+                    return match.group(0)
         return None  # if nothing found
 
     def _extract_codigo_autenticidade(self):
-        return self._find(r'Código de Verificação:\s*([A-Z0-9-]+)')
+        return self._find(CODIGO_AUTENTICIDADE_PATTERN)
 
     def _extract_data_competencia(self):
-        match = re.search(r'Nota Fiscal.*?([A-Z]{3}/\d{4})', self.text, re.DOTALL)
+        match = DATA_COMPETENCIA_PATTERN.search(self._get_text())
         if match:
             return match.group(1)
         return None
 
     def _extract_valor_liquido(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Valor Liquido (R$)" in line:
-                values_line = lines[i + 1]
-                match = re.match(r'([\d.,]+)', values_line)
-                if match:
-                    return match.group(1)
+        lines = self.line_hits.lines
+        for i in self.line_hits['liquido_header']:
+            values_line = lines[i + 1]
+            match = LEADING_NUMBER_PATTERN.match(values_line)
+            if match:
+                return match.group(1)
         return None
 
-
-
     def _extract_valor_total(self):
-        return self._find(r'VALOR TOTAL DA NOTA = R\$ ([\d.,]+)')
+        return self._find(VALOR_TOTAL_PATTERN)
 
     def _extract_valor_deducoes(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Valor Liquido (R$)" in line:
-                values_line = lines[i + 1]
-                matches = re.findall(r'[\d.,]+', values_line)
-                if len(matches) >= 2:
-                    return matches[1]  # second value
-        return None
+        return self._value_below('liquido_header', 1)  # second value
 
     def _extract_valor_pis(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "PIS (R$)" in line:
-                values_line = lines[i + 1]
-                matches = re.findall(r'[\d.,]+', values_line)
-                if len(matches) >= 3:
-                    return matches[2]  # third value
-        return None
+        return self._value_below('pis_header', 2)  # third value
 
     def _extract_valor_cofins(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "COFINS (R$)" in line:
-                values_line = lines[i + 1]
-                matches = re.findall(r'[\d.,]+', values_line)
-                if len(matches) >= 1:
-                    return matches[0]  # first value
-        return None
-    
+        return self._value_below('cofins_header', 0)  # first value
+
     def _extract_valor_inss(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "INSS (R$)" in line:
-                values_line = lines[i + 1]
-                matches = re.findall(r'[\d.,]+', values_line)
-                if len(matches) >= 2:
-                    return matches[1]  # second value
-        return None
+        return self._value_below('inss_header', 1)  # second value
 
     def _extract_valor_irrf(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "IRRF (R$)" in line:
-                values_line = lines[i + 1]
-                matches = re.findall(r'[\d.,]+', values_line)
-                if len(matches) >= 5:
-                    return matches[4]  # fifth value
-        return None
-
+        return self._value_below('irrf_header', 4)  # fifth value
 
     def _extract_valor_csll(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "CSLL (R$)" in line:
-                values_line = lines[i + 1]
-                matches = re.findall(r'[\d.,]+', values_line)
-                if len(matches) >= 4:
-                    return matches[3]  # fourth value
-        return None
+        return self._value_below('csll_header', 3)  # fourth value
 
     def _extract_valor_issqn(self):
-        return self._find(r'Valor do ISS \(R\$\)\s*([\d.,]+)')
+        return self._find(VALOR_ISSQN_PATTERN)
 
     def _extract_base_calculo(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Base de Cálculo (R$)" in line:
-                values_line = lines[i + 1]
-                matches = re.findall(r'[\d.,]+', values_line)
-                if len(matches) >= 3:
-                    return matches[2]  # third value
-        return None
+        return self._value_below('base_calculo_header', 2)  # third value
 
     def _extract_aliquota(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Alíquota (%)" in line:
-                values_line = lines[i + 1]
-                matches = re.findall(r'[\d.,]+', values_line)
-                if len(matches) >= 4:
-                    return matches[3]  # fourth value
-        return None
-
+        return self._value_below('aliquota_header', 3)  # fourth value
 
     def _extract_issqn_a_reter(self):
-        return '1' if 'ISS Retido:\s*SIM' in self.text else '0'
+        return '1' if ISS_RETIDO_PATTERN.search(self._get_text()) else '0'
 
     def _extract_estado(self):
-        return self._find(r'UF:\s*([A-Z]{2})')
+        return self._find(ESTADO_PATTERN)
 
     def _extract_codigo_tributacao(self):
-        return self._find(r'Código CNAE:\s*(\d+)')
+        return self._find(CODIGO_TRIBUTACAO_PATTERN)
 
     def _extract_discriminacao_servico(self):
-        match = re.search(r'DISCRIMINAÇÃO DOS SERVIÇOS\s*(.*?)(?=VALOR TOTAL DA NOTA)', self.text, re.DOTALL)
+        match = DISCRIMINACAO_PATTERN.search(self._get_text())
         if match:
             discrim_text = match.group(1).strip()
-            contrato_match = re.search(r'CONTRATO\s+\S+.*?\(.*?\)', discrim_text)
+            contrato_match = CONTRATO_PATTERN.search(discrim_text)
             if contrato_match:
                 return contrato_match.group(0)
         return None
-    
+
     def _extract_opt_simples_nacional(self):
-        return '1' if 'Optante pelo Simples Nacional' in self.text else '0'
+        return '1' if 'Optante pelo Simples Nacional' in self._get_text() else '0'
 
     def _extract_serie(self):
         return None
@@ -202,43 +188,51 @@ class PenedoFileToNotaExtractor(FileToNotaExtractor):
         return None  # Not present in Penedo's PDF
 
     def _extract_valor_outras_retencoes(self):
-        return self._find(r'Outras Retenções\(R\$\)\s*([\d.,]+)')
+        return self._find(OUTRAS_RETENCOES_PATTERN)
 
     def _extract_data_emissao(self):
-        match = re.search(r'Data e Hora Emissão:\s*\n\s*(\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2})', self.text)
+        match = DATA_EMISSAO_PATTERN.search(self._get_text())
         if match:
             return match.group(1)
         return None
 
-
     def _extract_atv_economica(self):
-        lines = self.text.splitlines()
-        capture = False
+        line_number = self.line_hits.first('cnae_header')
+        if line_number is None:
+            return None
+        lines = self.line_hits.lines
+        header_lines = set(self.line_hits['cnae_header'])
         count = 0
-        for line in lines:
-            if "Código CNAE:" in line:
-                capture = True
+        for j in range(line_number + 1, len(lines)):
+            line = lines[j]
+            if j in header_lines or not line.strip():
                 continue
-            if capture and line.strip():
-                count += 1
-                if count == 2:  # <-- we want the second non-empty line
-                    match = re.match(r'(\d+)', line.strip())
-                    if match:
-                        return match.group(1)
+            count += 1
+            if count == 2:  # <-- we want the second non-empty line
+                match = LEADING_DIGITS_PATTERN.match(line.strip())
+                return match.group(1) if match else None
         return None
 
     def _extract_municipio(self):
-        lines = self.text.splitlines()
-        capture = False
-        for i, line in enumerate(lines):
-            if "Município de Incidência do ISS:" in line:
-                # Look in next 2 lines for 'CITY - ST'
-                for j in range(i + 1, min(i + 3, len(lines))):
-                    match = re.search(r'([A-ZÇÃÕÁÉÍÓÚ]+) - [A-Z]{2}', lines[j])
-                    if match:
-                        return match.group(1).title()  # optional: capitalize nicely
+        lines = self.line_hits.lines
+        for i in self.line_hits['municipio_header']:
+            # Look in next 2 lines for 'CITY - ST'
+            for j in range(i + 1, min(i + 3, len(lines))):
+                match = MUNICIPIO_PATTERN.search(lines[j])
+                if match:
+                    return match.group(1).title()  # optional: capitalize nicely
         return None
 
+    def _value_below(self, header_name, position):
+        """
+        Returns the number at `position` of the line right below a header.
+        """
+        lines = self.line_hits.lines
+        for i in self.line_hits[header_name]:
+            values = NUMBER_PATTERN.findall(lines[i + 1])
+            if len(values) > position:
+                return values[position]
+        return None
 
 
 if __name__ == "__main__":
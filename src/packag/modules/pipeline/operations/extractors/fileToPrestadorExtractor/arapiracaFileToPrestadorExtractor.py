@@ -1,4 +1,4 @@
-from packag.modules.pdf_operations import extract_text_from_pdf
+from packag.modules.document_operations import get_document
 from pathlib import Path
 import re
 from packag.modules.pipeline.operations.extractors.fileToPrestadorExtractor import FileToPrestadorExtractor
@@ -11,6 +11,9 @@ from typing import Type
 logger = get_logger('operations')
 
 class ArapiracaFileToPrestadorExtractor(FileToPrestadorExtractor):
+    # the NFS-e data is on the first page; the next pages are attachments
+    PDF_MAX_PAGES = 1
+
     def __init__(self, file: Type[File]):
         self.file = file
         self.file_path = file.file_path
@@ -18,7 +21,8 @@ class ArapiracaFileToPrestadorExtractor(FileToPrestadorExtractor):
 
     def extract_data(self):
         try:
-            self.text = extract_text_from_pdf(self.file_path)
+            self.document = get_document(self.file, max_pages=self.PDF_MAX_PAGES)
+            self.text = self.document.text
             return self.text
         
         except FileNotFoundError as e:
@@ -66,27 +70,25 @@ class ArapiracaFileToPrestadorExtractor(FileToPrestadorExtractor):
         return None
 
     def _extract_razao_social(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Prestador de Serviços" in line:
-                # Next line should be the company name
-                if i + 1 < len(lines):
-                    return lines[i + 1].strip()
+        lines = self.line_index.lines
+        for i in self.line_index.lines_with("Prestador de Serviços"):
+            # Next line should be the company name
+            if i + 1 < len(lines):
+                return lines[i + 1].strip()
         return None
 
     def _extract_endereco(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Prestador de Serviços" in line:
-                if i + 3 < len(lines):
-                    addr1 = lines[i + 2].strip().rstrip(',.')
-                    addr2 = lines[i + 3].strip().rstrip(',.')
-                    
-                    # Remove 'Telefone:' and everything after if present
-                    if "Telefone:" in addr2:
-                        addr2 = addr2.split("Telefone:")[0].strip().rstrip(',.')
-                    
-                    return f"{addr1}, {addr2}"
+        lines = self.line_index.lines
+        for i in self.line_index.lines_with("Prestador de Serviços"):
+            if i + 3 < len(lines):
+                addr1 = lines[i + 2].strip().rstrip(',.')
+                addr2 = lines[i + 3].strip().rstrip(',.')
+
+                # Remove 'Telefone:' and everything after if present
+                if "Telefone:" in addr2:
+                    addr2 = addr2.split("Telefone:")[0].strip().rstrip(',.')
+
+                return f"{addr1}, {addr2}"
         return None
 
     def _extract_municipio(self):
@@ -108,27 +110,25 @@ class ArapiracaFileToPrestadorExtractor(FileToPrestadorExtractor):
         return None
     
     def _extract_numero(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Prestador de Serviços" in line:
-                # Address line usually contains the number
-                if i + 3 < len(lines):
-                    address_line = lines[i + 3].strip()
-                    match = re.search(r',\s*(\d+)', address_line)
-                    if match:
-                        return match.group(1)
+        lines = self.line_index.lines
+        for i in self.line_index.lines_with("Prestador de Serviços"):
+            # Address line usually contains the number
+            if i + 3 < len(lines):
+                address_line = lines[i + 3].strip()
+                match = re.search(r',\s*(\d+)', address_line)
+                if match:
+                    return match.group(1)
         return None
     
     def _extract_bairro(self):
-        lines = self.text.splitlines()
-        for i, line in enumerate(lines):
-            if "Prestador de Serviços" in line:
-                # Bairro is usually after the address line
-                if i + 4 < len(lines):
-                    bairro_line = lines[i + 4].strip()
-                    match = re.search(r'([A-ZÇÃÕÁÉÍÓÚ ]+),', bairro_line)
-                    if match:
-                        return match.group(1).strip().title()
+        lines = self.line_index.lines
+        for i in self.line_index.lines_with("Prestador de Serviços"):
+            # Bairro is usually after the address line
+            if i + 4 < len(lines):
+                bairro_line = lines[i + 4].strip()
+                match = re.search(r'([A-ZÇÃÕÁÉÍÓÚ ]+),', bairro_line)
+                if match:
+                    return match.group(1).strip().title()
         return None
     
     def _extract_telefone(self):
@@ -146,7 +146,5 @@ if __name__ == "__main__":
         file_path=Path('static/notas_fiscais/arapiraca/205.pdf'),
         file_extension='pdf'
     )
-    text = extract_text_from_pdf(dtoFile.file_path)
-    print(text)
     extractor = ArapiracaFileToPrestadorExtractor(dtoFile)
     print(extractor.get_all_extracted_info())
\ No newline at end of file
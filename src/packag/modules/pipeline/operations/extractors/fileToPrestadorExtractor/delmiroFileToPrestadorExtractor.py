@@ -1,6 +1,6 @@
 from pathlib import Path
 import re
-import xml.etree.ElementTree as ET
+from packag.modules.document_operations import get_document
 from packag.modules.pipeline.operations.extractors.fileToPrestadorExtractor import FileToPrestadorExtractor
 from packag.modules.pipeline.utils.exceptions import OperationError
 from packag.modules.utils.logger import get_logger
@@ -10,16 +10,16 @@ from typing import Type
 logger = get_logger('operations')
 
 class DelmiroFileToPrestadorExtractor(FileToPrestadorExtractor):
-    def __init__(self, file: Type[File]):
+    def __init__(self, file: Type[File], document=None):
         self.file = file
         self.file_path = file.file_path
-        self.xml_content = self.extract_data()
+        # document: an already parsed document (e.g. an invoice of a lot file, see xml_stream.py)
+        self.document = document if document is not None else self.extract_data()
         self.namespaces = {'ns': 'http://www.agili.com.br/nfse_v_1.00.xsd'}
 
     def extract_data(self):
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as file:
-                return file.read()
+            return get_document(self.file)
         
         except FileNotFoundError as e:
             logger.error(f"Error extracting data from file: {e}")
@@ -44,10 +44,9 @@ class DelmiroFileToPrestadorExtractor(FileToPrestadorExtractor):
 
     def _find(self, xpath):
         try:
-            root = ET.fromstring(self.xml_content)
             if xpath.startswith('//'):
                 xpath = '.' + xpath[1:]
-            element = root.find(xpath, self.namespaces)
+            element = self.document.xml_index.find(xpath, self.namespaces)
             return element.text if element is not None else None
         except Exception as e:
             logger.error(f"Error finding element with xpath {xpath}: {e}")
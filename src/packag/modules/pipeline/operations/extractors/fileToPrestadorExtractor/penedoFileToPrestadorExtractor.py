@@ -1,4 +1,5 @@
-from packag.modules.pdf_operations import extract_text_from_pdf
+from packag.modules.document_operations import get_document
+from packag.modules.document_operations.sections import PENEDO_SECTIONS
 from pathlib import Path
 import re
 from packag.modules.pipeline.operations.extractors.fileToPrestadorExtractor import FileToPrestadorExtractor
@@ -10,7 +11,20 @@ from typing import Type
 
 logger = get_logger('operations')
 
+CNPJ_PATTERN = re.compile(r'CPF/CNPJ:[ \t]*(\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})')
+INSCRICAO_MUNICIPAL_PATTERN = re.compile(r'Inscrição Municipal:[ \t]*(\d+)')
+RAZAO_SOCIAL_PATTERN = re.compile(r'Nome/Razão Social:[ \t]*(\S[^\n]*)')
+ENDERECO_PATTERN = re.compile(r'Endereço:[ \t]*(\S[^\n]*)')
+MUNICIPIO_PATTERN = re.compile(r'Municipio:[ \t]*([A-ZÇÃÕÁÉÍÓÚ ]+)[ \t]*UF:')
+UF_PATTERN = re.compile(r'UF:[ \t]*([A-Z]{2})')
+CEP_PATTERN = re.compile(r'CEP:[ \t]*(\d{8})')
+TELEFONE_PATTERN = re.compile(r'TEL:[ \t]*(\d+)')
+EMAIL_PATTERN = re.compile(r'E-mail:[ \t]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+
 class PenedoFileToPrestadorExtractor(FileToPrestadorExtractor):
+    # the NFS-e data is on the first page; the next pages are attachments
+    PDF_MAX_PAGES = 1
+
     def __init__(self, file: Type[File]):
         self.file = file
         self.file_path = file.file_path
@@ -18,7 +32,8 @@ class PenedoFileToPrestadorExtractor(FileToPrestadorExtractor):
 
     def extract_data(self):
         try:
-            self.text = extract_text_from_pdf(self.file_path)
+            self.document = get_document(self.file, max_pages=self.PDF_MAX_PAGES)
+            self.text = self.document.text
             return self.text
         
         except FileNotFoundError as e:
@@ -53,43 +68,43 @@ class PenedoFileToPrestadorExtractor(FileToPrestadorExtractor):
         return None
 
     def _extract_cnpj(self):
-        match = re.search(r'CPF/CNPJ:\s*(\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})', self.text)
+        match = self._search_prestador(CNPJ_PATTERN)
         if match:
             return match.group(1)
         return None
 
     def _extract_inscricao_municipal(self):
-        match = re.search(r'Inscrição Municipal:\s*(\d+)', self.text)
+        match = self._search_prestador(INSCRICAO_MUNICIPAL_PATTERN)
         if match:
             return match.group(1)
         return None
 
     def _extract_razao_social(self):
-        match = re.search(r'Nome/Razão Social:\s*([^\n]+)', self.text)
+        match = self._search_prestador(RAZAO_SOCIAL_PATTERN)
         if match:
             return match.group(1).strip()
         return None
 
     def _extract_endereco(self):
-        match = re.search(r'Endereço:\s*([^\n]+)', self.text)
+        match = self._search_prestador(ENDERECO_PATTERN)
         if match:
             return match.group(1).strip()
         return None
 
     def _extract_municipio(self):
-        match = re.search(r'Municipio:\s*([A-ZÇÃÕÁÉÍÓÚ ]+)\s*UF:', self.text)
+        match = self._search_prestador(MUNICIPIO_PATTERN)
         if match:
             return match.group(1).strip().title()
         return None
 
     def _extract_uf(self):
-        match = re.search(r'UF:\s*([A-Z]{2})', self.text)
+        match = self._search_prestador(UF_PATTERN)
         if match:
             return match.group(1)
         return None
     
     def _extract_cep(self):
-        match = re.search(r'CEP:\s*(\d{8})', self.text)
+        match = self._search_prestador(CEP_PATTERN)
         if match:
             return match.group(1)
         return None
@@ -101,17 +116,27 @@ class PenedoFileToPrestadorExtractor(FileToPrestadorExtractor):
         return None
     
     def _extract_telefone(self):
-        match = re.search(r'TEL:\s*(\d+)', self.text)
+        match = self._search_prestador(TELEFONE_PATTERN)
         if match:
             return match.group(1)
         return None
     
     def _extract_email(self):
-        match = re.search(r'E-mail:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', self.text)
+        match = self._search_prestador(EMAIL_PATTERN)
         if match:
             return match.group(1)
         return None
 
+    def _search_prestador(self, pattern):
+        """
+        Searches the pattern only in the PRESTADOR section, so the Tomador data never leaks into the Prestador.
+        Documents without a PRESTADOR heading are searched entirely.
+        """
+        prestador = self.line_index.scan(PENEDO_SECTIONS).get('PRESTADOR')
+        if prestador is None:
+            return re.search(pattern, self.text)
+        return prestador.search(pattern)
+
 
 if __name__ == "__main__":
     dtoFile = File(
@@ -1,4 +1,4 @@
-from packag.modules.pdf_operations import extract_text_from_pdf
+from packag.modules.document_operations import get_document
 from pathlib import Path
 import re
 from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor import FileToTomadorExtractor
@@ -11,6 +11,9 @@ from typing import Type
 logger = get_logger('operations')
 
 class ArapiracaFileToTomadorExtractor(FileToTomadorExtractor):
+    # the NFS-e data is on the first page; the next pages are attachments
+    PDF_MAX_PAGES = 1
+
     def __init__(self, file: Type[File]):
         self.file = file
         self.file_path = file.file_path
@@ -18,7 +21,8 @@ class ArapiracaFileToTomadorExtractor(FileToTomadorExtractor):
 
     def extract_data(self):
         try:
-            self.text = extract_text_from_pdf(self.file_path)
+            self.document = get_document(self.file, max_pages=self.PDF_MAX_PAGES)
+            self.text = self.document.text
             return self.text
         
         except FileNotFoundError as e:
@@ -59,29 +63,24 @@ class ArapiracaFileToTomadorExtractor(FileToTomadorExtractor):
         return None
 
     def _extract_inscricao_municipal(self):
-        lines = self.text.splitlines()
-        capture = False
-        for line in lines:
-            if "Tomador de Serviço" in line:
-                capture = True  # começa a capturar após essa linha
-            if capture and "Inscrição Municipal" in line:
-                match = re.search(r'Inscrição Municipal\s*(\d+)', line)
-                if match:
-                    return match.group(1)
+        for line in self._lines_after_tomador_header("Inscrição Municipal"):
+            match = re.search(r'Inscrição Municipal\s*(\d+)', line)
+            if match:
+                return match.group(1)
         return None
 
 
     def _extract_razao_social(self):
-        for line in self.text.splitlines():
-            if "Nome do tomador do serviço" in line:
-                match = re.search(r'Nome do tomador do serviço\s*(.*)', line)
-                if match:
-                    return match.group(1).strip()
+        for i in self.line_index.lines_with("Nome do tomador do serviço"):
+            match = re.search(r'Nome do tomador do serviço\s*(.*)', self.line_index.lines[i])
+            if match:
+                return match.group(1).strip()
         return None
 
 
     def _extract_endereco(self):
-        for line in self.text.splitlines():
+        for i in self.line_index.lines_with("Endereço"):
+            line = self.line_index.lines[i]
             if line.strip().startswith("Endereço"):
                 endereco = line.replace("Endereço", "").strip().rstrip(',.')
                 return endereco
@@ -100,15 +99,10 @@ class ArapiracaFileToTomadorExtractor(FileToTomadorExtractor):
         return None
     
     def _extract_cep(self):
-        lines = self.text.splitlines()
-        capture = False
-        for line in lines:
-            if "Tomador de Serviço" in line:
-                capture = True  # começa a buscar depois dessa linha
-            if capture and "Cep" in line:
-                match = re.search(r'Cep\s*(\d{5}-?\d{3})', line, re.IGNORECASE)
-                if match:
-                    return match.group(1).replace('-', '')
+        for line in self._lines_after_tomador_header("Cep"):
+            match = re.search(r'Cep\s*(\d{5}-?\d{3})', line, re.IGNORECASE)
+            if match:
+                return match.group(1).replace('-', '')
         return None
 
     
@@ -116,8 +110,8 @@ class ArapiracaFileToTomadorExtractor(FileToTomadorExtractor):
         return None
     
     def _extract_bairro(self):
-        lines = self.text.splitlines()
-        for line in lines:
+        for i in self.line_index.lines_with("Bairro"):
+            line = self.line_index.lines[i]
             if line.strip().startswith("Bairro"):
                 # Remove 'Bairro' e pega antes de 'Telefone:'
                 bairro = line.replace("Bairro", "").strip()
@@ -130,40 +124,28 @@ class ArapiracaFileToTomadorExtractor(FileToTomadorExtractor):
         return None
     
     def _extract_email(self):
-        lines = self.text.splitlines()
-        capture = False
-        for line in lines:
-            if "Tomador de Serviço" in line:
-                capture = True  # começa a capturar após essa linha
-            if capture and "Email" in line:
-                match = re.search(r'Email\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', line, re.IGNORECASE)
-                if match:
-                    return match.group(1)
+        for line in self._lines_after_tomador_header("Email"):
+            match = re.search(r'Email\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', line, re.IGNORECASE)
+            if match:
+                return match.group(1)
         return None
 
+    def _lines_after_tomador_header(self, keyword):
+        """
+        Yields the lines containing the keyword, starting at the first "Tomador de Serviço" header line.
+        """
+        header = self.line_index.first_with("Tomador de Serviço")
+        if header is None:
+            return
+        for i in self.line_index.lines_with(keyword):
+            if i >= header:
+                yield self.line_index.lines[i]
 
-    def get_all_extracted_info(self):
-        return {
-            'cpf': self._extract_cpf(),
-            'cnpj': self._extract_cnpj(),
-            'inscricao_municipal': self._extract_inscricao_municipal(),
-            'razao_social': self._extract_razao_social(),
-            'endereco': self._extract_endereco(),
-            'municipio': self._extract_municipio(),
-            'uf': self._extract_uf(),
-            'cep': self._extract_cep(),
-            'numero': self._extract_numero(),
-            'bairro': self._extract_bairro(),
-            'telefone': self._extract_telefone(),
-            'email': self._extract_email(),
-        }
 
 if __name__ == "__main__":
     dtoFile = File(
         file_path=Path('static/notas_fiscais/arapiraca/205.pdf'),
         file_extension='pdf'
     )
-    text = extract_text_from_pdf(dtoFile.file_path)
-    print(text)
     extractor = ArapiracaFileToTomadorExtractor(dtoFile)
     print(extractor.get_all_extracted_info())
\ No newline at end of file
@@ -1,6 +1,6 @@
 from pathlib import Path
 import re
-import xml.etree.ElementTree as ET
+from packag.modules.document_operations import get_document
 from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor import FileToTomadorExtractor
 from packag.modules.pipeline.utils.exceptions import OperationError
 from packag.modules.utils.logger import get_logger
@@ -10,26 +10,28 @@ from typing import Type
 logger = get_logger('operations')
 
 class DelmiroFileToTomadorExtractor(FileToTomadorExtractor):
-    def __init__(self, file: Type[File]):
+    def __init__(self, file: Type[File], document=None):
         self.file = file
         
         self.file_path = file.file_path
+        # document: an already parsed document (e.g. an invoice of a lot file, see xml_stream.py)
+        self.document = document
         self.root = self.extract_data()
-        self.xml_content = self.extract_data()
         
         self.namespaces = {'ns': 'http://www.agili.com.br/nfse_v_1.00.xsd'}
     
     def extract_data(self):
         try:
-            tree = ET.parse(self.file_path)
-            return tree.getroot()
+            if self.document is None:
+                self.document = get_document(self.file)
+            return self.document.root
         except Exception as e:
             logger.error(f"Error parsing XML: {e}")
             raise OperationError(...)
 
     def _find(self, xpath):
         try:
-            element = self.root.find(xpath, self.namespaces)
+            element = self.document.xml_index.find(xpath, self.namespaces)
             return element.text if element is not None else None
         except Exception as e:
             logger.error(f"Error finding element with xpath {xpath}: {e}")
@@ -1,6 +1,6 @@
 from pathlib import Path
 import re
-import xml.etree.ElementTree as ET
+from packag.modules.document_operations import get_document
 from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor import FileToTomadorExtractor
 from packag.modules.pipeline.utils.exceptions import OperationError
 from packag.modules.utils.logger import get_logger
@@ -10,23 +10,26 @@ from typing import Type
 logger = get_logger('operations')
 
 class MaceioFileToTomadorExtractor(FileToTomadorExtractor):
-    def __init__(self, file: Type[File]):
+    def __init__(self, file: Type[File], document=None):
         self.file = file
         self.file_path = file.file_path
+        # document: an already parsed document (e.g. an invoice of a lot file, see xml_stream.py)
+        self.document = document
         self.root = self.extract_data()
         self.namespaces = {'ns2': 'http://www.giss.com.br/tipos-v2_04.xsd'}
 
     def extract_data(self):
         try:
-            tree = ET.parse(self.file_path)
-            return tree.getroot()
+            if self.document is None:
+                self.document = get_document(self.file)
+            return self.document.root
         except Exception as e:
             logger.error(f"Error parsing XML: {e}")
             raise OperationError(...)
 
     def _find(self, xpath):
         try:
-            element = self.root.find(xpath, self.namespaces)
+            element = self.document.xml_index.find(xpath, self.namespaces)
             return element.text if element is not None else None
         except Exception as e:
             logger.error(f"Error finding element with xpath {xpath}: {e}")
@@ -81,22 +84,6 @@ class MaceioFileToTomadorExtractor(FileToTomadorExtractor):
     def _extract_email(self):
         return self._find('.//ns2:TomadorServico/ns2:Contato/ns2:Email')
 
-    def get_all_extracted_info(self):
-        return {
-            'cnpj': self._extract_cnpj(),
-            'cpf': self._extract_cpf(),
-            'inscricao_municipal': self._extract_inscricao_municipal(),
-            'razao_social': self._extract_razao_social(),
-            'endereco': self._extract_endereco(),
-            'municipio': self._extract_municipio(),
-            'uf': self._extract_uf(),
-            'cep': self._extract_cep(),
-            'numero': self._extract_numero(),
-            'bairro': self._extract_bairro(),
-            'telefone': self._extract_telefone(),
-            'email': self._extract_email(),
-        }
-
 if __name__ == "__main__":
     dtoFile = File(
         file_path=Path('static/notas_fiscais/maceio/342.xml'),
@@ -1,4 +1,5 @@
-from packag.modules.pdf_operations import extract_text_from_pdf
+from packag.modules.document_operations import get_document
+from packag.modules.document_operations.sections import PENEDO_SECTIONS
 from pathlib import Path
 import re
 from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor import FileToTomadorExtractor
@@ -10,7 +11,20 @@ from typing import Type
 
 logger = get_logger('operations')
 
+CNPJ_PATTERN = re.compile(r'CPF/CNPJ:[ \t]*(\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})')
+INSCRICAO_MUNICIPAL_PATTERN = re.compile(r'Inscrição Municipal:[ \t]*(\d+)')
+RAZAO_SOCIAL_PATTERN = re.compile(r'Nome/Razão Social:[ \t]*(\S[^\n]*)')
+ENDERECO_PATTERN = re.compile(r'Endereço:[ \t]*(\S[^\n]*)')
+MUNICIPIO_PATTERN = re.compile(r'Municipio:[ \t]*([A-ZÇÃÕÁÉÍÓÚ ]+)[ \t]*UF:')
+UF_PATTERN = re.compile(r'UF:[ \t]*([A-Z]{2})')
+CEP_PATTERN = re.compile(r'CEP:[ \t]*(\d{8})')
+TELEFONE_PATTERN = re.compile(r'TEL:[ \t]*(\d+)')
+EMAIL_PATTERN = re.compile(r'E-mail:[ \t]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+
 class PenedoFileToTomadorExtractor(FileToTomadorExtractor):
+    # the NFS-e data is on the first page; the next pages are attachments
+    PDF_MAX_PAGES = 1
+
     def __init__(self, file: Type[File]):
         self.file = file
         self.file_path = file.file_path
@@ -18,7 +32,8 @@ class PenedoFileToTomadorExtractor(FileToTomadorExtractor):
 
     def extract_data(self):
         try:
-            self.text = extract_text_from_pdf(self.file_path)
+            self.document = get_document(self.file, max_pages=self.PDF_MAX_PAGES)
+            self.text = self.document.text
             return self.text
         
         except FileNotFoundError as e:
@@ -55,103 +70,47 @@ class PenedoFileToTomadorExtractor(FileToTomadorExtractor):
         return None
 
     def _extract_cnpj(self):
-        lines = self.text.splitlines()
-        capture = False
-        match = None
-        
-        for line in lines:
-            if "TOMADOR DE SERVIÇOS" in line:
-                capture = True  # começa a capturar após essa linha
-            if capture and "CPF/CNPJ" in line:
-                match = re.search(r'CPF/CNPJ:\s*(\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})', line)
-                if match:
-                    return match.group(1)
+        match = self._search_tomador(CNPJ_PATTERN)
+        if match:
+            return match.group(1)
         return None
 
     def _extract_inscricao_municipal(self):
-        lines = self.text.splitlines()
-        capture = False
-        match = None
-        
-        for line in lines:
-            if "TOMADOR DE SERVIÇOS" in line:
-                capture = True  # começa a capturar após essa linha
-            if capture and "Inscrição Municipal" in line:
-                match = re.search(r'Inscrição Municipal:\s*(\d+)', line)
+        match = self._search_tomador(INSCRICAO_MUNICIPAL_PATTERN)
         if match:
             return match.group(1)
         return None
 
     def _extract_razao_social(self):
-        lines = self.text.splitlines()
-        capture = False
-        match = None
-        
-        for line in lines:
-            if "TOMADOR DE SERVIÇOS" in line:
-                capture = True  # começa a capturar após essa linha
-            if capture and "Nome/Razão Social" in line:
-                match = re.search(r'Nome/Razão Social:\s*([^\n]+)', line)
+        match = self._search_tomador(RAZAO_SOCIAL_PATTERN)
         if match:
             return match.group(1).strip()
         return None
 
     def _extract_endereco(self):
-        lines = self.text.splitlines()
-        capture = False
-        match = None
-        
-        for line in lines:
-            if "TOMADOR DE SERVIÇOS" in line:
-                capture = True  # começa a capturar após essa linha
-            if capture and "Endereço" in line:
-                match = re.search(r'Endereço:\s*([^\n]+)', line)
+        match = self._search_tomador(ENDERECO_PATTERN)
         if match:
             return match.group(1).strip()
         return None
 
     def _extract_municipio(self):
-        lines = self.text.splitlines()
-        capture = False
-        match = None
-        
-        for line in lines:
-            if "TOMADOR DE SERVIÇOS" in line:
-                capture = True  # começa a capturar após essa linha
-            if capture and "Municipio" in line:
-                match = re.search(r'Municipio:\s*([A-ZÇÃÕÁÉÍÓÚ ]+)\s*UF:', line)
+        match = self._search_tomador(MUNICIPIO_PATTERN)
         if match:
             return match.group(1).strip().title()
         return None
 
     def _extract_uf(self):
-        lines = self.text.splitlines()
-        capture = False
-        match = None
-        
-        for line in lines:
-            if "TOMADOR DE SERVIÇOS" in line:
-                capture = True  # começa a capturar após essa linha
-            if capture and "UF" in line:
-                match = re.search(r'UF:\s*([A-Z]{2})', line)
+        match = self._search_tomador(UF_PATTERN)
         if match:
             return match.group(1)
         return None
-    
+
     def _extract_cep(self):
-        lines = self.text.splitlines()
-        capture = False
-        match = None
-        
-        for line in lines:
-            if "TOMADOR DE SERVIÇOS" in line:
-                capture = True  # começa a capturar após essa linha
-            if capture and "CEP" in line:
-                match = re.search(r'CEP:\s*(\d{8})', line)
+        match = self._search_tomador(CEP_PATTERN)
         if match:
             return match.group(1)
         return None
-    
+
     def _extract_numero(self):
         return None
     
@@ -159,41 +118,31 @@ class PenedoFileToTomadorExtractor(FileToTomadorExtractor):
         return None
     
     def _extract_telefone(self):
-        lines = self.text.splitlines()
-        capture = False
-        match = None
-        
-        for line in lines:
-            if "TOMADOR DE SERVIÇOS" in line:
-                capture = True  # começa a capturar após essa linha
-            if capture and "TEL" in line:
-                match = re.search(r'TEL:\s*(\d+)', line)
+        match = self._search_tomador(TELEFONE_PATTERN)
         if match:
             return match.group(1)
         return None
-    
+
     def _extract_email(self):
-        lines = self.text.splitlines()
-        capture = False
-        match = None
-        
-        for line in lines:
-            if "TOMADOR DE SERVIÇOS" in line:
-                capture = True  # começa a capturar após essa linha
-            if capture and "E-mail" in line:
-                match = re.search(r'E-mail:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', line)
+        match = self._search_tomador(EMAIL_PATTERN)
         if match:
             return match.group(1)
         return None
 
+    def _search_tomador(self, pattern):
+        """
+        Searches the pattern only in the TOMADOR section, so the Prestador data never leaks into the Tomador.
+        """
+        tomador = self.line_index.scan(PENEDO_SECTIONS).get('TOMADOR')
+        if tomador is None:
+            return None
+        return tomador.search(pattern)
+
 
 if __name__ == "__main__":
     dtoFile = File(
         file_path=Path('static/notas_fiscais/penedo/document.pdf'),
         file_extension='pdf'
     )
-    text = extract_text_from_pdf(dtoFile.file_path)
-    print(text)
-    
     extractor = PenedoFileToTomadorExtractor(dtoFile)
     print(extractor.get_all_extracted_info())
\ No newline at end of file
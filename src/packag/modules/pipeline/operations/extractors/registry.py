@@ -0,0 +1,147 @@
+"""
+Extractor Registry Module
+
+This module defines the registry of the extractor families: the Nota, Prestador and Tomador extractors of each municipality,
+and how the files of the municipality are recognized (see router.py).
+
+Why does it exist?
+The callers had to know if a file came from Arapiraca, Penedo, Maceió or Delmiro and pick its extractors by hand.
+With the registry, the MunicipalityRouter picks them from the file itself,
+and supporting a new municipality is registering its family.
+
+How to use:
+    registry.register(ExtractorFamily(
+        'penedo',
+        FileExtensionEnum.PDF,
+        PenedoFileToNotaExtractor,
+        PenedoFileToPrestadorExtractor,
+        PenedoFileToTomadorExtractor,
+        header_markers=('PENEDO',),
+    ))
+"""
+
+from packag.models.dtoFile import FileExtensionEnum
+
+from packag.modules.pipeline.operations.extractors.fileToNotaExtractor.arapiracaFileToNotaExtractor import ArapiracaFileToNotaExtractor
+from packag.modules.pipeline.operations.extractors.fileToNotaExtractor.delmiroFileToNotaExtractor import DelmiroFileToNotaExtractor
+from packag.modules.pipeline.operations.extractors.fileToNotaExtractor.maceioFileToNotaExtractor import MaceioFileToNotaExtractor
+from packag.modules.pipeline.operations.extractors.fileToNotaExtractor.penedoFileToNotaExtractor import PenedoFileToNotaExtractor
+from packag.modules.pipeline.operations.extractors.fileToPrestadorExtractor.arapiracaFileToPrestadorExtractor import ArapiracaFileToPrestadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToPrestadorExtractor.delmiroFileToPrestadorExtractor import DelmiroFileToPrestadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToPrestadorExtractor.maceioFileToPrestadorExtractor import MaceioFileToPrestadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToPrestadorExtractor.penedoFileToPrestadorExtractor import PenedoFileToPrestadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor.arapiracaFileToTomadorExtractor import ArapiracaFileToTomadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor.delmiroFileToTomadorExtractor import DelmiroFileToTomadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor.maceioFileToTomadorExtractor import MaceioFileToTomadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor.penedoFileToTomadorExtractor import PenedoFileToTomadorExtractor
+
+
+class ExtractorFamily:
+    """
+    The extractors of the NFS-e of a municipality.
+
+    Attributes:
+        municipio: name of the municipality (the key of the family in the registry).
+        file_extension: extension of the NFS-e files of the municipality.
+        nota_extractor, prestador_extractor, tomador_extractor: the extractor classes.
+        namespaces: for XML files, the namespaces of the municipality's XML schema.
+        header_markers: for PDF files, texts of the first page that identify the municipality (e.g. the city name).
+    """
+
+    def __init__(
+        self,
+        municipio: str,
+        file_extension: FileExtensionEnum,
+        nota_extractor,
+        prestador_extractor,
+        tomador_extractor,
+        namespaces=(),
+        header_markers=(),
+    ):
+        if not namespaces and not header_markers:
+            raise ValueError('An extractor family needs namespaces or header_markers to be recognized.')
+
+        self.municipio = municipio
+        self.file_extension = FileExtensionEnum(file_extension)
+        self.nota_extractor = nota_extractor
+        self.prestador_extractor = prestador_extractor
+        self.tomador_extractor = tomador_extractor
+        self.namespaces = frozenset(namespaces)
+        self.header_markers = tuple(marker.casefold() for marker in header_markers)
+
+    @property
+    def extractors(self) -> tuple:
+        return (self.nota_extractor, self.prestador_extractor, self.tomador_extractor)
+
+    def __repr__(self):
+        return f'ExtractorFamily({self.municipio!r})'
+
+
+class ExtractorRegistry:
+    """
+    The registered extractor families, by municipality.
+
+    `version` changes on every registration, so the routing decisions cached before it are not used anymore.
+    """
+
+    def __init__(self):
+        self._families = {}
+        self.version = 0
+
+    def register(self, family: ExtractorFamily):
+        if not isinstance(family, ExtractorFamily):
+            raise ValueError('family must be an ExtractorFamily object')
+
+        if family.municipio in self._families:
+            raise ValueError(f'An extractor family is already registered for {family.municipio}')
+
+        self._families[family.municipio] = family
+        self.version += 1
+
+    def get(self, municipio: str) -> ExtractorFamily:
+        return self._families[municipio]
+
+    def families(self, file_extension: FileExtensionEnum) -> list:
+        """
+        Returns the families of the files with the extension, in registration order.
+        """
+        return [family for family in self._families.values() if family.file_extension == file_extension]
+
+    def __len__(self):
+        return len(self._families)
+
+
+registry = ExtractorRegistry()
+
+registry.register(ExtractorFamily(
+    'arapiraca',
+    FileExtensionEnum.PDF,
+    ArapiracaFileToNotaExtractor,
+    ArapiracaFileToPrestadorExtractor,
+    ArapiracaFileToTomadorExtractor,
+    header_markers=('ARAPIRACA',),
+))
+registry.register(ExtractorFamily(
+    'penedo',
+    FileExtensionEnum.PDF,
+    PenedoFileToNotaExtractor,
+    PenedoFileToPrestadorExtractor,
+    PenedoFileToTomadorExtractor,
+    header_markers=('PENEDO',),
+))
+registry.register(ExtractorFamily(
+    'maceio',
+    FileExtensionEnum.XML,
+    MaceioFileToNotaExtractor,
+    MaceioFileToPrestadorExtractor,
+    MaceioFileToTomadorExtractor,
+    namespaces=('http://www.giss.com.br/tipos-v2_04.xsd',),
+))
+registry.register(ExtractorFamily(
+    'delmiro',
+    FileExtensionEnum.XML,
+    DelmiroFileToNotaExtractor,
+    DelmiroFileToPrestadorExtractor,
+    DelmiroFileToTomadorExtractor,
+    namespaces=('http://www.agili.com.br/nfse_v_1.00.xsd',),
+))
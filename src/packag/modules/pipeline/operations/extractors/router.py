@@ -0,0 +1,207 @@
+"""
+Router Module
+
+This module defines the MunicipalityRouter operation, which picks the extractor family (see registry.py) of a NFS-e file.
+
+Why does it exist?
+The callers had to know the municipality of each file to pick its extractors,
+and a misrouted file failed only after it was fully parsed.
+
+How it works:
+The router computes a cheap fingerprint of the file:
+    * XML: the namespaces declared at the start of the file (only its first bytes are read, the file is not parsed);
+    * PDF: the first lines of the first page, without their digits (the header of the city hall's template).
+      This is not cheap: it costs the full pdfplumber extraction of the first page, as much as the extraction itself.
+      The first page is read through get_document, so it is the same ParsedDocument
+      the PDF extractors (PDF_MAX_PAGES = 1) read next: when the file is extracted after it is routed,
+      it is never parsed twice; routing PDFs without extracting them costs their page-1 extraction.
+The family is found from the fingerprint (a namespace of the family, or the family marker found first on the first page),
+and the decisions taken from the fingerprint alone are cached by fingerprint, so the files of a known template skip the matching.
+
+How to use:
+    family = MunicipalityRouter().run(file)
+    nota = family.nota_extractor(file).run(file)
+"""
+
+import re
+import threading
+
+from collections import OrderedDict
+
+from packag.models import dtoFile
+from packag.models.dtoFile import FileExtensionEnum
+from packag.modules.document_operations import get_document
+from packag.modules.pipeline.operation import Operation
+from packag.modules.pipeline.operations.extractors.registry import ExtractorFamily, ExtractorRegistry, registry
+from packag.modules.pipeline.utils.exceptions import OperationError
+from packag.modules.utils.buffers import read_head
+from packag.modules.utils.logger import get_logger
+from packag.modules.utils.messages import OperationErrorMessage
+
+logger = get_logger('operations')
+
+ROUTE_CACHE_MAX_SIZE = 1024
+
+# the root element and its namespace declarations are at the start of the file
+XML_HEAD_SIZE = 4096
+NAMESPACE_PATTERN = re.compile(rb'xmlns(?::[\w.-]+)?\s*=\s*["\']([^"\']+)["\']')
+
+# the PDF extractors only need the first page, which has the header of the city hall
+PDF_FINGERPRINT_PAGES = 1
+HEADER_LINES = 5
+DIGITS_PATTERN = re.compile(r'\d')
+
+
+class RouteCache:
+    """
+    Keeps the last routing decisions: (registry version, fingerprint) -> municipio.
+    """
+
+    def __init__(self, max_size: int = ROUTE_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self._routes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            municipio = self._routes.get(key)
+
+            if municipio is not None:
+                self._routes.move_to_end(key)
+
+            return municipio
+
+    def set(self, key, municipio: str):
+        with self._lock:
+            self._routes[key] = municipio
+
+            if len(self._routes) > self.max_size:
+                self._routes.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._routes.clear()
+
+    def __len__(self):
+        return len(self._routes)
+
+
+route_cache = RouteCache()
+
+
+def _read_xml_head(file: dtoFile.File) -> bytes:
+    if file.content is not None:
+        return read_head(file.content, XML_HEAD_SIZE)
+
+    with open(file.file_path, 'rb') as xml_file:
+        return xml_file.read(XML_HEAD_SIZE)
+
+
+def get_fingerprint(file: dtoFile.File) -> tuple:
+    """
+    Returns the fingerprint of the file: (extension, namespaces) for XML files, (extension, header lines) for PDFs.
+    The fingerprint of a PDF extracts the text of its first page (kept on its ParsedDocument for the extractors).
+
+    Raises:
+        ValueError: If the extension of the file cannot be routed.
+        FileNotFoundError: If the file does not exist.
+    """
+    if file.file_extension == FileExtensionEnum.XML:
+        namespaces = {namespace.decode('utf-8') for namespace in NAMESPACE_PATTERN.findall(_read_xml_head(file))}
+        return (file.file_extension, tuple(sorted(namespaces)))
+
+    if file.file_extension == FileExtensionEnum.PDF:
+        lines = get_document(file, max_pages=PDF_FINGERPRINT_PAGES).line_index.lines
+        header = [DIGITS_PATTERN.sub('', line).strip() for line in lines if line.strip()][:HEADER_LINES]
+        return (file.file_extension, tuple(header))
+
+    raise ValueError(f'Files with the extension {file.file_extension.value} cannot be routed')
+
+
+class MunicipalityRouter(Operation):
+    """
+    Finds the extractor family of a NFS-e file.
+
+    This operation expects to receive a dtoFile.File object as input,
+    and returns the ExtractorFamily of its municipality.
+    It raises an OperationError if no registered family recognizes the file.
+    """
+
+    def __init__(self, registry: ExtractorRegistry = registry, cache: RouteCache = route_cache):
+        self.registry = registry
+        self.cache = cache
+
+    def _match_xml(self, fingerprint: tuple):
+        namespaces = set(fingerprint[1])
+
+        for family in self.registry.families(FileExtensionEnum.XML):
+            if family.namespaces & namespaces:
+                return family
+
+        return None
+
+    def _find_first_marked_family(self, text: str):
+        """
+        Returns the PDF family whose marker is found first in the text (the city hall is named in the header,
+        before the addresses of the prestador and the tomador), or None.
+        """
+        text = text.casefold()
+        first_position, first_family = None, None
+
+        for family in self.registry.families(FileExtensionEnum.PDF):
+            for marker in family.header_markers:
+                position = text.find(marker)
+
+                if position != -1 and (first_position is None or position < first_position):
+                    first_position, first_family = position, family
+
+        return first_family
+
+    def _match_pdf(self, file: dtoFile.File, fingerprint: tuple):
+        """
+        Returns the family of the PDF, and whether the fingerprint alone decides it (so the decision can be cached).
+        """
+        family = self._find_first_marked_family('\n'.join(fingerprint[1]))
+        if family is not None:
+            return family, True
+
+        # the marker is further down the first page: the decision depends on more than the header, it is not cached
+        return self._find_first_marked_family(get_document(file, max_pages=PDF_FINGERPRINT_PAGES).text), False
+
+    def route(self, file: dtoFile.File) -> ExtractorFamily:
+        fingerprint = get_fingerprint(file)
+        key = (self.registry.version, fingerprint)
+
+        municipio = self.cache.get(key)
+        if municipio is not None:
+            return self.registry.get(municipio)
+
+        if file.file_extension == FileExtensionEnum.XML:
+            family, cacheable = self._match_xml(fingerprint), True
+        else:
+            family, cacheable = self._match_pdf(file, fingerprint)
+
+        if family is None:
+            raise ValueError(f'No extractor family recognizes the file {file.file_path or "in memory"}')
+
+        if cacheable:
+            self.cache.set(key, family.municipio)
+
+        return family
+
+    def run(self, input_data: dtoFile.File) -> ExtractorFamily:
+        try:
+            if not isinstance(input_data, dtoFile.File):
+                raise ValueError(f'Expected a dtoFile.File object, got {type(input_data)} instead')
+
+            return self.route(input_data)
+        except (ValueError, FileNotFoundError, PermissionError) as e:
+            message = OperationErrorMessage(
+                operation_name='MunicipalityRouter',
+                original_exception=e,
+            )
+            logger.error(message.get_message())
+            raise OperationError(
+                message=message,
+                original_exception=e,
+            ) from e
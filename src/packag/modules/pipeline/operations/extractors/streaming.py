@@ -0,0 +1,123 @@
+"""
+Streaming Module
+
+Runs extractors (e.g. ArapiracaFileToNotaExtractor, ArapiracaFileToPrestadorExtractor, ...) over a directory
+or an iterable of NFS-e files, yielding the validated results of one file at a time,
+or over the invoices of a lot XML file, yielding the validated results of one invoice at a time.
+
+Why does it exist?
+On month-end runs there are hundreds of thousands of files.
+Building the list of files and the list of results before writing anything makes the memory grow with the batch.
+Here, the files are built lazily and at most `max_in_flight` files are being extracted and not yet consumed,
+so the memory stays flat whatever the size of the batch.
+
+Example:
+    results = stream_extracted_info(
+        Path('static/notas_fiscais/arapiraca'),
+        [ArapiracaFileToNotaExtractor, ArapiracaFileToPrestadorExtractor, ArapiracaFileToTomadorExtractor],
+        pattern='*.pdf',
+        workers=16,
+        backend='process',
+    )
+    for result in results:
+        if result.ok:
+            nota, prestador, tomador = result.output_data
+
+    results = stream_lot_extracted_info(
+        lot_file,
+        [MaceioFileToNotaExtractor, MaceioFileToPrestadorExtractor, MaceioFileToTomadorExtractor],
+    )
+"""
+
+from functools import partial
+
+from packag.models import dtoFile
+from packag.modules.document_operations.files import iter_files
+from packag.modules.document_operations.xml_stream import iter_element_documents
+from packag.modules.pipeline import batch
+from packag.modules.pipeline.batch import PipelineResult
+from packag.modules.pipeline.operations.extractors.router import MunicipalityRouter
+from packag.modules.utils.logger import get_logger
+
+logger = get_logger('operations')
+
+
+def extract_file(extractor_classes, index, file: dtoFile.File, document=None) -> PipelineResult:
+    """
+    Runs each extractor over the file (or over `document`, an already parsed part of the file).
+    If extractor_classes is None, the Nota, Prestador and Tomador extractors of the file's municipality are run
+    (see router.py).
+    Returns a PipelineResult whose output_data is the list of validated results, in the order of the extractors.
+    If an extractor fails (with an OperationError or any other exception), the error is kept on the result
+    and the next files are still extracted.
+    """
+    extractor_kwargs = {'document': document} if document is not None else {}
+
+    try:
+        if extractor_classes is None:
+            extractor_classes = MunicipalityRouter().run(file).extractors
+
+        output_data = [extractor_cls(file, **extractor_kwargs).run(file) for extractor_cls in extractor_classes]
+    except Exception as e:
+        logger.error(f'Error extracting data from file {file.file_path}: {e!r}')
+        return PipelineResult(index, file, error=e)
+
+    return PipelineResult(index, file, output_data=output_data)
+
+
+def stream_extracted_info(
+    source,
+    extractor_classes,
+    pattern='*',
+    workers=None,
+    backend='serial',
+    max_in_flight=None,
+    max_tasks_per_worker=None,
+    max_worker_memory_mb=None,
+):
+    """
+    Extracts the data of every file of the source, yielding one PipelineResult per file as soon as it is ready.
+
+    Args:
+        source: a directory (str or Path) or an iterable of Path / dtoFile.File objects (see iter_files).
+        extractor_classes: the extractor classes to run over each file, or None to route each file to its municipality.
+        pattern (str): glob pattern used when source is a directory.
+        workers: number of threads or processes. Defaults to the number of CPUs.
+        backend: 'serial', 'thread' or 'process'.
+        max_in_flight: maximum number of files being extracted and not yet consumed. Defaults to twice the workers.
+        max_tasks_per_worker: on the process backend, recycle the workers after this number of files each.
+        max_worker_memory_mb: on the process backend, recycle the workers when one grows by more than this (MB).
+    Returns:
+        A generator of PipelineResult objects, in completion order.
+    """
+    files = iter_files(source, pattern=pattern)
+
+    return batch.iter_map(
+        partial(extract_file, tuple(extractor_classes) if extractor_classes is not None else None),
+        files,
+        workers=workers,
+        backend=backend,
+        max_in_flight=max_in_flight,
+        max_tasks_per_worker=max_tasks_per_worker,
+        max_worker_memory_mb=max_worker_memory_mb,
+        on_error=batch.get_failed_result,
+    )
+
+
+def stream_lot_extracted_info(file: dtoFile.File, extractor_classes, tag='CompNfse'):
+    """
+    Extracts the data of every invoice of a lot XML file (e.g. a monthly GISS export with thousands of CompNfse),
+    yielding one PipelineResult per invoice, in the order of the file.
+
+    The file is streamed (see document_operations.xml_stream), so only the current invoice is kept in memory.
+    The extractor classes must accept a `document` argument (the Maceió and Delmiro XML extractors do).
+
+    Args:
+        file: the lot XML file (on disk or in memory).
+        extractor_classes: the extractor classes to run over each invoice.
+        tag: tag (or local name) of the invoice elements.
+    Returns:
+        A generator of PipelineResult objects; their index is the position of the invoice in the file.
+    """
+    for index, document in enumerate(iter_element_documents(file.source, tag)):
+        yield extract_file(extractor_classes, index, file, document=document)
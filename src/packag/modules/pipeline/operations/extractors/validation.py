@@ -0,0 +1,252 @@
+"""
+Validation Module
+
+This module defines the ValidationPolicy of the extractors: how their outputs are turned into models.
+
+Why does it exist?
+Every output was built with a full pydantic validation (and the cnpj / cpf check of the Prestador and Tomador),
+which costs about as much as the regex extraction itself at our volumes,
+even for the extractors whose outputs are covered by the golden corpus.
+
+How it works:
+A policy has one of three modes:
+    * full: every document is validated (the default);
+    * sampled: 1 in `sample_every` documents is validated, and so is every document missing a required field;
+      the other documents are constructed without validation (no type checks, no model validators);
+    * trusted: every document is constructed without validation.
+The documents are constructed with model_construct (the missing fields get their defaults).
+The normalizers build many rows of the same fields at once with construct_many, which sets the instance attributes
+of pydantic v2 by hand: it only accepts the models without private attributes nor extra fields,
+whose instances it builds exactly as model_construct does (see requirements.txt for the pinned versions).
+The policy counts the documents it built and how many of them it validated (see `stats`).
+
+The outputs of a lot can also be validated in a single call with validate_batch,
+through a TypeAdapter(list[model]) built once per model: it returns the valid models and the errors of the others, by index.
+
+How to use:
+    The mode of every extractor is set by VALIDATION_MODE / VALIDATION_SAMPLE_EVERY
+    (each extractor class has its own policy, so 1 in N documents of each municipality is validated),
+    and the policy of a stable extractor can be set on its class:
+        class MaceioFileToNotaExtractor(FileToNotaExtractor):
+            validation_policy = ValidationPolicy('trusted')
+
+    MaceioFileToNotaExtractor.validation_policy.stats()
+    # {'mode': 'trusted', 'documents': 1000, 'validated': 0, 'constructed': 1000}
+
+    result = validate_batch(dtoNota.NotaExtractedInfo, [extractor.get_all_extracted_info() for extractor in extractors])
+    result.models   # {index: NotaExtractedInfo} of the valid outputs
+    result.errors   # {index: [(field, error message), ...]} of the invalid outputs
+"""
+
+import threading
+
+from functools import lru_cache
+from operator import itemgetter
+from typing import Type
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic import ValidationError as pydantic_ValidationError
+
+from packag.modules.config import VALIDATION_MODE, VALIDATION_SAMPLE_EVERY
+
+VALIDATION_MODES = ('full', 'sampled', 'trusted')
+
+_object_setattr = object.__setattr__
+
+
+@lru_cache(maxsize=None)
+def _get_required_fields_getter(model: Type[BaseModel]):
+    """
+    Returns a function returning the tuple of the values of the required fields of the model in a dict
+    (KeyError if one of them is missing).
+    """
+    required_fields = [name for name, field in model.model_fields.items() if field.is_required()]
+
+    if not required_fields:
+        return lambda output_data: ()
+
+    if len(required_fields) == 1:
+        return lambda output_data: (output_data[required_fields[0]],)
+
+    return itemgetter(*required_fields)
+
+
+def construct(model: Type[BaseModel], output_data: dict) -> BaseModel:
+    """
+    Returns the model of the output without validating it.
+    """
+    return model.model_construct(**output_data)
+
+
+def construct_many(model: Type[BaseModel], field_names: tuple, rows) -> list:
+    """
+    Returns the models of many rows (tuples of the values of field_names) without validating them.
+    Faster than construct for each row when the rows have values for all the fields of the model.
+
+    Raises:
+        ValueError: If field_names are not the fields of the model,
+            or if the model has private attributes or allows extra fields (use construct).
+    """
+    if set(field_names) != set(model.model_fields):
+        raise ValueError(f'field_names must be the fields of {model.__name__}')
+
+    # the instances are built without their private attributes nor their extra fields
+    if model.__private_attributes__ or model.model_config.get('extra') == 'allow':
+        raise ValueError(f'{model.__name__} has private attributes or extra fields: use construct')
+
+    fields_set = set(field_names)
+    new_instance = object.__new__
+
+    instances = []
+    for row in rows:
+        instance = new_instance(model)
+        _object_setattr(instance, '__dict__', dict(zip(field_names, row)))
+        _object_setattr(instance, '__pydantic_fields_set__', fields_set.copy())
+        _object_setattr(instance, '__pydantic_extra__', None)
+        _object_setattr(instance, '__pydantic_private__', None)
+        instances.append(instance)
+
+    return instances
+
+
+class ValidationPolicy:
+    """
+    Builds the models of the extractor outputs, validating all, a sample or none of them.
+
+    Args:
+        mode: 'full', 'sampled' or 'trusted'.
+        sample_every: in sampled mode, 1 in `sample_every` documents is validated.
+
+    Raises:
+        ValueError: If the mode is unknown or sample_every is lower than 1.
+    """
+
+    def __init__(self, mode: str = 'full', sample_every: int = VALIDATION_SAMPLE_EVERY):
+        if mode not in VALIDATION_MODES:
+            raise ValueError(f'mode must be one of {VALIDATION_MODES}, got {mode!r}')
+
+        if sample_every < 1:
+            raise ValueError(f'sample_every must be at least 1, got {sample_every}')
+
+        self.mode = mode
+        self.sample_every = sample_every
+        self._documents = 0
+        self._validated = 0
+        self._lock = threading.Lock()
+
+    def _misses_a_required_field(self, model: Type[BaseModel], output_data: dict) -> bool:
+        try:
+            return None in _get_required_fields_getter(model)(output_data)
+        except KeyError:
+            return True
+
+    def _should_validate(self, model: Type[BaseModel], output_data: dict) -> bool:
+        # the counters are updated under the lock, so the 1 in N sample holds when the extractors run on threads
+        with self._lock:
+            self._documents += 1
+
+            if self.mode == 'full':
+                validate = True
+            elif self.mode == 'trusted':
+                validate = False
+            else:
+                validate = (self._documents - 1) % self.sample_every == 0 \
+                    or self._misses_a_required_field(model, output_data)
+
+            if validate:
+                self._validated += 1
+
+            return validate
+
+    def build(self, model: Type[BaseModel], output_data: dict) -> BaseModel:
+        """
+        Returns the model of the output, validated or not, depending on the mode.
+
+        Raises:
+            pydantic.ValidationError: If the output is validated and is not valid.
+        """
+        if self._should_validate(model, output_data):
+            return model.model_validate(output_data)
+
+        return construct(model, output_data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'mode': self.mode,
+                'documents': self._documents,
+                'validated': self._validated,
+                'constructed': self._documents - self._validated,
+            }
+
+    def reset(self):
+        with self._lock:
+            self._documents = 0
+            self._validated = 0
+
+
+def new_default_policy() -> ValidationPolicy:
+    """
+    Returns a new policy in the mode set by VALIDATION_MODE / VALIDATION_SAMPLE_EVERY.
+    Every extractor class that does not set its own policy gets one (its own sample and its own stats).
+    """
+    return ValidationPolicy(VALIDATION_MODE, VALIDATION_SAMPLE_EVERY)
+
+
+@lru_cache(maxsize=None)
+def get_list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """
+    Returns the TypeAdapter validating a list of the model (its validator is built once per model).
+    """
+    return TypeAdapter(list[model])
+
+
+class BatchValidationResult:
+    """
+    The result of validate_batch.
+
+    Attributes:
+        models: the valid models, by index of their output.
+        errors: the errors of the invalid outputs, by index: a list of (field, error message).
+    """
+
+    def __init__(self, models: dict, errors: dict):
+        self.models = models
+        self.errors = errors
+
+    @property
+    def valid(self) -> list:
+        return list(self.models.values())
+
+    def __repr__(self):
+        return f'BatchValidationResult(models={len(self.models)}, errors={len(self.errors)})'
+
+
+def validate_batch(model: Type[BaseModel], outputs: list) -> BatchValidationResult:
+    """
+    Validates the outputs of many documents (dicts of fields) in one call.
+
+    The whole list is validated at once; if some outputs are invalid,
+    their errors are collected and the other outputs are validated again in one call.
+
+    Raises:
+        ValueError: If outputs is not a list.
+    """
+    if not isinstance(outputs, list):
+        raise ValueError(f'outputs must be a list, got {type(outputs)} instead')
+
+    adapter = get_list_adapter(model)
+
+    try:
+        return BatchValidationResult(dict(enumerate(adapter.validate_python(outputs))), {})
+    except pydantic_ValidationError as e:
+        errors = {}
+        for error in e.errors(include_url=False, include_context=False, include_input=False):
+            index, *loc = error['loc']
+            field = '.'.join(str(part) for part in loc) or None
+            errors.setdefault(index, []).append((field, error['msg']))
+
+    valid_indexes = [index for index in range(len(outputs)) if index not in errors]
+    models = adapter.validate_python([outputs[index] for index in valid_indexes])
+
+    return BatchValidationResult(dict(zip(valid_indexes, models)), errors)
@@ -0,0 +1,119 @@
+"""
+Nota Normalizer Module
+
+This module defines the NotaNormalizer operation, which turns the notas of a lot into typed values (dtoNota.NotaNormalizedInfo).
+
+Why does it exist?
+The extractors return the values as written in the NFS-e ("1.234,56", "MAI/2024", "31/05/2024 - 10:00:00"),
+and each consumer of the notas parsed them on its own, one value at a time.
+
+How it works:
+The notas are parsed by column, with the parsers of the NotaBatch (see models/business/notaBatch.py):
+    * the values are parsed over the characters of the whole column, into centavos,
+      then turned into Decimal reais (one Decimal per distinct value, memoized across the lots);
+      their decimal separator is the comma in the text of the PDF files ("1.234,56") and the dot in the XML files ("1234.56"):
+      NotaNormalizer normalizes the notas of PDF files, XmlNotaNormalizer the notas of XML files;
+    * the aliquota is kept in hundredths of percent: basis points ("2,00%" is 200);
+    * the dates are parsed once per distinct value (data_competencia has a few values per lot);
+      the time of data_emissao is dropped.
+The missing or invalid values are None.
+
+How to use:
+    normalized = NormalizeDataTask(operation_cls=NotaNormalizer).run(notas)
+    normalized[0].valor_total  # Decimal('1234.56')
+
+    normalized = NormalizeDataTask(operation_cls=XmlNotaNormalizer).run(notas_of_xml_files)
+"""
+
+from decimal import Decimal
+from functools import lru_cache
+
+from packag.models.business import dtoNota
+from packag.models.business.notaBatch import (
+    DATE_COLUMNS,
+    DECIMAL_SEPARATORS,
+    MONEY_COLUMNS,
+    NOTA_COLUMNS,
+    get_columns,
+    parse_brl_centavos,
+    parse_dates,
+)
+from packag.modules.pipeline.operation import Operation
+from packag.modules.pipeline.operations.extractors.validation import construct_many
+from packag.modules.pipeline.utils.exceptions import OperationError
+from packag.modules.utils.logger import get_logger
+from packag.modules.utils.messages import OperationErrorMessage
+
+logger = get_logger('operations')
+
+# distinct values in reais kept as Decimal between the lots
+DECIMAL_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=DECIMAL_CACHE_SIZE)
+def centavos_to_decimal(centavos: int) -> Decimal:
+    return Decimal(centavos).scaleb(-2)
+
+
+def _with_missing(values: list, missing) -> list:
+    return [None if is_missing else value for value, is_missing in zip(values, missing.tolist())]
+
+
+class NotaNormalizer(Operation):
+    """
+    Normalizes the notas of a lot.
+
+    This operation expects to receive a list of NotaExtractedInfo models, NotaRecord records or dicts of fields,
+    and returns the list of their dtoNota.NotaNormalizedInfo, in the same order.
+    The notas are extracted from PDF files: their decimal separator is the comma.
+    """
+    # decimal separator of the monetary values of the notas
+    DECIMAL_SEPARATOR = DECIMAL_SEPARATORS['pdf']
+
+    def _validate_input(self, input_data: list) -> list:
+        if not isinstance(input_data, list):
+            raise ValueError(f'Expected a list of notas, got {type(input_data)} instead')
+
+        return input_data
+
+    def _normalize_column(self, name: str, values: list) -> list:
+        if name == 'aliquota':
+            centavos, missing = parse_brl_centavos(values, self.DECIMAL_SEPARATOR)
+            return _with_missing(centavos.tolist(), missing)
+
+        if name in MONEY_COLUMNS:
+            centavos, missing = parse_brl_centavos(values, self.DECIMAL_SEPARATOR)
+            return _with_missing(list(map(centavos_to_decimal, centavos.tolist())), missing)
+
+        if name in DATE_COLUMNS:
+            # NaT is None
+            return parse_dates(values)[0].tolist()
+
+        return values
+
+    def normalize(self, notas: list) -> list:
+        columns = [self._normalize_column(name, values) for name, values in get_columns(notas).items()]
+
+        # the values are typed by the parsers: the models are not validated again
+        return construct_many(dtoNota.NotaNormalizedInfo, NOTA_COLUMNS, zip(*columns))
+
+    def run(self, input_data: list) -> list:
+        try:
+            return self.normalize(self._validate_input(input_data))
+        except (ValueError, AttributeError) as e:
+            message = OperationErrorMessage(
+                operation_name='NotaNormalizer',
+                original_exception=e,
+            )
+            logger.error(message.get_message())
+            raise OperationError(
+                message=message,
+                original_exception=e,
+            ) from e
+
+
+class XmlNotaNormalizer(NotaNormalizer):
+    """
+    Normalizes the notas of a lot of XML files (Maceió, Delmiro Gouveia): their decimal separator is the dot.
+    """
+    DECIMAL_SEPARATOR = DECIMAL_SEPARATORS['xml']
@@ -11,9 +11,12 @@ IMPORTANT:
 
 How it works:
 A pipeline receives a list of tasks.
+The tasks are resolved and validated once, when the pipeline is created, and reused on every run.
 Then, by using the run method, it executes the tasks in order, passing the result of each task to the next one.
 If you want to start the pipeline with some data, you can pass it to the run method as an argument.
 If any task fails, the pipeline stops and raises an exception (PipelineError).
+Inside an event loop, use the arun coroutine instead (see Task.arun).
+To run the pipeline over many inputs (serially, on threads or on processes), use the run_many or iter_many methods.
 For details about Task, see the Task class.
 How to use:
 1. Create a pipeline class that inherits from Pipeline.
@@ -36,6 +39,8 @@ from packag.modules.utils import get_logger
 
 from packag.modules.pipeline.task import Task
 
+from packag.modules.pipeline import batch
+
 from packag.modules.pipeline.utils.exceptions import (
     PipelineError,
     TaskError
@@ -62,6 +67,14 @@ class Pipeline(ABC):
             pipeline_logger.error(message)
             raise PipelineError(message=message, pipeline_name=self.__class__.__name__)
         
+        # validates the operation class of each task once, instead of on every run
+        try:
+            for task in tasks:
+                task.compile()
+        except TaskError as e:
+            pipeline_logger.error(f'Error on pipeline: {e}')
+            raise PipelineError(message=e.message, pipeline_name=self.__class__.__name__, original_exception=e)
+        
         self.tasks = tasks
     
     @abstractmethod
@@ -79,19 +92,87 @@ class Pipeline(ABC):
         """
         pipeline_logger.info(f'Running pipeline: {self.__class__.__name__}')
         
-        tasks = self.get_tasks()
-        
         previous_task_result = input_data
         
         try:
-            for task in tasks:           
+            for task in self.tasks:           
                 previous_task_result = task.run(previous_task_result)
                 
             pipeline_logger.info(f'Pipeline: {self.__class__.__name__} completed successfully')
         except TaskError as e:
             pipeline_logger.error(f'Error on pipeline: {e}')
             raise PipelineError(message=e.message, pipeline_name=self.__class__.__name__, original_exception=e)
-            
+
         return previous_task_result
+
+    async def arun(self, input_data=None, executor=None):
+        """
+        Coroutine version of the run method, to be used inside an event loop.
+        Each task is awaited in order (see Task.arun), so blocking operations run on the executor.
+        Args:
+            input_data: The input data for the pipeline. Can be None
+            executor: The executor of the blocking operations. Defaults to the default executor of the loop.
+        Returns:
+            The result of the last task.
+        """
+        pipeline_logger.info(f'Running pipeline: {self.__class__.__name__}')
+        
+        previous_task_result = input_data
+        
+        try:
+            for task in self.tasks:
+                previous_task_result = await task.arun(previous_task_result, executor=executor)
+                
+            pipeline_logger.info(f'Pipeline: {self.__class__.__name__} completed successfully')
+        except TaskError as e:
+            pipeline_logger.error(f'Error on pipeline: {e}')
+            raise PipelineError(message=e.message, pipeline_name=self.__class__.__name__, original_exception=e)
+
+        return previous_task_result
+
+    def iter_many(self, inputs, workers=None, backend='serial', max_in_flight=None, max_tasks_per_worker=None, max_worker_memory_mb=None):
+        """
+        Runs the pipeline over many inputs, yielding the results as they finish.
+        A failing input does not stop the batch: its error (usually a PipelineError) is kept on its result.
+        The inputs are consumed lazily, so they can be a generator over a huge number of files.
+        Args:
+            inputs: iterable with the input data of each run.
+            workers: number of threads or processes. Defaults to the number of CPUs.
+            backend: 'serial', 'thread' or 'process' (see the batch module).
+            max_in_flight: maximum number of inputs submitted and not yet yielded. Defaults to twice the workers.
+            max_tasks_per_worker: on the process backend, recycle the workers after this number of inputs each.
+            max_worker_memory_mb: on the process backend, recycle the workers when one grows by more than this (MB).
+        Returns:
+            A generator of PipelineResult objects, in completion order.
+        """
+        batch.validate_backend(backend, workers, max_in_flight)
+        batch.validate_recycling(max_tasks_per_worker, max_worker_memory_mb)
+        
+        pipeline_logger.info(f'Running pipeline: {self.__class__.__name__} on the {backend} backend')
+
+        return batch.iter_results(
+            self, inputs, workers=workers, backend=backend, max_in_flight=max_in_flight,
+            max_tasks_per_worker=max_tasks_per_worker, max_worker_memory_mb=max_worker_memory_mb,
+        )
+
+    def run_many(self, inputs, workers=None, backend='serial'):
+        """
+        Runs the pipeline over many inputs.
+        A failing input does not stop the batch: its error (usually a PipelineError) is kept on its result.
+        Args:
+            inputs: iterable with the input data of each run.
+            workers: number of threads or processes. Defaults to the number of CPUs.
+            backend: 'serial', 'thread' or 'process' (see the batch module).
+        Returns:
+            A list of PipelineResult objects, in the order of the inputs.
+        """
+        results = list(self.iter_many(inputs, workers=workers, backend=backend))
+        results.sort(key=lambda result: result.index)
+
+        failed = sum(1 for result in results if not result.ok)
+        if failed:
+            pipeline_logger.error(f'Pipeline: {self.__class__.__name__} failed on {failed} of {len(results)} inputs')
+
+        return results
             
            
@@ -1,3 +1,6 @@
+import asyncio
+import inspect
+
 from abc import ABC, abstractmethod
 from typing import Any, Type
 
@@ -36,6 +39,7 @@ class Task(ABC):
     
     def __init__(self, operation_cls: Type[Operation]):
         self.operation_cls = operation_cls
+        self._compiled_operation_cls = None
         
     @abstractmethod
     def _validate_operation_cls(self, operation_cls: Type[Any]): # pragma: no cover
@@ -115,16 +119,51 @@ class Task(ABC):
             raise ValidationError(message)
     
     
+    def compile(self):
+        """
+        Validates the operation class once, so the next runs do not validate it again.
+        The validation is done again only if the operation class of the task is replaced.
+        It must:
+            * Raise a TaskError if the operation class is not valid.
+            * Return the validated operation class.
+        """
+        try:
+            return self._get_operation_cls()
+        except ValidationError as e:
+            raise self._build_task_error(e) from e
+    
+    def _get_operation_cls(self):
+        compiled = getattr(self, '_compiled_operation_cls', None)
+        
+        if compiled is None or compiled[0] is not self.operation_cls:
+            compiled = (self.operation_cls, self.validate_operation_cls(self.operation_cls))
+            self._compiled_operation_cls = compiled
+        
+        return compiled[1]
+    
+    def _build_task_error(self, e):
+        message = TaskErrorMessage(
+            task_name=self.__class__.__name__,
+            original_exception=e
+        )
+        
+        logger.error(message.get_message())
+        
+        return TaskError(
+            message=message, 
+            original_exception=e
+        )
+    
     def run(self, input_data):
         """
         Run the task by:
             * Validating the input data.
-            * Using the operation class to execute the task by running the operation run method (the class is already validated)
+            * Using the operation class to execute the task by running the operation run method (the class is validated once, see compile)
             * Validating the output data.
             * Returning the output data if it is valid.
         """
         try:
-            operation_cls = self.validate_operation_cls(self.operation_cls)
+            operation_cls = self._get_operation_cls()
             input_data = self.validate_input(input_data)
             
             instance = operation_cls()
@@ -134,16 +173,32 @@ class Task(ABC):
             return output_data
         
         except (ValidationError, OperationError) as e:
+            raise self._build_task_error(e) from e
+    
+    async def arun(self, input_data, executor=None):
+        """
+        Coroutine version of the run method, to be used inside an event loop.
+        
+        The validations are the same of the run method. Then:
+            * If the operation defines an async arun method, it is awaited.
+            * Otherwise, the operation run method is offloaded to the executor (the default executor of the loop if None),
+              so a blocking operation (like a PDF extraction) does not stall the event loop.
+        """
+        try:
+            operation_cls = self._get_operation_cls()
+            input_data = self.validate_input(input_data)
             
-            message = TaskErrorMessage(
-                task_name=self.__class__.__name__,
-                original_exception=e
-            )
+            instance = operation_cls()
             
-            logger.error(message.get_message())
+            if inspect.iscoroutinefunction(getattr(instance, 'arun', None)):
+                output_data = await instance.arun(input_data)
+            else:
+                loop = asyncio.get_running_loop()
+                output_data = await loop.run_in_executor(executor, instance.run, input_data)
             
-            raise TaskError(
-                message=message, 
-                original_exception=e
-            ) from e
+            output_data = self.validate_output(output_data)
+            return output_data
+        
+        except (ValidationError, OperationError) as e:
+            raise self._build_task_error(e) from e
         
\ No newline at end of file
@@ -1 +1,2 @@
-from .extractDataTask import ExtractDataTask
\ No newline at end of file
+from .extractDataTask import ExtractDataTask
+from .normalizeDataTask import NormalizeDataTask
\ No newline at end of file
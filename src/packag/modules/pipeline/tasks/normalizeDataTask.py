@@ -0,0 +1,36 @@
+from packag.modules.pipeline.task import Task
+
+from ..operation import Operation
+
+from typing import Type
+
+
+class NormalizeDataTask(Task):
+    """
+    Normalize the data extracted from a lot of files.
+
+    This task expects to receive a list of extracted objects (e.g. the NotaExtractedInfo of a lot) as input;
+    Then, it uses the operation class, which has to be a subclass of Operation, to normalize the whole list at once.
+    The output is the list of the normalized objects, in the same order.
+    """
+
+    def _validate_operation_cls(self, operation_cls: Type[Operation]):
+        if not isinstance(operation_cls, type):
+            raise TypeError(f"Expected a operation class type, got {type(operation_cls)} instead")
+
+        if not issubclass(operation_cls, Operation):
+            raise TypeError(f"{operation_cls} is not a subclass of Operation")
+
+        return operation_cls
+
+    def _validate_input(self, input_data: list):
+        if not isinstance(input_data, list):
+            raise TypeError(f"Expected a list, got {type(input_data)} instead")
+
+        return input_data
+
+    def _validate_output(self, output_data: list):
+        if not isinstance(output_data, list):
+            raise TypeError(f"Expected a list, got {type(output_data)} instead")
+
+        return output_data
@@ -24,6 +24,11 @@ class PipelineError(Exception):
         full_message = f"Error running pipeline '{pipeline_name}': {message}"
         super().__init__(full_message)
 
+    def __reduce__(self):
+        # the original exception may not be picklable, so only the message is sent between processes
+        message = self.message.get_message() if hasattr(self.message, 'get_message') else self.message
+        return (self.__class__, (message, self.pipeline_name))
+
 
 class TaskError(Exception):
     """
@@ -37,6 +42,14 @@ class TaskError(Exception):
         self.original_exception = original_exception
         
         super().__init__(message.get_message())
+        
+    def __reduce__(self):
+        # the original exception may not be picklable, so it is sent between processes as text
+        message = TaskErrorMessage(
+            task_name=getattr(self.message, 'task_name', None),
+            original_exception=str(getattr(self.message, 'original_exception', self.original_exception)),
+        )
+        return (self.__class__, (message,))
 
 
 class OperationError(Exception):
@@ -51,6 +64,14 @@ class OperationError(Exception):
         self.original_exception = original_exception
         
         super().__init__(message.get_message())
+        
+    def __reduce__(self):
+        # the original exception may not be picklable, so it is sent between processes as text
+        message = OperationErrorMessage(
+            operation_name=getattr(self.message, 'operation_name', None),
+            original_exception=str(getattr(self.message, 'original_exception', self.original_exception)),
+        )
+        return (self.__class__, (message,))
 
 
 class ValidationError(Exception):
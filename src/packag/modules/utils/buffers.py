@@ -0,0 +1,99 @@
+"""
+Buffers Module
+
+This module reads the files that are received in memory (bytes, memoryview, BytesIO, mmap)
+instead of a path on disk.
+
+Why does it exist?
+The invoices come from an object store and a message queue as bytes.
+Writing them to a temporary file only to read them back costs a write and a read per invoice,
+so the loaders (pdfplumber, ElementTree) read them straight from memory.
+
+The large files on disk are memory-mapped (map_file) and read the same way:
+the pages of the file are shared with the OS page cache instead of being copied into a bytes object
+(and then decoded into a str), which doubled the peak memory of each document.
+
+How to use:
+    pdfplumber.open(as_stream(content))  # a binary file object over the content
+    ET.fromstring(as_buffer(content))    # the content as a bytes-like object
+
+    with map_file(Path('lote.xml')) as content:
+        for chunk in iter_chunks(content, 1024 * 1024):
+            parser.feed(chunk)
+"""
+
+import io
+import mmap
+
+from contextlib import contextmanager
+from pathlib import Path
+
+from packag.models.dtoFile import IN_MEMORY_TYPES
+
+
+def is_in_memory(source) -> bool:
+    """
+    Returns True if the source is the content of a file (bytes, bytearray, memoryview, BytesIO or mmap).
+    """
+    return isinstance(source, IN_MEMORY_TYPES)
+
+
+def as_stream(source):
+    """
+    Returns a binary file object reading the content, without copying it when possible.
+
+    BytesIO and mmap objects are already file objects, so they are returned as they are;
+    bytes are shared by the BytesIO until it is written (never, here); bytearray and memoryview are copied.
+    """
+    if isinstance(source, (io.BytesIO, mmap.mmap)):
+        return source
+
+    return io.BytesIO(source)
+
+
+def as_buffer(source):
+    """
+    Returns the content as a bytes-like object (accepted by hashlib, ElementTree and str()), without copying it when possible.
+    """
+    if isinstance(source, io.BytesIO):
+        # the value of a BytesIO built from bytes and never written is that same bytes object
+        return source.getvalue()
+
+    if isinstance(source, mmap.mmap):
+        return memoryview(source)
+
+    return source
+
+
+def read_head(source, size: int) -> bytes:
+    """
+    Returns the first bytes of the content.
+    """
+    return bytes(memoryview(as_buffer(source))[:size])
+
+
+@contextmanager
+def map_file(path: Path):
+    """
+    Memory-maps the file (read only) for the duration of the block.
+    The mapping must not be used after the block; an empty file is yielded as b'' (it cannot be mapped).
+    """
+    with open(path, 'rb') as file:
+        if not file.seek(0, io.SEEK_END):
+            yield b''
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def iter_chunks(source, chunk_size: int):
+    """
+    Yields zero-copy memoryview slices of the content, of at most chunk_size bytes.
+
+    A mmap cannot be closed while a view of it exists: release each chunk (`with chunk:`)
+    and close the generator when stopping early.
+    """
+    with memoryview(as_buffer(source)) as view:
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size]
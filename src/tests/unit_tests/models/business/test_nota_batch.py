@@ -0,0 +1,160 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from packag.models.business.dtoNota import NotaExtractedInfo
+from packag.models.business.formats import parse_date
+from packag.models.business.notaBatch import DECIMAL_SEPARATORS, NotaBatch, parse_brl_centavos, parse_dates
+from packag.models.business.records import NotaRecord
+
+
+def create_nota(numero: str, valor_issqn: str, data_competencia: str) -> dict:
+    return {
+        'numero_nfs': numero, 'codigo_autenticidade': 'ABC', 'data_competencia': data_competencia,
+        'valor_liquido': '1.000,00', 'valor_total': '1.000,00', 'valor_deducoes': '0,00', 'valor_pis': '0,00',
+        'valor_cofins': '0,00', 'valor_inss': '0,00', 'valor_irrf': '0,00', 'valor_csll': '0,00',
+        'valor_issqn': valor_issqn, 'base_calculo': '1.000,00', 'aliquota': '5,00', 'issqn_a_reter': 'NAO',
+        'estado': 'AL', 'codigo_tributacao': '0101', 'discriminacao_servico': 'Servico',
+        'opt_simples_nacional': 'NAO', 'atv_economica': '01.01', 'municipio': 'Penedo',
+    }
+
+
+@pytest.mark.parametrize('value, centavos', [
+    ('1.234,56', 123456),
+    ('R$ 10,00', 1000),
+    ('2,00%', 200),
+    ('0,5', 50),
+    ('5', 500),
+    ('1.234', 123400),
+    ('5.000', 500000),
+    ('1,005', 101),
+    ('-3,20', -320),
+])
+def test_if_parse_brl_centavos_parses_the_values_of_the_text_of_the_pdf_files(value, centavos):
+    parsed, missing = parse_brl_centavos([value])
+
+    assert parsed.dtype == np.int64
+    assert (parsed[0], missing[0]) == (centavos, False)
+
+@pytest.mark.parametrize('value, centavos', [
+    ('1000.00', 100000),
+    ('924.50', 92450),
+    ('5.00', 500),
+    ('5.000', 500),
+    ('5.0000', 500),
+    ('0.0500', 5),
+    ('0', 0),
+])
+def test_if_parse_brl_centavos_parses_the_values_of_the_xml_files(value, centavos):
+    parsed, missing = parse_brl_centavos([value], decimal_separator=DECIMAL_SEPARATORS['xml'])
+
+    assert (parsed[0], missing[0]) == (centavos, False)
+
+def test_if_parse_brl_centavos_parses_each_value_with_its_decimal_separator():
+    values = ['5.000', '5.000', '5,00', None] * 500
+
+    parsed, missing = parse_brl_centavos(values, decimal_separator=[',', '.', ',', '.'] * 500)
+
+    assert parsed[:4].tolist() == [500000, 500, 500, 0]
+    assert missing[:4].tolist() == [False, False, False, True]
+
+@pytest.mark.parametrize('decimal_separator', [';', [','], ['.', ';']])
+def test_if_parse_brl_centavos_raises_value_error_when_the_decimal_separator_is_invalid(decimal_separator):
+    with pytest.raises(ValueError):
+        parse_brl_centavos(['5,00', '5.00'], decimal_separator=decimal_separator)
+
+def test_if_parse_brl_centavos_flags_the_missing_and_invalid_values():
+    parsed, missing = parse_brl_centavos([None, '', 'abc', '1,2,3', '10,00'])
+
+    assert parsed.tolist() == [0, 0, 0, 0, 1000]
+    assert missing.tolist() == [True, True, True, True, False]
+
+    assert parse_brl_centavos(['1.2.3', '10,00'], decimal_separator='.')[1].tolist() == [True, False]
+
+def test_if_parse_brl_centavos_gives_the_same_result_for_columns_of_few_distinct_values():
+    values = ['0,00', '5,00', None] * 1000
+
+    parsed, missing = parse_brl_centavos(values)
+
+    assert parsed[:3].tolist() == [0, 500, 0]
+    assert missing.sum() == 1000
+
+# the dates as the extractors return them (see the tests of the extractors)
+@pytest.mark.parametrize('value, date', [
+    ('01/05/2024', datetime.date(2024, 5, 1)),
+    ('31/05/2024 - 10:00:00', datetime.date(2024, 5, 31)),
+    ('31/05/2024 10:00:00', datetime.date(2024, 5, 31)),
+    ('05/2024', datetime.date(2024, 5, 1)),
+    ('MAI/2024', datetime.date(2024, 5, 1)),
+    ('2024-05-31', datetime.date(2024, 5, 31)),
+    ('2024-05-31T10:00:00', datetime.date(2024, 5, 31)),
+    (None, None),
+])
+def test_if_parse_date_parses_the_dates_of_the_nfse(value, date):
+    assert parse_date(value) == date
+
+def test_if_parse_dates_returns_nat_for_the_invalid_dates():
+    dates, missing = parse_dates(['05/2024', 'xx', None, '31/05/2024 - xx'])
+
+    assert dates.dtype == np.dtype('datetime64[D]')
+    assert missing.tolist() == [False, True, True, True]
+
+    with pytest.raises(ValueError):
+        parse_date('xx')
+
+def test_if_nota_batch_sums_the_issqn_by_prestador_and_by_competencia():
+    notas = [
+        create_nota('1', '10,00', '05/2024'),
+        create_nota('2', '1.000,50', '15/05/2024'),
+        create_nota('3', '2,25', 'JUN/2024'),
+    ]
+
+    batch = NotaBatch.from_notas(notas, prestador_cnpjs=['A', 'B', 'A'])
+
+    assert len(batch) == 3
+    assert batch.total('valor_issqn') == 101275
+    assert batch.total_issqn_by_prestador() == {'A': 1225, 'B': 100050}
+    assert batch.total_issqn_by_competencia() == {datetime.date(2024, 5, 1): 101050, datetime.date(2024, 6, 1): 225}
+
+def test_if_nota_batch_is_built_from_models_records_or_dicts():
+    nota = create_nota('1', '10,00', '05/2024')
+    batches = [
+        NotaBatch.from_notas([nota]),
+        NotaBatch.from_notas([NotaExtractedInfo(**nota)]),
+        NotaBatch.from_notas([NotaRecord.from_dict(nota)]),
+    ]
+
+    for batch in batches:
+        assert batch['valor_total'].tolist() == [100000]
+        assert batch['numero_nfs'].tolist() == ['1']
+        assert batch.missing['valor_outras_retencoes'].tolist() == [True]
+
+def test_if_nota_batch_parses_the_notas_of_xml_files_with_the_dot_as_decimal_separator():
+    nota = dict(
+        create_nota('1779', '50.00', '2024-05-31'),
+        valor_total='1000.00', valor_liquido='924.50', base_calculo='1000.00', aliquota='5.0000',
+    )
+
+    batch = NotaBatch.from_notas([nota], prestador_cnpjs=['A'], decimal_separator='.')
+
+    assert (batch['valor_total'][0], batch['aliquota'][0]) == (100000, 500)
+    assert batch.total_issqn_by_prestador() == {'A': 5000}
+
+def test_if_nota_batch_filters_the_rows():
+    notas = [create_nota(str(numero), f'{numero},00', '05/2024') for numero in range(10)]
+    batch = NotaBatch.from_notas(notas, prestador_cnpjs=['A'] * 10)
+
+    filtered = batch.filter(batch['valor_issqn'] >= 500)
+
+    assert filtered['numero_nfs'].tolist() == ['5', '6', '7', '8', '9']
+    assert filtered.total_issqn_by_prestador() == {'A': 3500}
+
+def test_if_nota_batch_raises_value_error_when_the_column_is_not_monetary_or_unknown():
+    batch = NotaBatch.from_notas([create_nota('1', '10,00', '05/2024')])
+
+    with pytest.raises(ValueError):
+        batch.total('municipio')
+
+    with pytest.raises(ValueError):
+        batch.total_issqn_by_prestador()
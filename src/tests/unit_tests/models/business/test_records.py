@@ -0,0 +1,64 @@
+import sys
+import tracemalloc
+
+import pytest
+
+from packag.models.business.dtoNota import NotaExtractedInfo
+from packag.models.business.dtoTomador import TomadorExtractedInfo
+from packag.models.business.records import NotaRecord, TomadorRecord
+
+
+def create_nota(number: int) -> NotaExtractedInfo:
+    # the values are built at runtime, so they are distinct strings, as the ones returned by the extractors
+    zero = ''.join(['0,', '00'])
+    return NotaExtractedInfo(
+        numero_nfs=str(number), codigo_autenticidade=f'{number:08X}', data_competencia=f'0{number % 9 + 1}/2024',
+        valor_liquido=f'{number},00', valor_total=f'{number},00', valor_deducoes=zero, valor_pis=zero,
+        valor_cofins=zero, valor_inss=zero, valor_irrf=zero, valor_csll=zero, valor_issqn=f'{number % 50},00',
+        base_calculo=f'{number},00', aliquota=''.join(['5,', '00']), issqn_a_reter=''.join(['NA', 'O']),
+        estado=''.join(['A', 'L']), codigo_tributacao=''.join(['01', '01']), discriminacao_servico=f'Servico {number}',
+        opt_simples_nacional=''.join(['NA', 'O']), atv_economica=''.join(['01.', '01']), municipio=''.join(['Pene', 'do']),
+    )
+
+
+def test_if_records_convert_losslessly_to_and_from_the_models():
+    nota = create_nota(1)
+
+    record = NotaRecord.from_model(nota)
+
+    assert record.valor_total == '1,00'
+    assert record.serie is None
+    assert record.to_model() == nota
+    assert NotaRecord.from_dict(record.to_dict()) == record
+
+def test_if_records_intern_the_values_of_low_cardinality():
+    first, second = NotaRecord.from_model(create_nota(1)), NotaRecord.from_model(create_nota(2))
+
+    assert first.municipio is second.municipio is sys.intern('Penedo')
+    assert first.valor_pis is second.valor_inss
+
+def test_if_records_use_less_than_half_of_the_memory_of_the_models():
+    def measure(build) -> int:
+        tracemalloc.start()
+        objects = [build(number) for number in range(2000)]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del objects
+        return size
+
+    models_size = measure(create_nota)
+    records_size = measure(lambda number: NotaRecord.from_model(create_nota(number)))
+
+    assert records_size < models_size / 2
+
+def test_if_records_have_no_instance_dict():
+    record = TomadorRecord.from_dict({'cnpj': '1', 'razao_social': 'Empresa'})
+
+    with pytest.raises(AttributeError):
+        record.__dict__
+
+    assert record.cpf is None
+
+def test_if_from_model_raises_value_error_when_the_model_is_of_another_type():
+    with pytest.raises(ValueError):
+        NotaRecord.from_model(TomadorExtractedInfo(cnpj='1', inscricao_municipal='1', razao_social='a', endereco='a', municipio='a', uf='AL', cep='1'))
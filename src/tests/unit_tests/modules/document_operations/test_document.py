@@ -0,0 +1,179 @@
+import time
+import pytest
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from reportlab.pdfgen import canvas
+
+from packag.models import dtoFile
+from packag.modules.document_operations import document as document_module
+from packag.modules.document_operations import DocumentCache, get_document
+
+
+@pytest.fixture(autouse=True)
+def clear_document_cache():
+    document_module.document_cache.clear()
+    yield
+    document_module.document_cache.clear()
+
+@pytest.fixture
+def pdf_file(tmp_path: Path) -> dtoFile.File:
+    file_path = tmp_path / 'nota.pdf'
+
+    c = canvas.Canvas(str(file_path))
+    c.drawString(100, 750, "Nota Fiscal de Servico")
+    c.save()
+
+    return dtoFile.File(file_path=file_path, file_extension='pdf')
+
+@pytest.fixture
+def xml_file(tmp_path: Path) -> dtoFile.File:
+    file_path = tmp_path / 'nota.xml'
+    file_path.write_text('<Nfse><Numero>342</Numero></Nfse>')
+
+    return dtoFile.File(file_path=file_path, file_extension='xml')
+
+
+def test_if_get_document_raises_value_error_when_file_is_not_a_dto_file():
+    with pytest.raises(ValueError):
+        get_document('not_a_file')
+
+def test_if_get_document_raises_file_not_found_error_when_file_does_not_exist():
+    file = dtoFile.File(file_path=Path('non_existent.pdf'), file_extension='pdf')
+
+    with pytest.raises(FileNotFoundError):
+        get_document(file)
+
+def test_if_get_document_returns_the_same_document_for_the_same_file(pdf_file: dtoFile.File):
+    same_file = dtoFile.File(file_path=pdf_file.file_path, file_extension='pdf')
+
+    assert get_document(pdf_file) is get_document(same_file)
+
+def test_if_pdf_is_parsed_only_once(pdf_file: dtoFile.File, monkeypatch):
+    calls = []
+
+    def fake_extract_text_from_pdf(pdf_path, max_pages=None):
+        calls.append(pdf_path)
+        return 'line 1\nline 2'
+
+    monkeypatch.setattr(document_module, 'extract_text_from_pdf', fake_extract_text_from_pdf)
+
+    for _ in range(3):
+        document = get_document(pdf_file)
+        assert document.text == 'line 1\nline 2'
+        assert document.lines == ['line 1', 'line 2']
+
+    assert len(calls) == 1
+
+
+def test_if_pdf_is_parsed_only_once_when_many_threads_read_the_document(pdf_file: dtoFile.File, monkeypatch):
+    calls = []
+
+    def slow_extract_text_from_pdf(pdf_path, max_pages=None):
+        calls.append(pdf_path)
+        time.sleep(0.05)
+        return 'line 1\nline 2'
+
+    monkeypatch.setattr(document_module, 'extract_text_from_pdf', slow_extract_text_from_pdf)
+
+    document = get_document(pdf_file)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: document.lines, range(8)))
+
+    assert results == [['line 1', 'line 2']] * 8
+    assert len(calls) == 1
+
+def test_if_get_document_reads_only_the_pages_the_extractors_need(pdf_file: dtoFile.File, monkeypatch):
+    calls = []
+
+    def fake_extract_text_from_pdf(pdf_path, max_pages=None):
+        calls.append(max_pages)
+        return 'page 1'
+
+    monkeypatch.setattr(document_module, 'extract_text_from_pdf', fake_extract_text_from_pdf)
+
+    assert get_document(pdf_file, max_pages=1) is not get_document(pdf_file)
+
+    get_document(pdf_file, max_pages=1).text
+    get_document(pdf_file).text
+
+    assert calls == [1, None]
+
+def test_if_document_is_parsed_again_when_the_file_changes(xml_file: dtoFile.File):
+    first_document = get_document(xml_file)
+    assert first_document.root.find('Numero').text == '342'
+
+    xml_file.file_path.write_text('<Nfse><Numero>1779</Numero></Nfse>')
+
+    second_document = get_document(xml_file)
+    assert second_document is not first_document
+    assert second_document.root.find('Numero').text == '1779'
+
+def test_if_root_is_none_when_xml_file_is_empty(tmp_path: Path):
+    file_path = tmp_path / 'empty.xml'
+    file_path.write_text('')
+
+    file = dtoFile.File(file_path=file_path, file_extension='xml')
+
+    assert get_document(file).root is None
+
+def test_if_document_cache_evicts_the_least_recently_used_document(tmp_path: Path):
+    cache = DocumentCache(max_size=2)
+
+    files = []
+    for i in range(3):
+        file_path = tmp_path / f'{i}.xml'
+        file_path.write_text(f'<Nfse>{i}</Nfse>')
+        files.append(dtoFile.File(file_path=file_path, file_extension='xml'))
+
+    first_document = cache.get(files[0])
+    cache.get(files[1])
+    cache.get(files[0])
+    cache.get(files[2])
+
+    assert len(cache) == 2
+    assert cache.get(files[0]) is first_document
+
+def test_if_document_of_a_file_in_memory_is_parsed_without_a_path(pdf_file: dtoFile.File, xml_file: dtoFile.File):
+    pdf_in_memory = dtoFile.File(content=pdf_file.file_path.read_bytes(), file_extension='pdf')
+    xml_in_memory = dtoFile.File(content=memoryview(xml_file.file_path.read_bytes()), file_extension='xml')
+
+    assert get_document(pdf_in_memory).text == get_document(pdf_file).text
+    assert get_document(xml_in_memory).root.find('Numero').text == '342'
+
+def test_if_get_document_returns_the_same_document_for_the_same_content(xml_file: dtoFile.File):
+    content = xml_file.file_path.read_bytes()
+    file = dtoFile.File(content=content, file_extension='xml')
+    same_content = dtoFile.File(content=bytearray(content), file_extension='xml')
+
+    assert get_document(file) is get_document(same_content)
+
+def test_if_file_raises_value_error_when_it_has_neither_path_nor_content():
+    with pytest.raises(ValueError):
+        dtoFile.File(file_extension='pdf')
+
+    with pytest.raises(ValueError):
+        dtoFile.File(content='not bytes', file_extension='pdf')
+
+def test_if_large_files_are_memory_mapped_and_parsed_like_the_small_ones(
+    pdf_file: dtoFile.File, xml_file: dtoFile.File, monkeypatch
+):
+    small_pdf_text, small_xml_text = get_document(pdf_file).text, get_document(xml_file).text
+    document_module.document_cache.clear()
+
+    monkeypatch.setattr(document_module, 'MMAP_MIN_BYTES', 0)
+    monkeypatch.setattr(document_module, 'XML_FEED_CHUNK_SIZE', 4)
+
+    assert get_document(pdf_file).is_mapped
+    assert get_document(pdf_file).text == small_pdf_text
+    assert get_document(xml_file).text == small_xml_text
+    assert get_document(xml_file).root.find('Numero').text == '342'
+
+def test_if_memory_mapped_xml_raises_parse_error_when_it_is_not_valid(tmp_path: Path, monkeypatch):
+    file_path = tmp_path / 'nota.xml'
+    file_path.write_text('<Nfse><Numero>342</Numero>')
+    monkeypatch.setattr(document_module, 'MMAP_MIN_BYTES', 0)
+
+    with pytest.raises(ET.ParseError):
+        get_document(dtoFile.File(file_path=file_path, file_extension='xml')).root
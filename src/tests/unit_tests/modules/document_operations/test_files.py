@@ -0,0 +1,59 @@
+import pytest
+from pathlib import Path
+
+from packag.models import dtoFile
+from packag.modules.document_operations import build_file, iter_files
+
+
+@pytest.fixture
+def invoices_dir(tmp_path: Path) -> Path:
+    (tmp_path / 'arapiraca').mkdir()
+    (tmp_path / 'arapiraca' / '205.pdf').write_bytes(b'%PDF')
+    (tmp_path / 'maceio.XML').write_text('<Nfse/>')
+    (tmp_path / 'notes.md').write_text('not an invoice')
+    return tmp_path
+
+
+def test_if_build_file_uses_the_suffix_as_the_file_extension():
+    file = build_file(Path('maceio/342.XML'))
+
+    assert file.file_path == Path('maceio/342.XML')
+    assert file.file_extension == dtoFile.FileExtensionEnum.XML
+
+def test_if_build_file_raises_value_error_when_extension_is_not_supported():
+    with pytest.raises(ValueError):
+        build_file(Path('notes.md'))
+
+def test_if_iter_files_raises_value_error_when_source_is_not_a_directory(tmp_path: Path):
+    with pytest.raises(ValueError):
+        list(iter_files(tmp_path / 'missing'))
+
+    with pytest.raises(ValueError):
+        list(iter_files(str(tmp_path / 'missing')))
+
+def test_if_iter_files_yields_the_files_of_a_directory_given_as_a_str(invoices_dir: Path):
+    files = list(iter_files(str(invoices_dir), pattern='**/*'))
+
+    assert sorted(file.file_path.name for file in files) == ['205.pdf', 'maceio.XML']
+
+def test_if_iter_files_yields_the_files_of_a_directory_matching_the_pattern(invoices_dir: Path):
+    files = list(iter_files(invoices_dir, pattern='**/*.pdf'))
+
+    assert [file.file_path for file in files] == [invoices_dir / 'arapiraca' / '205.pdf']
+
+def test_if_iter_files_skips_the_files_with_unsupported_extensions(invoices_dir: Path):
+    files = list(iter_files(invoices_dir, pattern='**/*'))
+
+    assert sorted(file.file_extension.value for file in files) == ['pdf', 'xml']
+
+def test_if_iter_files_is_lazy():
+    def paths():
+        yield Path('1.pdf')
+        raise AssertionError('iter_files must not consume the next path before it is requested')
+
+    assert next(iter_files(paths())).file_path == Path('1.pdf')
+
+def test_if_iter_files_accepts_dto_files():
+    file = dtoFile.File(file_path=Path('1.pdf'), file_extension='pdf')
+
+    assert list(iter_files([file])) == [file]
@@ -0,0 +1,70 @@
+from packag.modules.document_operations.line_index import LineIndex, get_line_index
+
+
+TEXT = '\n'.join([
+    'Valor Líquido da Nota',
+    '',
+    '   ',
+    '1.000,00',
+    'PIS  Cofins',
+    '10,00  30,00',
+    'Valor Líquido da Nota',
+])
+
+
+class DummyDocument:
+    def __init__(self, text):
+        self.text = text
+        self.line_index = LineIndex(text)
+
+class DummyExtractor:
+    def __init__(self, text=None, document=None):
+        self.text = text
+        self.document = document
+
+
+def test_if_next_non_empty_skips_empty_and_blank_lines():
+    line_index = LineIndex(TEXT)
+
+    assert line_index.next_non_empty(0) == 3
+    assert line_index.next_non_empty(4) == 5
+    assert line_index.next_non_empty(6) is None
+
+def test_if_lines_with_returns_the_lines_containing_the_keyword():
+    line_index = LineIndex(TEXT)
+
+    assert line_index.lines_with('Valor Líquido da Nota') == [0, 6]
+    assert line_index.lines_with('IRRF') == []
+
+def test_if_first_with_returns_the_first_line_after_the_given_line():
+    line_index = LineIndex(TEXT)
+
+    assert line_index.first_with('Valor Líquido da Nota') == 0
+    assert line_index.first_with('Valor Líquido da Nota', after=0) == 6
+    assert line_index.first_with('Valor Líquido da Nota', after=6) is None
+
+def test_if_index_keywords_indexes_all_the_keywords_at_once():
+    line_index = LineIndex(TEXT)
+
+    line_index.index_keywords(['PIS', 'Cofins'])
+
+    assert line_index._keyword_lines == {'PIS': [4], 'Cofins': [4]}
+
+def test_if_get_line_index_returns_the_index_of_the_document_when_the_extractor_uses_its_text():
+    document = DummyDocument(TEXT)
+
+    nota_extractor = DummyExtractor(document.text, document)
+    tomador_extractor = DummyExtractor(document.text, document)
+
+    assert get_line_index(nota_extractor) is document.line_index
+    assert get_line_index(tomador_extractor) is document.line_index
+
+def test_if_get_line_index_rebuilds_the_index_when_the_text_of_the_extractor_changes():
+    extractor = DummyExtractor('PIS')
+    line_index = get_line_index(extractor)
+
+    assert get_line_index(extractor) is line_index
+
+    extractor.text = 'Cofins'
+
+    assert get_line_index(extractor).lines == ['Cofins']
@@ -0,0 +1,56 @@
+import re
+import pytest
+
+from packag.modules.document_operations.line_index import LineIndex
+from packag.modules.document_operations.scanner import LineScanner
+
+
+LINE_INDEX = LineIndex('\n'.join([
+    'Valor do Serviço  Base de Cálculo',
+    '',
+    '1.000,00  1.000,00',
+    'PIS (R$)  COFINS (R$)',
+    '10,00  30,00',
+]))
+
+
+def test_if_scan_returns_the_lines_matched_by_each_kind_of_pattern():
+    scanner = LineScanner({
+        'servico': 'Valor do Serviço',
+        'numbers': re.compile(r'\d+,\d{2}'),
+        'taxes': lambda line: 'PIS' in line and 'COFINS' in line,
+    })
+
+    hits = scanner.scan(LINE_INDEX)
+
+    assert hits['servico'] == [0]
+    assert hits['numbers'] == [2, 4]
+    assert hits['taxes'] == [3]
+
+def test_if_first_and_first_after_return_none_when_there_is_no_matching_line():
+    hits = LineScanner({'numbers': re.compile(r'\d+,\d{2}'), 'missing': 'ISS'}).scan(LINE_INDEX)
+
+    assert hits.first('numbers') == 2
+    assert hits.first_after('numbers', 2) == 4
+    assert hits.first_after('numbers', 4) is None
+    assert hits.first('missing') is None
+
+def test_if_next_non_empty_skips_the_empty_lines():
+    hits = LineScanner({}).scan(LINE_INDEX)
+
+    assert hits.next_non_empty(0) == 2
+    assert hits.next_non_empty(4) is None
+
+def test_if_line_index_scans_the_lines_only_once_per_scanner():
+    scanner = LineScanner({'servico': 'Valor do Serviço'})
+    line_index = LineIndex('Valor do Serviço')
+
+    assert line_index.scan(scanner) is line_index.scan(scanner)
+
+def test_if_scan_raises_value_error_when_it_does_not_receive_a_line_index():
+    with pytest.raises(ValueError):
+        LineScanner({}).scan(['Valor do Serviço'])
+
+def test_if_line_scanner_raises_value_error_when_a_pattern_is_not_supported():
+    with pytest.raises(ValueError):
+        LineScanner({'invalid': 42})
@@ -0,0 +1,51 @@
+import pytest
+
+from packag.modules.document_operations.line_index import LineIndex
+from packag.modules.document_operations.sections import PENEDO_SECTIONS, SectionSegmenter
+
+
+TEXT = '\n'.join([
+    'PREFEITURA MUNICIPAL DE PENEDO',
+    'PRESTADOR DE SERVIÇOS',
+    'CPF/CNPJ: 11.111.111/0001-11',
+    'UF: AL',
+    'TOMADOR DE SERVIÇOS',
+    'CPF/CNPJ: 22.222.222/0001-22',
+    'DISCRIMINAÇÃO DOS SERVIÇOS',
+    'CONTRATO 123 (MANUTENÇÃO)',
+    'VALOR TOTAL DA NOTA = R$ 1.000,00',
+    'UF: SE',
+])
+
+
+def test_if_scan_gives_each_section_the_lines_until_the_next_heading():
+    sections = PENEDO_SECTIONS.scan(LineIndex(TEXT))
+
+    assert [(name, section.start, section.end) for name, section in sections.items()] == [
+        ('PRESTADOR', 1, 4),
+        ('TOMADOR', 4, 6),
+        ('SERVICO', 6, 8),
+        ('VALORES', 8, 10),
+    ]
+
+def test_if_search_only_looks_at_the_lines_of_the_section():
+    sections = PENEDO_SECTIONS.scan(LineIndex(TEXT))
+
+    assert sections['TOMADOR'].search(r'CPF/CNPJ:\s*(\S+)').group(1) == '22.222.222/0001-22'
+    assert sections['TOMADOR'].search(r'UF:\s*([A-Z]{2})') is None
+    assert sections['PRESTADOR'].search(r'UF:\s*([A-Z]{2})').group(1) == 'AL'
+
+def test_if_scan_leaves_out_the_sections_whose_heading_is_not_found():
+    sections = PENEDO_SECTIONS.scan(LineIndex('TOMADOR DE SERVIÇOS\nCPF/CNPJ: 22.222.222/0001-22'))
+
+    assert list(sections) == ['TOMADOR']
+    assert sections['TOMADOR'].lines == ['TOMADOR DE SERVIÇOS', 'CPF/CNPJ: 22.222.222/0001-22']
+
+def test_if_line_index_segments_the_document_only_once():
+    line_index = LineIndex(TEXT)
+
+    assert line_index.scan(PENEDO_SECTIONS) is line_index.scan(PENEDO_SECTIONS)
+
+def test_if_section_segmenter_raises_value_error_when_headings_are_empty():
+    with pytest.raises(ValueError):
+        SectionSegmenter({})
@@ -0,0 +1,62 @@
+import pytest
+import xml.etree.ElementTree as ET
+
+from packag.modules.document_operations.xml_index import XmlIndex
+
+
+NS = {'ns2': 'http://www.giss.com.br/tipos-v2_04.xsd'}
+
+XML = """<ns2:ConsultarNfseResposta xmlns:ns2="http://www.giss.com.br/tipos-v2_04.xsd">
+    <ns2:CompNfse>
+        <ns2:Nfse>
+            <ns2:InfNfse>
+                <ns2:Numero>342</ns2:Numero>
+                <ns2:PrestadorServico>
+                    <ns2:Endereco><ns2:Uf>AL</ns2:Uf></ns2:Endereco>
+                </ns2:PrestadorServico>
+                <ns2:TomadorServico>
+                    <ns2:Endereco><ns2:Uf>SE</ns2:Uf></ns2:Endereco>
+                </ns2:TomadorServico>
+            </ns2:InfNfse>
+        </ns2:Nfse>
+    </ns2:CompNfse>
+</ns2:ConsultarNfseResposta>"""
+
+
+@pytest.fixture
+def root():
+    return ET.fromstring(XML)
+
+
+@pytest.mark.parametrize('path', [
+    './/ns2:InfNfse/ns2:Numero',
+    './/ns2:Endereco/ns2:Uf',
+    './/ns2:TomadorServico/ns2:Endereco/ns2:Uf',
+    './/ns2:Uf',
+    './/ns2:ConsultarNfseResposta',
+    './/ns2:Missing',
+])
+def test_if_find_returns_the_same_element_as_element_tree(root, path):
+    assert XmlIndex(root).find(path, NS) is root.find(path, NS)
+
+def test_if_find_text_returns_the_text_of_the_element(root):
+    xml_index = XmlIndex(root)
+
+    assert xml_index.find_text('.//ns2:TomadorServico/ns2:Endereco/ns2:Uf', NS) == 'SE'
+    assert xml_index.find_text('.//ns2:Missing', NS) is None
+
+def test_if_find_uses_the_default_namespace_for_tags_without_prefix(root):
+    xml_index = XmlIndex(root)
+
+    assert xml_index.find_text('.//Numero', {'': NS['ns2']}) == '342'
+    assert xml_index.find_text('.//Numero') is None
+
+def test_if_find_delegates_to_element_tree_the_paths_it_does_not_index(root):
+    xml_index = XmlIndex(root)
+
+    assert xml_index.find_text('./ns2:CompNfse/ns2:Nfse/ns2:InfNfse/ns2:Numero', NS) == '342'
+    assert xml_index.find_text('.//ns2:Endereco[ns2:Uf="SE"]/ns2:Uf', NS) == 'SE'
+
+def test_if_find_raises_syntax_error_when_the_prefix_is_unknown(root):
+    with pytest.raises(SyntaxError):
+        XmlIndex(root).find('.//ns9:Numero', NS)
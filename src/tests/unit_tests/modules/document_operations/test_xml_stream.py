@@ -0,0 +1,55 @@
+import pytest
+from pathlib import Path
+
+from packag.modules.document_operations.xml_stream import iter_element_documents, iter_elements
+
+
+NS = {'ns2': 'http://www.giss.com.br/tipos-v2_04.xsd'}
+
+
+@pytest.fixture
+def lot_path(tmp_path: Path) -> Path:
+    invoices = ''.join(
+        f'<ns2:CompNfse><ns2:Nfse><ns2:InfNfse><ns2:Numero>{numero}</ns2:Numero></ns2:InfNfse></ns2:Nfse></ns2:CompNfse>'
+        for numero in range(5)
+    )
+    path = tmp_path / 'lote.xml'
+    path.write_text(
+        f'<ns2:ConsultarNfseResposta xmlns:ns2="{NS["ns2"]}"><ns2:ListaNfse>{invoices}</ns2:ListaNfse></ns2:ConsultarNfseResposta>'
+    )
+    return path
+
+
+def test_if_iter_elements_yields_each_element_with_the_local_name(lot_path: Path):
+    numeros = [element.find('.//ns2:Numero', NS).text for element in iter_elements(lot_path, 'CompNfse')]
+
+    assert numeros == ['0', '1', '2', '3', '4']
+
+def test_if_iter_elements_yields_each_element_with_the_qualified_tag(lot_path: Path):
+    elements = list(iter_elements(lot_path, f'{{{NS["ns2"]}}}CompNfse'))
+
+    assert len(elements) == 5
+
+def test_if_iter_elements_clears_each_element_after_it_is_used(lot_path: Path):
+    elements = iter_elements(lot_path, 'CompNfse')
+    first_element = next(elements)
+
+    assert len(first_element) == 1
+
+    next(elements)
+
+    assert len(first_element) == 0
+
+def test_if_iter_element_documents_yields_documents_read_by_the_xml_extractors(lot_path: Path):
+    documents = iter_element_documents(lot_path, 'CompNfse')
+
+    assert [document.xml_index.find_text('.//ns2:InfNfse/ns2:Numero', NS) for document in documents] == ['0', '1', '2', '3', '4']
+
+def test_if_iter_elements_raises_file_not_found_error_when_the_file_does_not_exist(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        list(iter_elements(tmp_path / 'missing.xml', 'CompNfse'))
+
+def test_if_iter_elements_reads_the_content_of_a_file_in_memory(lot_path: Path):
+    numeros = [element.find('.//ns2:Numero', NS).text for element in iter_elements(lot_path.read_bytes(), 'CompNfse')]
+
+    assert numeros == ['0', '1', '2', '3', '4']
@@ -0,0 +1,105 @@
+import os
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from reportlab.pdfgen import canvas
+
+from packag.modules.pdf_operations import extract_text_from_pdf, PdfTextCache
+
+def create_pdf(file_path: Path, text: str) -> Path:
+    c = canvas.Canvas(str(file_path))
+    c.drawString(100, 750, text)
+    c.save()
+    return file_path
+
+@pytest.fixture
+def cache(tmp_path: Path) -> PdfTextCache:
+    return PdfTextCache(tmp_path / 'cache', max_bytes=1024 * 1024)
+
+@pytest.fixture
+def pdf_file(tmp_path: Path) -> Path:
+    return create_pdf(tmp_path / 'test.pdf', 'Hello, this is a test PDF!')
+
+
+def test_if_pdf_text_cache_raises_value_error_when_cache_dir_is_not_a_path_object():
+    with pytest.raises(ValueError):
+        PdfTextCache('not_a_path', max_bytes=1024)
+
+def test_if_pdf_text_cache_raises_value_error_when_max_bytes_is_not_positive(tmp_path: Path):
+    with pytest.raises(ValueError):
+        PdfTextCache(tmp_path, max_bytes=0)
+
+def test_if_get_returns_none_when_key_is_not_cached(cache: PdfTextCache):
+    assert cache.get('not_cached') is None
+
+def test_if_get_returns_the_stored_text(cache: PdfTextCache):
+    cache.set('key', 'text of the pdf')
+
+    assert cache.get('key') == 'text of the pdf'
+
+def test_if_key_depends_only_on_the_content_of_the_pdf(cache: PdfTextCache, pdf_file: Path, tmp_path: Path):
+    copy_path = tmp_path / 'copy.pdf'
+    copy_path.write_bytes(pdf_file.read_bytes())
+
+    assert cache.get_key(pdf_file) == cache.get_key(copy_path)
+
+def test_if_key_depends_on_the_extraction_parameters(cache: PdfTextCache, pdf_file: Path):
+    assert cache.get_key(pdf_file) != cache.get_key(pdf_file, layout=True)
+
+def test_if_key_depends_on_the_pdfplumber_version(cache: PdfTextCache, pdf_file: Path):
+    key = cache.get_key(pdf_file)
+
+    with patch('pdfplumber.__version__', '0.0.0'):
+        assert cache.get_key(pdf_file) != key
+
+def test_if_evict_removes_the_least_recently_used_entries(tmp_path: Path):
+    cache = PdfTextCache(tmp_path / 'cache', max_bytes=25)
+
+    cache.set('first', 'a' * 10)
+    cache.set('second', 'b' * 10)
+
+    # makes 'first' the most recently used entry
+    first_entry_path = cache.cache_dir / 'first.txt'
+    os.utime(first_entry_path, ns=(first_entry_path.stat().st_atime_ns, first_entry_path.stat().st_mtime_ns + 10**9))
+
+    cache.set('third', 'c' * 10)
+
+    assert cache.get('first') == 'a' * 10
+    assert cache.get('second') is None
+    assert cache.get('third') == 'c' * 10
+
+def test_if_set_scans_the_cache_directory_only_when_it_is_over_its_byte_budget(tmp_path: Path):
+    cache = PdfTextCache(tmp_path / 'cache', max_bytes=25)
+
+    with patch.object(PdfTextCache, 'evict', autospec=True, side_effect=PdfTextCache.evict) as evict:
+        cache.set('first', 'a' * 10)
+        cache.set('second', 'b' * 10)
+        # rewriting an entry does not grow the cache
+        cache.set('second', 'b' * 10)
+
+        # the first write counts the entries of the directory
+        assert evict.call_count == 1
+
+        cache.set('third', 'c' * 10)
+
+        assert evict.call_count == 2
+
+    assert cache.get('first') is None
+    assert cache.get('second') == 'b' * 10
+    assert cache.get('third') == 'c' * 10
+
+def test_if_set_does_not_leave_temporary_files(cache: PdfTextCache):
+    cache.set('key', 'text')
+
+    assert [path.name for path in cache.cache_dir.iterdir()] == ['key.txt']
+
+def test_if_extract_text_from_pdf_reads_the_text_from_the_cache(cache: PdfTextCache, pdf_file: Path):
+    assert extract_text_from_pdf(pdf_file, cache=cache) == 'Hello, this is a test PDF!'
+
+    with patch('pdfplumber.open') as pdfplumber_open:
+        assert extract_text_from_pdf(pdf_file, cache=cache) == 'Hello, this is a test PDF!'
+        pdfplumber_open.assert_not_called()
+
+def test_if_the_key_of_a_pdf_in_memory_is_the_key_of_the_same_pdf_on_disk(cache: PdfTextCache, pdf_file: Path):
+    assert cache.get_key(pdf_file.read_bytes()) == cache.get_key(pdf_file)
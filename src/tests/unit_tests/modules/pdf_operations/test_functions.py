@@ -1,10 +1,13 @@
+import io
+import mmap
 import pytest
 from pathlib import Path
 import stat
 
 from reportlab.pdfgen import canvas
 
-from packag.modules.pdf_operations import extract_text_from_pdf
+from packag.modules.pdf_operations import extract_text_from_pdf, iter_pdf_page_texts
+from packag.modules.pdf_operations import functions as functions_module
 
 @pytest.fixture
 def create_temporary_dir_with_permissions(tmp_path):
@@ -100,6 +103,93 @@ def test_if_extract_text_from_pdf_returns_text_when_pdf_file_has_permissions(
 ):
     text = extract_text_from_pdf(create_temporary_pdf_file_with_permissions)
     assert text == 'Hello, this is a test PDF!'
-        
-        
-        
\ No newline at end of file
+
+@pytest.fixture
+def create_temporary_pdf_file_with_three_pages(tmp_path: Path) -> Path:
+    file_path = tmp_path / "three_pages.pdf"
+
+    c = canvas.Canvas(str(file_path))
+    for page_number in range(1, 4):
+        c.drawString(100, 750, f"Page {page_number}")
+        c.showPage()
+    c.save()
+
+    return file_path
+
+def test_if_extract_text_from_pdf_returns_only_the_first_pages_when_max_pages_is_given(
+    create_temporary_pdf_file_with_three_pages: Path
+):
+    assert extract_text_from_pdf(create_temporary_pdf_file_with_three_pages) == 'Page 1Page 2Page 3'
+    assert extract_text_from_pdf(create_temporary_pdf_file_with_three_pages, max_pages=1) == 'Page 1'
+
+def test_if_extract_text_from_pdf_returns_only_the_selected_pages_when_pages_is_given(
+    create_temporary_pdf_file_with_three_pages: Path
+):
+    assert extract_text_from_pdf(create_temporary_pdf_file_with_three_pages, pages=[3, 1]) == 'Page 1Page 3'
+    assert extract_text_from_pdf(create_temporary_pdf_file_with_three_pages, pages=[2, 3], max_pages=1) == 'Page 2'
+
+@pytest.mark.parametrize('pages, max_pages', [([], None), ([0], None), (['1'], None), (None, 0), (None, '1')])
+def test_if_extract_text_from_pdf_raises_value_error_when_the_page_selection_is_not_valid(
+    create_temporary_pdf_file_with_three_pages: Path, pages, max_pages
+):
+    with pytest.raises(ValueError):
+        extract_text_from_pdf(create_temporary_pdf_file_with_three_pages, pages=pages, max_pages=max_pages)
+
+def test_if_iter_pdf_page_texts_yields_the_text_of_each_page(
+    create_temporary_pdf_file_with_three_pages: Path
+):
+    page_texts = iter_pdf_page_texts(create_temporary_pdf_file_with_three_pages)
+
+    assert next(page_texts) == 'Page 1'
+    assert list(page_texts) == ['Page 2', 'Page 3']
+
+@pytest.mark.parametrize('to_content', [
+    bytes,
+    bytearray,
+    lambda content: memoryview(content),
+    io.BytesIO,
+])
+def test_if_extract_text_from_pdf_reads_the_content_of_a_pdf_in_memory(
+    create_temporary_pdf_file_with_three_pages: Path, to_content
+):
+    content = to_content(create_temporary_pdf_file_with_three_pages.read_bytes())
+
+    assert extract_text_from_pdf(content) == 'Page 1Page 2Page 3'
+    assert extract_text_from_pdf(content, max_pages=1) == 'Page 1'
+
+def test_if_extract_text_from_pdf_reads_a_memory_mapped_pdf(create_temporary_pdf_file_with_three_pages: Path):
+    with open(create_temporary_pdf_file_with_three_pages, 'rb') as pdf_file:
+        with mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            assert extract_text_from_pdf(content, pages=[2]) == 'Page 2'
+
+def test_if_extract_text_from_pdf_raises_value_error_when_the_content_is_not_a_pdf():
+    with pytest.raises(ValueError):
+        extract_text_from_pdf(b'<Nfse><Numero>342</Numero></Nfse>')
+
+@pytest.mark.parametrize('to_content', [lambda path: path, lambda path: path.read_bytes(), lambda path: io.BytesIO(path.read_bytes())])
+def test_if_extract_text_from_pdf_reassembles_the_pages_in_order_when_they_are_extracted_in_parallel(
+    create_temporary_pdf_file_with_three_pages: Path, to_content, monkeypatch
+):
+    monkeypatch.setattr(functions_module, 'PAGE_PARALLEL_MIN_PAGES', 2)
+    content = to_content(create_temporary_pdf_file_with_three_pages)
+
+    assert extract_text_from_pdf(content, page_workers=2) == 'Page 1Page 2Page 3'
+    assert extract_text_from_pdf(content, pages=[3, 2], page_workers=2) == 'Page 2Page 3'
+
+def test_if_extract_text_from_pdf_does_not_count_the_pages_when_the_selection_is_too_short_to_be_split(
+    create_temporary_pdf_file_with_three_pages: Path, monkeypatch
+):
+    def fail_count_pages(pdf_path):
+        raise AssertionError('the pages should not be counted')
+
+    monkeypatch.setattr(functions_module, '_count_pages', fail_count_pages)
+
+    assert extract_text_from_pdf(create_temporary_pdf_file_with_three_pages, max_pages=1, page_workers=2) == 'Page 1'
+    assert extract_text_from_pdf(create_temporary_pdf_file_with_three_pages, pages=[3], page_workers=2) == 'Page 3'
+
+@pytest.mark.parametrize('page_workers', [0, '2'])
+def test_if_extract_text_from_pdf_raises_value_error_when_page_workers_is_not_valid(
+    create_temporary_pdf_file_with_three_pages: Path, page_workers
+):
+    with pytest.raises(ValueError):
+        extract_text_from_pdf(create_temporary_pdf_file_with_three_pages, page_workers=page_workers)
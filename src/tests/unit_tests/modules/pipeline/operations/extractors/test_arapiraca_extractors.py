@@ -0,0 +1,151 @@
+"""
+What should be tested:
+    - The Nota, Prestador and Tomador extractors of Arapiraca return the values of a NFS-e of Arapiraca, field by field.
+
+The text is the text of a NFS-e of Arapiraca as pdfplumber extracts it; the extraction itself is faked.
+"""
+
+import pytest
+from pathlib import Path
+
+from packag.models import dtoFile
+from packag.models.business import dtoNota, dtoPrestador, dtoTomador
+from packag.modules.document_operations import document as document_module
+from packag.modules.pipeline.operations.extractors.fileToNotaExtractor.arapiracaFileToNotaExtractor import ArapiracaFileToNotaExtractor
+from packag.modules.pipeline.operations.extractors.fileToPrestadorExtractor.arapiracaFileToPrestadorExtractor import ArapiracaFileToPrestadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor.arapiracaFileToTomadorExtractor import ArapiracaFileToTomadorExtractor
+
+
+ARAPIRACA_TEXT = """PREFEITURA MUNICIPAL DE ARAPIRACA
+NOTA FISCAL DE SERVIÇOS ELETRÔNICA - NFS-e
+Número da Nota Retenção Simples
+205
+Data/Hora da emissão
+31/05/2024 - 10:00:00
+Código de Verificação
+ABCD.1234.EF56
+Data de Competência: 01/05/2024
+Prestador de Serviços
+EMPRESA PRESTADORA LTDA
+RUA DAS FLORES,
+QUADRA 2, 100
+CENTRO, ARAPIRACA
+CPF/CNPJ 12.345.678/0001-95 Inscrição Municipal 12345
+Cidade ARAPIRACA - AL - BRASIL CEP 57300000
+Email contato@prestadora.com.br
+Optante pelo Simples Nacional
+Tomador de Serviço
+Nome do tomador do serviço MUNICIPIO DE ARAPIRACA
+CPF/CNPJ 98.765.432/0001-10 Inscrição Municipal 54321
+Endereço RUA SAMARITANA, 1185,
+Bairro SANTA EDWIGES, Telefone: (82) 3529-3000
+Cep 57310-245 Email financeiro@arapiraca.al.gov.br
+Discriminação do Serviço
+17.01 - Assessoria ou consultoria de qualquer natureza
+Contrato 012/2024 - Consultoria tributária
+
+Valor do Serviço(R$) Desc.Incond.(R$) Desc.Cond.(R$) Ded.(R$) Base de Cálculo(R$) Alíquota(%) Valor do ISS(R$)
+1.000,00 0,00 0,00 0,00 1.000,00 5,00 50,00
+Dedução(R$) Outras Retenções(R$)
+20,00 5,00
+
+INSS(R$) PIS(R$) Cofins(R$) C.S.L.L(R$) IRRF(R$)
+10,00 6,50 30,00 9,00 15,00
+ISS Retido: NÃO
+Valor Líquido da Nota
+924,50
+VALOR TOTAL DA NOTA = R$ 1.000,00"""
+
+NOTA = {
+    'numero_nfs': '205',
+    'codigo_autenticidade': 'ABCD.1234.EF56',
+    'data_competencia': '01/05/2024',
+    'valor_liquido': '924,50',
+    'valor_total': '1.000,00',
+    'valor_deducoes': '20,00',
+    'valor_pis': '6,50',
+    'valor_cofins': '30,00',
+    'valor_inss': '10,00',
+    'valor_irrf': '15,00',
+    'valor_csll': '9,00',
+    'valor_issqn': '50,00',
+    'base_calculo': '1.000,00',
+    'aliquota': '5,00',
+    'issqn_a_reter': '0',
+    'estado': 'AL',
+    'codigo_tributacao': '17.01',
+    'discriminacao_servico': 'Contrato 012/2024 - Consultoria tributária',
+    'opt_simples_nacional': '1',
+    'serie': None,
+    'nfse_substituida': None,
+    'valor_outras_retencoes': '5,00',
+    'data_emissao': '31/05/2024 - 10:00:00',
+    'atv_economica': '17.01',
+    'municipio': 'Arapiraca',
+}
+
+PRESTADOR = {
+    'cnpj': '12.345.678/0001-95',
+    'cpf': None,
+    'inscricao_municipal': '12345',
+    'razao_social': 'EMPRESA PRESTADORA LTDA',
+    'endereco': 'RUA DAS FLORES, QUADRA 2, 100',
+    'municipio': 'Arapiraca',
+    'uf': 'AL',
+    'cep': '57300000',
+    'numero': '100',
+    'bairro': 'Centro',
+    'telefone': None,
+    'email': 'contato@prestadora.com.br',
+}
+
+TOMADOR = {
+    'cnpj': '98.765.432/0001-10',
+    'cpf': None,
+    'inscricao_municipal': '54321',
+    'razao_social': 'MUNICIPIO DE ARAPIRACA',
+    'endereco': 'RUA SAMARITANA, 1185',
+    'municipio': 'Arapiraca',
+    'uf': 'AL',
+    'cep': '57310245',
+    'numero': None,
+    'bairro': 'SANTA EDWIGES',
+    'telefone': None,
+    'email': 'financeiro@arapiraca.al.gov.br',
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_document_cache():
+    document_module.document_cache.clear()
+    yield
+    document_module.document_cache.clear()
+
+@pytest.fixture
+def arapiraca_file(tmp_path: Path, monkeypatch) -> dtoFile.File:
+    monkeypatch.setattr(document_module, 'extract_text_from_pdf', lambda pdf_path, max_pages=None: ARAPIRACA_TEXT)
+
+    file_path = tmp_path / '205.pdf'
+    file_path.write_bytes(b'%PDF-1.4 arapiraca')
+    return dtoFile.File(file_path=file_path, file_extension='pdf')
+
+
+def test_if_arapiraca_nota_extractor_extracts_every_field(arapiraca_file: dtoFile.File):
+    assert ArapiracaFileToNotaExtractor(arapiraca_file).get_all_extracted_info() == NOTA
+
+def test_if_arapiraca_prestador_extractor_extracts_every_field(arapiraca_file: dtoFile.File):
+    assert ArapiracaFileToPrestadorExtractor(arapiraca_file).get_all_extracted_info() == PRESTADOR
+
+def test_if_arapiraca_tomador_extractor_extracts_every_field(arapiraca_file: dtoFile.File):
+    assert ArapiracaFileToTomadorExtractor(arapiraca_file).get_all_extracted_info() == TOMADOR
+
+def test_if_arapiraca_extractors_return_valid_models(arapiraca_file: dtoFile.File):
+    assert ArapiracaFileToNotaExtractor(arapiraca_file).run(arapiraca_file) == dtoNota.NotaExtractedInfo(**NOTA)
+    assert ArapiracaFileToPrestadorExtractor(arapiraca_file).run(arapiraca_file) == dtoPrestador.PrestadorExtractedInfo(**PRESTADOR)
+    assert ArapiracaFileToTomadorExtractor(arapiraca_file).run(arapiraca_file) == dtoTomador.TomadorExtractedInfo(**TOMADOR)
+
+def test_if_arapiraca_nota_extractor_extracts_the_retained_iss(monkeypatch, arapiraca_file: dtoFile.File):
+    text = ARAPIRACA_TEXT.replace('ISS Retido: NÃO', 'ISS Retido: SIM')
+    monkeypatch.setattr(document_module, 'extract_text_from_pdf', lambda pdf_path, max_pages=None: text)
+
+    assert ArapiracaFileToNotaExtractor(arapiraca_file).get_all_extracted_info(fields=['issqn_a_reter']) == {'issqn_a_reter': '1'}
@@ -0,0 +1,179 @@
+"""
+What should be tested:
+    - The Nota, Prestador and Tomador extractors of Delmiro Gouveia return the values of a NFS-e of Delmiro (Agili XML), field by field.
+"""
+
+import pytest
+
+from packag.models import dtoFile
+from packag.models.business import dtoNfse, dtoNota, dtoPrestador, dtoTomador
+from packag.modules.document_operations import document as document_module
+from packag.modules.pipeline.operations.extractors.fileToNotaExtractor.delmiroFileToNotaExtractor import DelmiroFileToNotaExtractor
+from packag.modules.pipeline.operations.extractors.fileToPrestadorExtractor.delmiroFileToPrestadorExtractor import DelmiroFileToPrestadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor.delmiroFileToTomadorExtractor import DelmiroFileToTomadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToNfseExtractor import FileToNfseExtractor
+from packag.modules.pipeline.operations.extractors.validation import ValidationPolicy
+
+
+DELMIRO_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Nfse xmlns="http://www.agili.com.br/nfse_v_1.00.xsd">
+    <Numero>1779</Numero>
+    <CodigoAutenticidade>9F8E7D6C5B</CodigoAutenticidade>
+    <DataEmissao>2024-05-31</DataEmissao>
+    <IdentificacaoOrgaoGerador>
+        <Municipio><CodigoMunicipioIBGE>2702405</CodigoMunicipioIBGE><Descricao>DELMIRO GOUVEIA</Descricao><Uf>AL</Uf></Municipio>
+    </IdentificacaoOrgaoGerador>
+    <DadosPrestador>
+        <RazaoSocial>EMPRESA PRESTADORA LTDA</RazaoSocial>
+        <NomeFantasia>PRESTADORA</NomeFantasia>
+        <Endereco>
+            <TipoLogradouro>RUA</TipoLogradouro>
+            <Logradouro>DAS FLORES</Logradouro>
+            <Numero>100</Numero>
+            <Bairro>CENTRO</Bairro>
+            <Municipio><CodigoMunicipioIBGE>2702405</CodigoMunicipioIBGE><Descricao>DELMIRO GOUVEIA</Descricao><Uf>AL</Uf></Municipio>
+            <Cep>57480000</Cep>
+        </Endereco>
+    </DadosPrestador>
+    <ValorServicos>1000.00</ValorServicos>
+    <ValorDescontos>20.00</ValorDescontos>
+    <ValorPis>6.50</ValorPis>
+    <ValorCofins>30.00</ValorCofins>
+    <ValorInss>10.00</ValorInss>
+    <ValorIrrf>15.00</ValorIrrf>
+    <ValorCsll>9.00</ValorCsll>
+    <ValorOutrasRetencoes>5.00</ValorOutrasRetencoes>
+    <ValorBaseCalculoISSQN>1000.00</ValorBaseCalculoISSQN>
+    <AliquotaISSQN>5.0000</AliquotaISSQN>
+    <ValorISSQNRecolher>50.00</ValorISSQNRecolher>
+    <ValorLiquido>924.50</ValorLiquido>
+    <ISSQNRetido>0</ISSQNRetido>
+    <OptanteSimplesNacional>1</OptanteSimplesNacional>
+    <DeclaracaoPrestacaoServico>
+        <IdentificacaoPrestador>
+            <CpfCnpj><Cnpj>12345678000195</Cnpj></CpfCnpj>
+            <InscricaoMunicipal>12345</InscricaoMunicipal>
+        </IdentificacaoPrestador>
+        <DadosTomador>
+            <IdentificacaoTomador>
+                <CpfCnpj><Cnpj>98765432000110</Cnpj></CpfCnpj>
+                <InscricaoMunicipal>54321</InscricaoMunicipal>
+            </IdentificacaoTomador>
+            <RazaoSocial>MUNICIPIO DE DELMIRO GOUVEIA</RazaoSocial>
+            <Endereco>
+                <TipoLogradouro>PRACA</TipoLogradouro>
+                <Logradouro>DA MATRIZ</Logradouro>
+                <Numero>1</Numero>
+                <Bairro>CENTRO</Bairro>
+                <Municipio><CodigoMunicipioIBGE>2702405</CodigoMunicipioIBGE><Descricao>DELMIRO GOUVEIA</Descricao><Uf>AL</Uf></Municipio>
+                <Cep>57480001</Cep>
+            </Endereco>
+            <Contato><Telefone>8236411234</Telefone><Email>financeiro@delmirogouveia.al.gov.br</Email></Contato>
+        </DadosTomador>
+        <CodigoAtividadeEconomica>7020400</CodigoAtividadeEconomica>
+        <ListaServico><DadosServico><Discriminacao>Consultoria tributaria</Discriminacao></DadosServico></ListaServico>
+    </DeclaracaoPrestacaoServico>
+</Nfse>"""
+
+NOTA = {
+    'numero_nfs': '1779',
+    'codigo_autenticidade': '9F8E7D6C5B',
+    'data_competencia': '2024-05-31',
+    'valor_liquido': '924.50',
+    'valor_total': '1000.00',
+    'valor_deducoes': '20.00',
+    'valor_pis': '6.50',
+    'valor_cofins': '30.00',
+    'valor_inss': '10.00',
+    'valor_irrf': '15.00',
+    'valor_csll': '9.00',
+    'valor_issqn': '50.00',
+    'base_calculo': '1000.00',
+    'aliquota': '5.0000',
+    'issqn_a_reter': '0',
+    'estado': 'AL',
+    'codigo_tributacao': '7020400',
+    'discriminacao_servico': 'Consultoria tributaria',
+    'opt_simples_nacional': '1',
+    'serie': None,
+    'nfse_substituida': None,
+    'valor_outras_retencoes': '5.00',
+    'data_emissao': '2024-05-31',
+    'atv_economica': '7020400',
+    'municipio': '2702405',
+}
+
+PRESTADOR = {
+    'cnpj': '12345678000195',
+    'cpf': None,
+    'inscricao_municipal': '12345',
+    'razao_social': 'EMPRESA PRESTADORA LTDA',
+    'endereco': 'DAS FLORES',
+    'municipio': 'DELMIRO GOUVEIA',
+    'uf': 'AL',
+    'cep': '57480000',
+    'numero': '100',
+    'bairro': 'CENTRO',
+    'telefone': None,
+    'email': None,
+}
+
+TOMADOR = {
+    'cnpj': '98765432000110',
+    'cpf': None,
+    'inscricao_municipal': '54321',
+    'razao_social': 'MUNICIPIO DE DELMIRO GOUVEIA',
+    'endereco': 'PRACA DA MATRIZ',
+    'municipio': 'DELMIRO GOUVEIA',
+    'uf': 'AL',
+    'cep': '57480001',
+    'numero': '1',
+    'bairro': 'CENTRO',
+    'telefone': '8236411234',
+    'email': 'financeiro@delmirogouveia.al.gov.br',
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_document_cache():
+    document_module.document_cache.clear()
+    yield
+    document_module.document_cache.clear()
+
+@pytest.fixture
+def delmiro_file() -> dtoFile.File:
+    return dtoFile.File(content=DELMIRO_XML.encode('utf-8'), file_extension='xml')
+
+
+def test_if_delmiro_nota_extractor_extracts_every_field(delmiro_file: dtoFile.File):
+    assert DelmiroFileToNotaExtractor(delmiro_file).get_all_extracted_info() == NOTA
+
+def test_if_delmiro_prestador_extractor_extracts_every_field(delmiro_file: dtoFile.File):
+    assert DelmiroFileToPrestadorExtractor(delmiro_file).get_all_extracted_info() == PRESTADOR
+
+def test_if_delmiro_tomador_extractor_extracts_every_field(delmiro_file: dtoFile.File):
+    assert DelmiroFileToTomadorExtractor(delmiro_file).get_all_extracted_info() == TOMADOR
+
+def test_if_delmiro_extractors_return_valid_models(delmiro_file: dtoFile.File):
+    assert DelmiroFileToNotaExtractor(delmiro_file).run(delmiro_file) == dtoNota.NotaExtractedInfo(**NOTA)
+    assert DelmiroFileToPrestadorExtractor(delmiro_file).run(delmiro_file) == dtoPrestador.PrestadorExtractedInfo(**PRESTADOR)
+    assert DelmiroFileToTomadorExtractor(delmiro_file).run(delmiro_file) == dtoTomador.TomadorExtractedInfo(**TOMADOR)
+
+def test_if_the_nfse_extractor_builds_each_block_with_the_validation_policy_of_its_extractor(delmiro_file: dtoFile.File, monkeypatch):
+    policies = {
+        DelmiroFileToNotaExtractor: ValidationPolicy('full'),
+        DelmiroFileToPrestadorExtractor: ValidationPolicy('trusted'),
+        DelmiroFileToTomadorExtractor: ValidationPolicy('trusted'),
+    }
+    for extractor_cls, policy in policies.items():
+        monkeypatch.setattr(extractor_cls, 'validation_policy', policy)
+
+    nfse = FileToNfseExtractor(delmiro_file).run(delmiro_file)
+
+    assert nfse == dtoNfse.NfseExtractedInfo(
+        nota=dtoNota.NotaExtractedInfo(**NOTA),
+        prestador=dtoPrestador.PrestadorExtractedInfo(**PRESTADOR),
+        tomador=dtoTomador.TomadorExtractedInfo(**TOMADOR),
+    )
+    assert [policy.stats()['validated'] for policy in policies.values()] == [1, 0, 0]
+    assert [policy.stats()['constructed'] for policy in policies.values()] == [0, 1, 1]
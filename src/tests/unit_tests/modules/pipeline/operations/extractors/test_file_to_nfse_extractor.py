@@ -0,0 +1,97 @@
+import pytest
+from pathlib import Path
+
+from pydantic import ValidationError as pydantic_ValidationError
+
+from packag.models import dtoFile
+from packag.models.business import dtoNfse, dtoNota, dtoPrestador, dtoTomador
+from packag.modules.pipeline.operations.extractors.fileToNfseExtractor import FileToNfseExtractor
+from packag.modules.pipeline.operations.extractors.registry import ExtractorFamily
+from packag.modules.pipeline.utils.exceptions import OperationError, ValidationError
+from packag.modules.utils.messages import ValidationErrorMessages
+
+
+NOTA = {
+    'numero_nfs': '342', 'codigo_autenticidade': 'ABC', 'data_competencia': '2025-01-01',
+    'valor_liquido': '100,00', 'valor_total': '100,00', 'valor_deducoes': '0,00', 'valor_pis': '0,00',
+    'valor_cofins': '0,00', 'valor_inss': '0,00', 'valor_irrf': '0,00', 'valor_csll': '0,00',
+    'valor_issqn': '5,00', 'base_calculo': '100,00', 'aliquota': '5', 'issqn_a_reter': 'NAO',
+    'estado': 'AL', 'codigo_tributacao': '0101', 'discriminacao_servico': 'Servico',
+    'opt_simples_nacional': 'NAO', 'atv_economica': '01.01', 'municipio': 'Penedo',
+}
+PESSOA = {
+    'cnpj': '12.345.678/0001-90', 'inscricao_municipal': '123', 'razao_social': 'Empresa',
+    'endereco': 'Rua A', 'municipio': 'Penedo', 'uf': 'AL', 'cep': '57200000',
+}
+
+
+class FakeExtractor:
+    MODEL = None
+
+    def __init__(self, file, document=None):
+        self.document = document
+
+    def validate_output(self, output_data: dict):
+        try:
+            return self.MODEL(**output_data)
+        except pydantic_ValidationError:
+            raise ValidationError(ValidationErrorMessages('validate_output', 'output_data', type(output_data)))
+
+class FakeNotaExtractor(FakeExtractor):
+    MODEL = dtoNota.NotaExtractedInfo
+
+    def get_all_extracted_info(self):
+        return dict(NOTA, numero_nfs=self.document or NOTA['numero_nfs'])
+
+class FakePessoaExtractor(FakeExtractor):
+    MODEL = dtoPrestador.PrestadorExtractedInfo
+
+    def get_all_extracted_info(self):
+        return dict(PESSOA)
+
+class FakeTomadorExtractor(FakePessoaExtractor):
+    MODEL = dtoTomador.TomadorExtractedInfo
+
+class InvalidPessoaExtractor(FakeTomadorExtractor):
+    def get_all_extracted_info(self):
+        return dict(PESSOA, cnpj=None)
+
+
+@pytest.fixture
+def file() -> dtoFile.File:
+    return dtoFile.File(file_path=Path('nota.pdf'), file_extension='pdf')
+
+
+def test_if_run_returns_the_nota_prestador_and_tomador_validated_in_one_record(file: dtoFile.File):
+    family = ExtractorFamily('fake', 'pdf', FakeNotaExtractor, FakePessoaExtractor, FakeTomadorExtractor, header_markers=('FAKE',))
+
+    nfse = FileToNfseExtractor(file, family=family).run(file)
+
+    assert isinstance(nfse, dtoNfse.NfseExtractedInfo)
+    assert nfse.nota.numero_nfs == '342'
+    assert nfse.prestador.razao_social == nfse.tomador.razao_social == 'Empresa'
+
+def test_if_run_gives_the_document_to_the_extractors(file: dtoFile.File):
+    family = ExtractorFamily('fake', 'pdf', FakeNotaExtractor, FakePessoaExtractor, FakeTomadorExtractor, header_markers=('FAKE',))
+
+    nfse = FileToNfseExtractor(file, family=family, document='999').run(file)
+
+    assert nfse.nota.numero_nfs == '999'
+
+def test_if_run_raises_operation_error_when_a_block_is_not_valid(file: dtoFile.File):
+    family = ExtractorFamily('fake', 'pdf', FakeNotaExtractor, FakePessoaExtractor, InvalidPessoaExtractor, header_markers=('FAKE',))
+
+    with pytest.raises(OperationError):
+        FileToNfseExtractor(file, family=family).run(file)
+
+def test_if_run_raises_operation_error_when_input_is_not_a_file(file: dtoFile.File):
+    family = ExtractorFamily('fake', 'pdf', FakeNotaExtractor, FakePessoaExtractor, FakeTomadorExtractor, header_markers=('FAKE',))
+
+    with pytest.raises(OperationError):
+        FileToNfseExtractor(file, family=family).run('not_a_file')
+
+def test_if_run_raises_operation_error_when_no_municipality_recognizes_the_file(tmp_path: Path):
+    file = dtoFile.File(content=b'<Nfse xmlns="http://www.example.com/nfse.xsd"/>', file_extension='xml')
+
+    with pytest.raises(OperationError):
+        FileToNfseExtractor(file).run(file)
@@ -0,0 +1,170 @@
+"""
+What should be tested:
+    - The Nota, Prestador and Tomador extractors of Maceió return the values of a NFS-e of Maceió (GISS XML), field by field.
+"""
+
+import pytest
+
+from packag.models import dtoFile
+from packag.models.business import dtoNota, dtoPrestador
+from packag.modules.document_operations import document as document_module
+from packag.modules.pipeline.operations.extractors.fileToNotaExtractor.maceioFileToNotaExtractor import MaceioFileToNotaExtractor
+from packag.modules.pipeline.operations.extractors.fileToPrestadorExtractor.maceioFileToPrestadorExtractor import MaceioFileToPrestadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor.maceioFileToTomadorExtractor import MaceioFileToTomadorExtractor
+
+
+MACEIO_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<ns2:ConsultarNfseResposta xmlns:ns2="http://www.giss.com.br/tipos-v2_04.xsd" xmlns:ns3="http://www.w3.org/2000/09/xmldsig#">
+<ns2:ListaNfse><ns2:CompNfse><ns2:Nfse versao="2.04"><ns2:InfNfse Id="nfse342">
+    <ns2:Numero>342</ns2:Numero>
+    <ns2:CodigoVerificacao>A1B2C3D4E</ns2:CodigoVerificacao>
+    <ns2:DataEmissao>2024-05-31T10:00:00</ns2:DataEmissao>
+    <ns2:ValoresNfse>
+        <ns2:BaseCalculo>1000.00</ns2:BaseCalculo>
+        <ns2:Aliquota>5.00</ns2:Aliquota>
+        <ns2:ValorIss>50.00</ns2:ValorIss>
+        <ns2:ValorLiquidoNfse>924.50</ns2:ValorLiquidoNfse>
+    </ns2:ValoresNfse>
+    <ns2:PrestadorServico>
+        <ns2:RazaoSocial>EMPRESA PRESTADORA LTDA</ns2:RazaoSocial>
+        <ns2:InscricaoMunicipal>12345</ns2:InscricaoMunicipal>
+        <ns2:Endereco>
+            <ns2:Endereco>RUA DAS FLORES</ns2:Endereco>
+            <ns2:Numero>100</ns2:Numero>
+            <ns2:Bairro>PONTA VERDE</ns2:Bairro>
+            <ns2:CodigoMunicipio>2704302</ns2:CodigoMunicipio>
+            <ns2:Uf>AL</ns2:Uf>
+            <ns2:Cep>57035000</ns2:Cep>
+        </ns2:Endereco>
+        <ns2:Contato><ns2:Telefone>8233334444</ns2:Telefone><ns2:Email>contato@prestadora.com.br</ns2:Email></ns2:Contato>
+    </ns2:PrestadorServico>
+    <ns2:DeclaracaoPrestacaoServico><ns2:InfDeclaracaoPrestacaoServico>
+        <ns2:Competencia>2024-05-01</ns2:Competencia>
+        <ns2:Servico>
+            <ns2:Valores>
+                <ns2:ValorServicos>1000.00</ns2:ValorServicos>
+                <ns2:ValorDeducoes>20.00</ns2:ValorDeducoes>
+                <ns2:ValorPis>6.50</ns2:ValorPis>
+                <ns2:ValorCofins>30.00</ns2:ValorCofins>
+                <ns2:ValorInss>10.00</ns2:ValorInss>
+                <ns2:ValorIr>15.00</ns2:ValorIr>
+                <ns2:ValorCsll>9.00</ns2:ValorCsll>
+                <ns2:OutrasRetencoes>5.00</ns2:OutrasRetencoes>
+            </ns2:Valores>
+            <ns2:IssRetido>2</ns2:IssRetido>
+            <ns2:ItemListaServico>17.01</ns2:ItemListaServico>
+            <ns2:CodigoTributacaoMunicipio>170101</ns2:CodigoTributacaoMunicipio>
+            <ns2:Discriminacao>Consultoria tributaria</ns2:Discriminacao>
+        </ns2:Servico>
+        <ns2:Prestador><ns2:CpfCnpj><ns2:Cnpj>12345678000195</ns2:Cnpj></ns2:CpfCnpj></ns2:Prestador>
+        <ns2:TomadorServico>
+            <ns2:IdentificacaoTomador>
+                <ns2:CpfCnpj><ns2:Cnpj>98765432000110</ns2:Cnpj></ns2:CpfCnpj>
+                <ns2:InscricaoMunicipal>54321</ns2:InscricaoMunicipal>
+            </ns2:IdentificacaoTomador>
+            <ns2:RazaoSocial>MUNICIPIO DE MACEIO</ns2:RazaoSocial>
+            <ns2:Endereco>
+                <ns2:Endereco>RUA SA E ALBUQUERQUE</ns2:Endereco>
+                <ns2:Numero>235</ns2:Numero>
+                <ns2:Bairro>JARAGUA</ns2:Bairro>
+                <ns2:CodigoMunicipio>2704302</ns2:CodigoMunicipio>
+                <ns2:Uf>AL</ns2:Uf>
+                <ns2:Cep>57022180</ns2:Cep>
+            </ns2:Endereco>
+            <ns2:Contato><ns2:Telefone>8231234567</ns2:Telefone><ns2:Email>financeiro@maceio.al.gov.br</ns2:Email></ns2:Contato>
+        </ns2:TomadorServico>
+        <ns2:OptanteSimplesNacional>2</ns2:OptanteSimplesNacional>
+    </ns2:InfDeclaracaoPrestacaoServico></ns2:DeclaracaoPrestacaoServico>
+</ns2:InfNfse></ns2:Nfse></ns2:CompNfse></ns2:ListaNfse>
+</ns2:ConsultarNfseResposta>"""
+
+NOTA = {
+    'numero_nfs': '342',
+    'codigo_autenticidade': 'A1B2C3D4E',
+    'data_competencia': '2024-05-01',
+    'valor_liquido': '924.50',
+    'valor_total': '1000.00',
+    'valor_deducoes': '20.00',
+    'valor_pis': '6.50',
+    'valor_cofins': '30.00',
+    'valor_inss': '10.00',
+    'valor_irrf': '15.00',
+    'valor_csll': '9.00',
+    'valor_issqn': '50.00',
+    'base_calculo': '1000.00',
+    'aliquota': '5.00',
+    'issqn_a_reter': '2',
+    'estado': 'AL',
+    'codigo_tributacao': '170101',
+    'discriminacao_servico': 'Consultoria tributaria',
+    'opt_simples_nacional': '2',
+    'serie': None,
+    'nfse_substituida': None,
+    'valor_outras_retencoes': '5.00',
+    'data_emissao': '2024-05-31T10:00:00',
+    'atv_economica': '17.01',
+    'municipio': '2704302',
+}
+
+PRESTADOR = {
+    'cnpj': '12345678000195',
+    'cpf': None,
+    'inscricao_municipal': '12345',
+    'razao_social': 'EMPRESA PRESTADORA LTDA',
+    'endereco': 'RUA DAS FLORES',
+    'municipio': '2704302',
+    'uf': 'AL',
+    'cep': '57035000',
+    'numero': '100',
+    'bairro': 'PONTA VERDE',
+    'telefone': '8233334444',
+    'email': 'contato@prestadora.com.br',
+}
+
+# the endereco of the Tomador of Maceió is returned with all the address fields
+TOMADOR = {
+    'cnpj': '98765432000110',
+    'cpf': None,
+    'inscricao_municipal': '54321',
+    'razao_social': 'MUNICIPIO DE MACEIO',
+    'endereco': {
+        'endereco': 'RUA SA E ALBUQUERQUE',
+        'numero': '235',
+        'bairro': 'JARAGUA',
+        'municipio': '2704302',
+        'uf': 'AL',
+        'cep': '57022180',
+    },
+    'municipio': '2704302',
+    'uf': 'AL',
+    'cep': '57022180',
+    'numero': '235',
+    'bairro': 'JARAGUA',
+    'telefone': '8231234567',
+    'email': 'financeiro@maceio.al.gov.br',
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_document_cache():
+    document_module.document_cache.clear()
+    yield
+    document_module.document_cache.clear()
+
+@pytest.fixture
+def maceio_file() -> dtoFile.File:
+    return dtoFile.File(content=MACEIO_XML.encode('utf-8'), file_extension='xml')
+
+
+def test_if_maceio_nota_extractor_extracts_every_field(maceio_file: dtoFile.File):
+    assert MaceioFileToNotaExtractor(maceio_file).get_all_extracted_info() == NOTA
+
+def test_if_maceio_prestador_extractor_extracts_every_field(maceio_file: dtoFile.File):
+    assert MaceioFileToPrestadorExtractor(maceio_file).get_all_extracted_info() == PRESTADOR
+
+def test_if_maceio_tomador_extractor_extracts_every_field(maceio_file: dtoFile.File):
+    assert MaceioFileToTomadorExtractor(maceio_file).get_all_extracted_info() == TOMADOR
+
+def test_if_maceio_extractors_return_valid_models(maceio_file: dtoFile.File):
+    assert MaceioFileToNotaExtractor(maceio_file).run(maceio_file) == dtoNota.NotaExtractedInfo(**NOTA)
+    assert MaceioFileToPrestadorExtractor(maceio_file).run(maceio_file) == dtoPrestador.PrestadorExtractedInfo(**PRESTADOR)
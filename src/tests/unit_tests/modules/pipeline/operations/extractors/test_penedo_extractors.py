@@ -0,0 +1,178 @@
+"""
+What should be tested:
+    - The Nota, Prestador and Tomador extractors of Penedo return the values of a NFS-e of Penedo, field by field.
+    - The Nota extractor of Penedo extracts any single field first (a projection), reading the document on demand.
+
+The text is the text of a NFS-e of Penedo as pdfplumber extracts it; the extraction itself is faked.
+"""
+
+import pytest
+from pathlib import Path
+
+from packag.models import dtoFile
+from packag.models.business import dtoNota, dtoPrestador, dtoTomador
+from packag.modules.document_operations import document as document_module
+from packag.modules.pipeline.operations.extractors.fileToNotaExtractor.penedoFileToNotaExtractor import PenedoFileToNotaExtractor
+from packag.modules.pipeline.operations.extractors.fileToPrestadorExtractor.penedoFileToPrestadorExtractor import PenedoFileToPrestadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor.penedoFileToTomadorExtractor import PenedoFileToTomadorExtractor
+from packag.modules.pipeline.utils.exceptions import OperationError
+
+
+PENEDO_TEXT = """PREFEITURA MUNICIPAL DE PENEDO
+Nota Fiscal de Serviços Eletrônica - NFS-e
+Competência: MAI/2024
+Número da Nota:
+00001234
+Data e Hora Emissão:
+31/05/2024 10:00:00
+Código de Verificação: AB12-CD34
+PRESTADOR DE SERVIÇOS
+Nome/Razão Social: EMPRESA PRESTADORA LTDA
+CPF/CNPJ: 12.345.678/0001-95 Inscrição Municipal: 12345
+Endereço: RUA DAS FLORES, 100, CENTRO
+Municipio: PENEDO UF: AL CEP: 57200000
+TEL: 82999990000 E-mail: contato@prestadora.com.br
+Optante pelo Simples Nacional
+TOMADOR DE SERVIÇOS
+Nome/Razão Social: MUNICIPIO DE PENEDO
+CPF/CNPJ: 98.765.432/0001-10 Inscrição Municipal: 54321
+Endereço: PRACA BARAO DE PENEDO, S/N
+Municipio: PENEDO UF: AL CEP: 57200001
+TEL: 8233334444 E-mail: financeiro@penedo.al.gov.br
+DISCRIMINAÇÃO DOS SERVIÇOS
+CONTRATO 012/2024 - MANUTENCAO PREDIAL (PROCESSO 123/2024)
+VALOR TOTAL DA NOTA = R$ 1.000,00
+Código CNAE:
+4321500
+
+0702 - Execução de obras de construção civil
+Município de Incidência do ISS:
+PENEDO - AL
+Valor do Serviço (R$) Desconto (R$) Base de Cálculo (R$) Alíquota (%)
+1.000,00 0,00 1.000,00 5,00
+Valor do ISS (R$) 50,00
+ISS Retido: NÃO
+COFINS (R$) INSS (R$) PIS (R$) CSLL (R$) IRRF (R$)
+30,00 10,00 6,50 9,00 15,00
+Outras Retenções(R$) 5,00
+Valor Liquido (R$) Deduções (R$)
+924,50 20,00"""
+
+NOTA = {
+    'numero_nfs': '00001234',
+    'codigo_autenticidade': 'AB12-CD34',
+    'data_competencia': 'MAI/2024',
+    'valor_liquido': '924,50',
+    'valor_total': '1.000,00',
+    'valor_deducoes': '20,00',
+    'valor_pis': '6,50',
+    'valor_cofins': '30,00',
+    'valor_inss': '10,00',
+    'valor_irrf': '15,00',
+    'valor_csll': '9,00',
+    'valor_issqn': '50,00',
+    'base_calculo': '1.000,00',
+    'aliquota': '5,00',
+    'issqn_a_reter': '0',
+    'estado': 'AL',
+    'codigo_tributacao': '4321500',
+    'discriminacao_servico': 'CONTRATO 012/2024 - MANUTENCAO PREDIAL (PROCESSO 123/2024)',
+    'opt_simples_nacional': '1',
+    'serie': None,
+    'nfse_substituida': None,
+    'valor_outras_retencoes': '5,00',
+    'data_emissao': '31/05/2024 10:00:00',
+    'atv_economica': '0702',
+    'municipio': 'Penedo',
+}
+
+PRESTADOR = {
+    'cnpj': '12.345.678/0001-95',
+    'cpf': None,
+    'inscricao_municipal': '12345',
+    'razao_social': 'EMPRESA PRESTADORA LTDA',
+    'endereco': 'RUA DAS FLORES, 100, CENTRO',
+    'municipio': 'Penedo',
+    'uf': 'AL',
+    'cep': '57200000',
+    'numero': None,
+    'bairro': None,
+    'telefone': '82999990000',
+    'email': 'contato@prestadora.com.br',
+}
+
+TOMADOR = {
+    'cnpj': '98.765.432/0001-10',
+    'cpf': None,
+    'inscricao_municipal': '54321',
+    'razao_social': 'MUNICIPIO DE PENEDO',
+    'endereco': 'PRACA BARAO DE PENEDO, S/N',
+    'municipio': 'Penedo',
+    'uf': 'AL',
+    'cep': '57200001',
+    'numero': None,
+    'bairro': None,
+    'telefone': '8233334444',
+    'email': 'financeiro@penedo.al.gov.br',
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_document_cache():
+    document_module.document_cache.clear()
+    yield
+    document_module.document_cache.clear()
+
+@pytest.fixture
+def penedo_file(tmp_path: Path, monkeypatch) -> dtoFile.File:
+    monkeypatch.setattr(document_module, 'extract_text_from_pdf', lambda pdf_path, max_pages=None: PENEDO_TEXT)
+
+    file_path = tmp_path / 'document.pdf'
+    file_path.write_bytes(b'%PDF-1.4 penedo')
+    return dtoFile.File(file_path=file_path, file_extension='pdf')
+
+
+def test_if_penedo_nota_extractor_extracts_every_field(penedo_file: dtoFile.File):
+    assert PenedoFileToNotaExtractor(penedo_file).get_all_extracted_info() == NOTA
+
+def test_if_penedo_prestador_extractor_extracts_every_field(penedo_file: dtoFile.File):
+    assert PenedoFileToPrestadorExtractor(penedo_file).get_all_extracted_info() == PRESTADOR
+
+def test_if_penedo_tomador_extractor_extracts_every_field(penedo_file: dtoFile.File):
+    assert PenedoFileToTomadorExtractor(penedo_file).get_all_extracted_info() == TOMADOR
+
+def test_if_penedo_extractors_return_valid_models(penedo_file: dtoFile.File):
+    assert PenedoFileToNotaExtractor(penedo_file).run(penedo_file) == dtoNota.NotaExtractedInfo(**NOTA)
+    assert PenedoFileToPrestadorExtractor(penedo_file).run(penedo_file) == dtoPrestador.PrestadorExtractedInfo(**PRESTADOR)
+    assert PenedoFileToTomadorExtractor(penedo_file).run(penedo_file) == dtoTomador.TomadorExtractedInfo(**TOMADOR)
+
+@pytest.mark.parametrize('field', list(NOTA))
+def test_if_penedo_nota_extractor_extracts_a_single_field(penedo_file: dtoFile.File, field):
+    nota = PenedoFileToNotaExtractor(penedo_file).run(penedo_file, fields=[field])
+
+    assert nota.model_dump() == {field: NOTA[field]}
+
+@pytest.mark.parametrize('extractor_cls', [PenedoFileToNotaExtractor, PenedoFileToPrestadorExtractor, PenedoFileToTomadorExtractor])
+@pytest.mark.parametrize('fields', [['unknown_field'], 'municipio'])
+def test_if_penedo_extractors_raise_operation_error_when_the_fields_are_unknown_or_a_str(penedo_file: dtoFile.File, extractor_cls, fields):
+    with pytest.raises(OperationError):
+        extractor_cls(penedo_file).run(penedo_file, fields=fields)
+
+def test_if_penedo_prestador_and_tomador_extractors_give_none_for_an_empty_field(penedo_file: dtoFile.File, monkeypatch):
+    # an empty field must not take the value of the next line
+    text = PENEDO_TEXT.replace('Nome/Razão Social: EMPRESA PRESTADORA LTDA', 'Nome/Razão Social: ') \
+        .replace('Endereço: PRACA BARAO DE PENEDO, S/N', 'Endereço:') \
+        .replace('TEL: 8233334444 E-mail: financeiro@penedo.al.gov.br', 'TEL:\n8233334444 E-mail:')
+    monkeypatch.setattr(document_module, 'extract_text_from_pdf', lambda pdf_path, max_pages=None: text)
+
+    prestador = PenedoFileToPrestadorExtractor(penedo_file).get_all_extracted_info()
+    tomador = PenedoFileToTomadorExtractor(penedo_file).get_all_extracted_info()
+
+    assert prestador == dict(PRESTADOR, razao_social=None)
+    assert tomador == dict(TOMADOR, endereco=None, telefone=None, email=None)
+
+def test_if_penedo_nota_extractor_extracts_the_retained_iss(monkeypatch, penedo_file: dtoFile.File):
+    text = PENEDO_TEXT.replace('ISS Retido: NÃO', 'ISS Retido: SIM')
+    monkeypatch.setattr(document_module, 'extract_text_from_pdf', lambda pdf_path, max_pages=None: text)
+
+    assert PenedoFileToNotaExtractor(penedo_file).get_all_extracted_info(fields=['issqn_a_reter']) == {'issqn_a_reter': '1'}
@@ -0,0 +1,94 @@
+import pytest
+from pathlib import Path
+
+from packag.models import dtoFile
+from packag.models.business import dtoTomador
+from packag.models.business.partial import get_partial_model
+from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor import FileToTomadorExtractor
+from packag.modules.pipeline.utils.exceptions import OperationError, ValidationError
+
+
+TOMADOR = {
+    'cpf': None, 'cnpj': '12.345.678/0001-90', 'inscricao_municipal': '123', 'razao_social': 'Empresa',
+    'endereco': 'Rua A', 'municipio': 'Penedo', 'uf': 'AL', 'cep': '57200000',
+    'numero': '10', 'bairro': 'Centro', 'telefone': None, 'email': None,
+}
+
+
+class CountingTomadorExtractor(FileToTomadorExtractor):
+    def __init__(self, file, tomador=TOMADOR):
+        self.file = file
+        self.tomador = tomador
+        self.calls = []
+
+    def _extract(self, field):
+        self.calls.append(field)
+        return self.tomador[field]
+
+    def _extract_cpf(self): return self._extract('cpf')
+    def _extract_cnpj(self): return self._extract('cnpj')
+    def _extract_inscricao_municipal(self): return self._extract('inscricao_municipal')
+    def _extract_razao_social(self): return self._extract('razao_social')
+    def _extract_endereco(self): return self._extract('endereco')
+    def _extract_municipio(self): return self._extract('municipio')
+    def _extract_uf(self): return self._extract('uf')
+    def _extract_cep(self): return self._extract('cep')
+    def _extract_numero(self): return self._extract('numero')
+    def _extract_bairro(self): return self._extract('bairro')
+    def _extract_telefone(self): return self._extract('telefone')
+    def _extract_email(self): return self._extract('email')
+
+
+@pytest.fixture
+def file() -> dtoFile.File:
+    return dtoFile.File(file_path=Path('nota.pdf'), file_extension='pdf')
+
+
+def test_if_run_extracts_only_the_requested_fields(file: dtoFile.File):
+    extractor = CountingTomadorExtractor(file)
+
+    tomador = extractor.run(file, fields=('razao_social', 'cep'))
+
+    assert extractor.calls == ['razao_social', 'cep']
+    assert tomador.model_dump() == {'razao_social': 'Empresa', 'cep': '57200000'}
+    assert isinstance(tomador, get_partial_model(dtoTomador.TomadorExtractedInfo, ('razao_social', 'cep')))
+
+def test_if_run_extracts_every_field_when_fields_is_not_given(file: dtoFile.File):
+    extractor = CountingTomadorExtractor(file)
+
+    tomador = extractor.run(file)
+
+    assert isinstance(tomador, dtoTomador.TomadorExtractedInfo)
+    assert sorted(extractor.calls) == sorted(TOMADOR)
+
+def test_if_partial_model_validates_the_requested_fields(file: dtoFile.File):
+    extractor = CountingTomadorExtractor(file, tomador=dict(TOMADOR, cep=None))
+
+    with pytest.raises(OperationError):
+        extractor.run(file, fields=('cep',))
+
+    # the check of cnpj or cpf needs both fields: it is not done on partial models
+    assert extractor.run(file, fields=('cnpj',)).cnpj == TOMADOR['cnpj']
+
+def test_if_partial_models_are_built_once_per_set_of_fields():
+    model = get_partial_model(dtoTomador.TomadorExtractedInfo, ('cep', 'uf'))
+
+    assert get_partial_model(dtoTomador.TomadorExtractedInfo, ('cep', 'uf')) is model
+    assert list(model.model_fields) == ['cep', 'uf']
+    assert model.model_fields['cep'].is_required()
+
+def test_if_projection_raises_validation_error_when_a_field_is_unknown(file: dtoFile.File):
+    with pytest.raises(ValidationError):
+        CountingTomadorExtractor(file).get_all_extracted_info(fields=('valor_total',))
+
+    with pytest.raises(ValueError):
+        get_partial_model(dtoTomador.TomadorExtractedInfo, ('valor_total',))
+
+@pytest.mark.parametrize('fields', [('cep', 'valor_total'), 'cep'])
+def test_if_run_raises_operation_error_when_the_fields_are_unknown_or_a_str(file: dtoFile.File, fields):
+    extractor = CountingTomadorExtractor(file)
+
+    with pytest.raises(OperationError):
+        extractor.run(file, fields=fields)
+
+    assert extractor.calls == []
@@ -0,0 +1,99 @@
+import pytest
+from pathlib import Path
+
+from reportlab.pdfgen import canvas
+
+from packag.models import dtoFile
+from packag.modules.document_operations import document as document_module
+from packag.modules.document_operations import get_document
+from packag.modules.pipeline.operations.extractors.registry import ExtractorFamily, ExtractorRegistry, registry
+from packag.modules.pipeline.operations.extractors.router import MunicipalityRouter, RouteCache, get_fingerprint
+from packag.modules.pipeline.utils.exceptions import OperationError
+
+
+@pytest.fixture(autouse=True)
+def clear_document_cache():
+    document_module.document_cache.clear()
+    yield
+    document_module.document_cache.clear()
+
+@pytest.fixture
+def router() -> MunicipalityRouter:
+    return MunicipalityRouter(cache=RouteCache())
+
+def create_pdf(file_path: Path, lines: list) -> dtoFile.File:
+    c = canvas.Canvas(str(file_path))
+    for number, line in enumerate(lines):
+        c.drawString(40, 800 - number * 20, line)
+    c.save()
+
+    return dtoFile.File(file_path=file_path, file_extension='pdf')
+
+
+@pytest.mark.parametrize('content, municipio', [
+    ('<ns2:ConsultarNfseResposta xmlns:ns2="http://www.giss.com.br/tipos-v2_04.xsd">', 'maceio'),
+    ('<?xml version="1.0"?><Nfse xmlns="http://www.agili.com.br/nfse_v_1.00.xsd">', 'delmiro'),
+])
+def test_if_router_routes_xml_files_by_namespace_without_parsing_them(router: MunicipalityRouter, content, municipio):
+    # the files are not valid XML (not closed): only their start is read
+    file = dtoFile.File(content=content.encode('utf-8'), file_extension='xml')
+
+    assert router.run(file) is registry.get(municipio)
+
+def test_if_router_routes_pdf_files_by_the_city_hall_named_first(router: MunicipalityRouter, tmp_path: Path):
+    arapiraca_file = create_pdf(tmp_path / 'arapiraca.pdf', ['PREFEITURA MUNICIPAL DE ARAPIRACA', 'Tomador', 'Cidade PENEDO - AL'])
+    penedo_file = create_pdf(tmp_path / 'penedo.pdf', ['Prefeitura Municipal de Penedo', 'NFS-e 123'])
+
+    assert router.run(arapiraca_file).municipio == 'arapiraca'
+    assert router.run(penedo_file).municipio == 'penedo'
+
+def test_if_router_does_not_parse_the_pdf_again_for_the_extractors(router: MunicipalityRouter, tmp_path: Path, monkeypatch):
+    file = create_pdf(tmp_path / 'nota.pdf', ['PREFEITURA MUNICIPAL DE PENEDO'])
+    calls = []
+
+    def fake_extract_text_from_pdf(pdf_path, max_pages=None):
+        calls.append(max_pages)
+        return 'PREFEITURA MUNICIPAL DE PENEDO\nNFS-e 123'
+
+    monkeypatch.setattr(document_module, 'extract_text_from_pdf', fake_extract_text_from_pdf)
+
+    family = router.run(file)
+    get_document(file, max_pages=family.nota_extractor.PDF_MAX_PAGES).text
+
+    assert calls == [1]
+
+def test_if_router_caches_the_decision_of_a_fingerprint(tmp_path: Path):
+    cache = RouteCache()
+    router = MunicipalityRouter(cache=cache)
+
+    for number in range(3):
+        file = create_pdf(tmp_path / f'{number}.pdf', ['PREFEITURA MUNICIPAL DE PENEDO', f'NFS-e {number}'])
+        assert router.run(file).municipio == 'penedo'
+
+    assert len(cache) == 1
+    assert get_fingerprint(file)[1] == ('PREFEITURA MUNICIPAL DE PENEDO', 'NFS-e')
+
+def test_if_router_uses_the_families_registered_after_a_decision_was_cached(tmp_path: Path):
+    file = dtoFile.File(content=b'<Nfse xmlns="http://www.example.com/nfse.xsd">', file_extension='xml')
+    custom_registry = ExtractorRegistry()
+    router = MunicipalityRouter(registry=custom_registry, cache=RouteCache())
+
+    with pytest.raises(OperationError):
+        router.run(file)
+
+    custom_registry.register(ExtractorFamily('example', 'xml', object, object, object, namespaces=('http://www.example.com/nfse.xsd',)))
+
+    assert router.run(file).municipio == 'example'
+
+def test_if_router_raises_operation_error_when_no_family_recognizes_the_file(router: MunicipalityRouter, tmp_path: Path):
+    file = create_pdf(tmp_path / 'nota.pdf', ['PREFEITURA MUNICIPAL DE MACEIO'])
+
+    with pytest.raises(OperationError):
+        router.run(file)
+
+    with pytest.raises(OperationError):
+        router.run('not_a_file')
+
+def test_if_registry_raises_value_error_when_the_municipio_is_already_registered():
+    with pytest.raises(ValueError):
+        registry.register(ExtractorFamily('penedo', 'pdf', object, object, object, header_markers=('PENEDO',)))
@@ -0,0 +1,99 @@
+import pytest
+from pathlib import Path
+
+from packag.models import dtoFile
+from packag.modules.pipeline.operation import Operation
+from packag.modules.pipeline.operations.extractors.streaming import stream_extracted_info, stream_lot_extracted_info
+from packag.modules.pipeline.utils.exceptions import OperationError
+from packag.modules.utils.messages import OperationErrorMessage
+
+
+class FileNameExtractor(Operation):
+    def __init__(self, file: dtoFile.File):
+        self.file = file
+
+    def run(self, input_data=None):
+        if self.file.file_path.stem == 'invalid':
+            raise OperationError(
+                OperationErrorMessage(
+                    operation_name='FileNameExtractor',
+                    original_exception='invalid file',
+                )
+            )
+        return self.file.file_path.name
+
+class FileExtensionExtractor(FileNameExtractor):
+    def run(self, input_data=None):
+        return self.file.file_extension.value
+
+
+@pytest.fixture
+def invoices_dir(tmp_path: Path) -> Path:
+    for name in ['1.pdf', '2.xml', 'invalid.pdf']:
+        (tmp_path / name).write_bytes(b'')
+    return tmp_path
+
+
+@pytest.mark.parametrize('backend', ['serial', 'thread', 'process'])
+def test_if_stream_extracted_info_yields_the_results_of_each_file(invoices_dir: Path, backend):
+    results = stream_extracted_info(
+        invoices_dir,
+        [FileNameExtractor, FileExtensionExtractor],
+        workers=2,
+        backend=backend,
+    )
+
+    outputs = {result.input_data.file_path.name: result for result in results}
+
+    assert outputs['1.pdf'].output_data == ['1.pdf', 'pdf']
+    assert outputs['2.xml'].output_data == ['2.xml', 'xml']
+    assert not outputs['invalid.pdf'].ok
+    assert isinstance(outputs['invalid.pdf'].error, OperationError)
+
+def test_if_stream_extracted_info_reads_a_directory_given_as_a_str(invoices_dir: Path):
+    results = stream_extracted_info(str(invoices_dir), [FileNameExtractor], backend='serial')
+
+    assert sorted(result.input_data.file_path.name for result in results) == ['1.pdf', '2.xml', 'invalid.pdf']
+
+
+class BrokenExtractor(FileNameExtractor):
+    def run(self, input_data=None):
+        if self.file.file_path.stem == '2':
+            raise KeyError('Numero')
+        return self.file.file_path.name
+
+
+@pytest.mark.parametrize('backend', ['serial', 'thread', 'process'])
+def test_if_stream_extracted_info_keeps_an_error_that_is_not_an_operation_error_and_extracts_the_other_files(
+    invoices_dir: Path, backend,
+):
+    results = stream_extracted_info(invoices_dir, [BrokenExtractor], pattern='[12].*', workers=2, backend=backend)
+
+    outputs = {result.input_data.file_path.name: result for result in results}
+
+    assert outputs['1.pdf'].output_data == ['1.pdf']
+    assert not outputs['2.xml'].ok
+    assert isinstance(outputs['2.xml'].error, KeyError)
+
+
+class NumeroExtractor(Operation):
+    def __init__(self, file: dtoFile.File, document=None):
+        self.document = document
+
+    def run(self, input_data=None):
+        return self.document.xml_index.find_text('.//Numero')
+
+
+def test_if_stream_lot_extracted_info_yields_the_results_of_each_invoice(tmp_path: Path):
+    lot_path = tmp_path / 'lote.xml'
+    lot_path.write_text(
+        '<ListaNfse>'
+        + ''.join(f'<CompNfse><Nfse><Numero>{numero}</Numero></Nfse></CompNfse>' for numero in range(3))
+        + '</ListaNfse>'
+    )
+    lot_file = dtoFile.File(file_path=lot_path, file_extension='xml')
+
+    results = list(stream_lot_extracted_info(lot_file, [NumeroExtractor]))
+
+    assert [result.index for result in results] == [0, 1, 2]
+    assert [result.output_data for result in results] == [['0'], ['1'], ['2']]
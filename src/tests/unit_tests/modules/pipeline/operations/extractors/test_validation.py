@@ -0,0 +1,156 @@
+import pytest
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from pydantic import ValidationError as pydantic_ValidationError
+
+from packag.models import dtoFile
+from packag.models.business import dtoTomador
+from packag.modules.config import VALIDATION_MODE
+from packag.modules.pipeline.operations.extractors.fileToNotaExtractor import FileToNotaExtractor
+from packag.modules.pipeline.operations.extractors.fileToNotaExtractor.maceioFileToNotaExtractor import MaceioFileToNotaExtractor
+from packag.modules.pipeline.operations.extractors.fileToPrestadorExtractor import FileToPrestadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor import FileToTomadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor.maceioFileToTomadorExtractor import MaceioFileToTomadorExtractor
+from packag.modules.pipeline.operations.extractors.fileToTomadorExtractor.penedoFileToTomadorExtractor import PenedoFileToTomadorExtractor
+from packag.modules.pipeline.operations.extractors.validation import (
+    ValidationPolicy,
+    construct,
+    construct_many,
+    get_list_adapter,
+    validate_batch,
+)
+
+
+TOMADOR = {
+    'cnpj': '12.345.678/0001-90', 'inscricao_municipal': '123', 'razao_social': 'Empresa',
+    'endereco': 'Rua A', 'municipio': 'Penedo', 'uf': 'AL', 'cep': '57200000',
+}
+
+TOMADOR_XML = """<ns2:ConsultarNfseResposta xmlns:ns2="http://www.giss.com.br/tipos-v2_04.xsd"><ns2:TomadorServico>
+<ns2:IdentificacaoTomador><ns2:InscricaoMunicipal>123</ns2:InscricaoMunicipal></ns2:IdentificacaoTomador>
+<ns2:RazaoSocial>Empresa</ns2:RazaoSocial>
+<ns2:Endereco><ns2:Endereco>Rua A</ns2:Endereco><ns2:CodigoMunicipio>2704302</ns2:CodigoMunicipio><ns2:Uf>AL</ns2:Uf><ns2:Cep>57000000</ns2:Cep></ns2:Endereco>
+</ns2:TomadorServico></ns2:ConsultarNfseResposta>"""
+
+
+class ModelWithPrivateAttribute(BaseModel):
+    numero: str
+    _source: str = PrivateAttr(default='xml')
+
+class ModelWithExtraFields(BaseModel):
+    model_config = ConfigDict(extra='allow')
+
+    numero: str
+
+
+def build_many(policy: ValidationPolicy, outputs: list) -> list:
+    return [policy.build(dtoTomador.TomadorExtractedInfo, output) for output in outputs]
+
+
+def test_if_full_mode_validates_every_document():
+    policy = ValidationPolicy('full')
+
+    with pytest.raises(pydantic_ValidationError):
+        build_many(policy, [TOMADOR, dict(TOMADOR, cnpj=None)])
+
+    assert policy.stats() == {'mode': 'full', 'documents': 2, 'validated': 2, 'constructed': 0}
+
+def test_if_trusted_mode_builds_the_models_without_validating_them():
+    policy = ValidationPolicy('trusted')
+
+    tomadores = build_many(policy, [TOMADOR] * 3 + [dict(TOMADOR, cnpj=None)])
+
+    assert all(isinstance(tomador, dtoTomador.TomadorExtractedInfo) for tomador in tomadores)
+    assert tomadores[0].model_dump() == dtoTomador.TomadorExtractedInfo(**TOMADOR).model_dump()
+    assert policy.stats() == {'mode': 'trusted', 'documents': 4, 'validated': 0, 'constructed': 4}
+
+def test_if_sampled_mode_validates_one_in_n_documents_and_the_documents_missing_a_required_field():
+    policy = ValidationPolicy('sampled', sample_every=10)
+
+    build_many(policy, [TOMADOR] * 20)
+    assert policy.stats()['validated'] == 2
+
+    with pytest.raises(pydantic_ValidationError):
+        build_many(policy, [dict(TOMADOR, cep=None)])
+
+    assert policy.stats() == {'mode': 'sampled', 'documents': 21, 'validated': 3, 'constructed': 18}
+
+def test_if_extractors_use_the_validation_policy_of_their_class(monkeypatch):
+    # a Tomador without cnpj nor cpf: the check of the model is skipped by the trusted policy
+    file = dtoFile.File(content=TOMADOR_XML.encode('utf-8'), file_extension='xml')
+    policy = ValidationPolicy('trusted')
+    monkeypatch.setattr(MaceioFileToTomadorExtractor, 'validation_policy', policy)
+
+    tomador = MaceioFileToTomadorExtractor(file).run(file)
+
+    assert (tomador.cnpj, tomador.razao_social) == (None, 'Empresa')
+    assert policy.stats()['constructed'] == 1
+    assert FileToTomadorExtractor.validation_policy is not policy
+
+def test_if_each_extractor_class_has_its_own_validation_policy():
+    classes = [
+        FileToNotaExtractor, FileToPrestadorExtractor, FileToTomadorExtractor,
+        MaceioFileToNotaExtractor, MaceioFileToTomadorExtractor, PenedoFileToTomadorExtractor,
+    ]
+    policies = [cls.validation_policy for cls in classes]
+
+    assert len({id(policy) for policy in policies}) == len(classes)
+    assert all(policy.mode == VALIDATION_MODE for policy in policies)
+
+@pytest.mark.parametrize('mode, sample_every', [('fast', 10), ('sampled', 0)])
+def test_if_validation_policy_raises_value_error_when_the_arguments_are_invalid(mode, sample_every):
+    with pytest.raises(ValueError):
+        ValidationPolicy(mode, sample_every)
+
+def test_if_validate_batch_returns_the_valid_models_and_the_errors_by_index():
+    outputs = [TOMADOR, dict(TOMADOR, cep=None), TOMADOR, dict(TOMADOR, cnpj=None)]
+
+    result = validate_batch(dtoTomador.TomadorExtractedInfo, outputs)
+
+    assert list(result.models) == [0, 2]
+    assert all(isinstance(tomador, dtoTomador.TomadorExtractedInfo) for tomador in result.valid)
+    assert result.errors[1] == [('cep', 'Input should be a valid string')]
+    assert result.errors[3][0][0] is None
+
+def test_if_validate_batch_reuses_the_type_adapter_of_the_model():
+    validate_batch(dtoTomador.TomadorExtractedInfo, [TOMADOR])
+
+    assert get_list_adapter(dtoTomador.TomadorExtractedInfo) is get_list_adapter(dtoTomador.TomadorExtractedInfo)
+    assert validate_batch(dtoTomador.TomadorExtractedInfo, []).models == {}
+
+def test_if_validate_batch_raises_value_error_when_outputs_is_not_a_list():
+    with pytest.raises(ValueError):
+        validate_batch(dtoTomador.TomadorExtractedInfo, TOMADOR)
+
+def test_if_construct_many_builds_the_models_of_the_rows():
+    fields = tuple(dtoTomador.TomadorExtractedInfo.model_fields)
+    rows = [tuple(TOMADOR.get(field) for field in fields)] * 2
+
+    tomadores = construct_many(dtoTomador.TomadorExtractedInfo, fields, rows)
+
+    assert tomadores[0] == dtoTomador.TomadorExtractedInfo(**TOMADOR)
+    assert tomadores[0].model_fields_set is not tomadores[1].model_fields_set
+
+    with pytest.raises(ValueError):
+        construct_many(dtoTomador.TomadorExtractedInfo, ('cnpj',), rows)
+
+def test_if_construct_many_builds_the_pydantic_state_of_model_construct():
+    # construct_many sets the instance attributes of pydantic by hand:
+    # this fails if a new version of pydantic changes them
+    model = dtoTomador.TomadorExtractedInfo
+    fields = tuple(model.model_fields)
+    expected = model.model_construct(**{field: TOMADOR.get(field) for field in fields})
+
+    [constructed_row] = construct_many(model, fields, [tuple(TOMADOR.get(field) for field in fields)])
+
+    assert constructed_row.__getstate__() == expected.__getstate__()
+    assert construct(model, TOMADOR).model_dump() == model(**TOMADOR).model_dump()
+
+def test_if_construct_keeps_the_private_attributes_and_the_extra_fields():
+    assert construct(ModelWithPrivateAttribute, {'numero': '1'})._source == 'xml'
+    assert construct(ModelWithExtraFields, {'numero': '1', 'serie': 'A'}).model_extra == {'serie': 'A'}
+
+@pytest.mark.parametrize('model', [ModelWithPrivateAttribute, ModelWithExtraFields])
+def test_if_construct_many_raises_value_error_when_the_model_has_private_attributes_or_extra_fields(model):
+    with pytest.raises(ValueError):
+        construct_many(model, ('numero',), [('1',)])
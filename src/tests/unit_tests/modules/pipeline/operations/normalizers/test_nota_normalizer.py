@@ -0,0 +1,100 @@
+"""
+What should be tested:
+    - The notas of each municipality, as their extractors return them (see the tests of the extractors), are normalized
+      to the same typed values: the PDF files by NotaNormalizer, the XML files by XmlNotaNormalizer.
+"""
+
+import datetime
+
+from decimal import Decimal
+
+import pytest
+
+from packag.models.business import dtoNota
+from packag.models.business.records import NotaRecord
+from packag.modules.pipeline.operations.normalizers.notaNormalizer import NotaNormalizer, XmlNotaNormalizer, centavos_to_decimal
+from packag.modules.pipeline.utils.exceptions import OperationError
+
+
+ARAPIRACA_NOTA = {
+    'numero_nfs': '205', 'codigo_autenticidade': 'ABCD.1234.EF56', 'data_competencia': '01/05/2024',
+    'valor_liquido': '924,50', 'valor_total': '1.000,00', 'valor_deducoes': '20,00', 'valor_pis': '6,50',
+    'valor_cofins': '30,00', 'valor_inss': '10,00', 'valor_irrf': '15,00', 'valor_csll': '9,00',
+    'valor_issqn': '50,00', 'base_calculo': '1.000,00', 'aliquota': '5,00', 'issqn_a_reter': '0',
+    'estado': 'AL', 'codigo_tributacao': '17.01', 'discriminacao_servico': 'Contrato 012/2024 - Consultoria tributária',
+    'opt_simples_nacional': '1', 'serie': None, 'nfse_substituida': None, 'valor_outras_retencoes': '5,00',
+    'data_emissao': '31/05/2024 - 10:00:00', 'atv_economica': '17.01', 'municipio': 'Arapiraca',
+}
+
+PENEDO_NOTA = dict(
+    ARAPIRACA_NOTA,
+    numero_nfs='00001234', codigo_autenticidade='AB12-CD34', data_competencia='MAI/2024',
+    data_emissao='31/05/2024 10:00:00', codigo_tributacao='4321500', atv_economica='0702', municipio='Penedo',
+)
+
+MACEIO_NOTA = {
+    'numero_nfs': '342', 'codigo_autenticidade': 'A1B2C3D4E', 'data_competencia': '2024-05-01',
+    'valor_liquido': '924.50', 'valor_total': '1000.00', 'valor_deducoes': '20.00', 'valor_pis': '6.50',
+    'valor_cofins': '30.00', 'valor_inss': '10.00', 'valor_irrf': '15.00', 'valor_csll': '9.00',
+    'valor_issqn': '50.00', 'base_calculo': '1000.00', 'aliquota': '5.00', 'issqn_a_reter': '2',
+    'estado': 'AL', 'codigo_tributacao': '170101', 'discriminacao_servico': 'Consultoria tributaria',
+    'opt_simples_nacional': '2', 'serie': None, 'nfse_substituida': None, 'valor_outras_retencoes': '5.00',
+    'data_emissao': '2024-05-31T10:00:00', 'atv_economica': '17.01', 'municipio': '2704302',
+}
+
+DELMIRO_NOTA = dict(
+    MACEIO_NOTA,
+    numero_nfs='1779', codigo_autenticidade='9F8E7D6C5B', data_competencia='2024-05-31', data_emissao='2024-05-31',
+    aliquota='5.0000', issqn_a_reter='0', codigo_tributacao='7020400', opt_simples_nacional='1',
+    atv_economica='7020400', municipio='2702405',
+)
+
+VALUES = {
+    'valor_liquido': Decimal('924.50'), 'valor_total': Decimal('1000.00'), 'valor_deducoes': Decimal('20.00'),
+    'valor_pis': Decimal('6.50'), 'valor_cofins': Decimal('30.00'), 'valor_inss': Decimal('10.00'),
+    'valor_irrf': Decimal('15.00'), 'valor_csll': Decimal('9.00'), 'valor_issqn': Decimal('50.00'),
+    'base_calculo': Decimal('1000.00'), 'aliquota': 500, 'valor_outras_retencoes': Decimal('5.00'),
+    'data_emissao': datetime.date(2024, 5, 31),
+}
+
+
+@pytest.mark.parametrize('normalizer_cls, nota, data_competencia', [
+    (NotaNormalizer, ARAPIRACA_NOTA, datetime.date(2024, 5, 1)),
+    (NotaNormalizer, PENEDO_NOTA, datetime.date(2024, 5, 1)),
+    (XmlNotaNormalizer, MACEIO_NOTA, datetime.date(2024, 5, 1)),
+    (XmlNotaNormalizer, DELMIRO_NOTA, datetime.date(2024, 5, 31)),
+])
+def test_if_run_returns_the_typed_values_of_the_notas_of_each_municipality(normalizer_cls, nota, data_competencia):
+    normalized = normalizer_cls().run([nota])[0]
+
+    assert isinstance(normalized, dtoNota.NotaNormalizedInfo)
+    assert {name: getattr(normalized, name) for name in VALUES} == VALUES
+    assert str(normalized.valor_pis) == '6.50'
+    assert normalized.data_competencia == data_competencia
+    assert normalized.municipio == nota['municipio']
+
+def test_if_run_gives_none_for_the_missing_and_invalid_values():
+    nota = NotaNormalizer().run([
+        dict(ARAPIRACA_NOTA, valor_total='abc', aliquota=None, data_competencia='13/2024', data_emissao='31/05/2024 -'),
+    ])[0]
+
+    assert (nota.valor_total, nota.aliquota, nota.data_competencia, nota.data_emissao, nota.serie) == (None,) * 5
+
+def test_if_run_keeps_the_order_of_the_notas_of_any_type():
+    notas = [dict(ARAPIRACA_NOTA, numero_nfs=str(numero), valor_total=f'{numero},00') for numero in range(5)]
+
+    for lot in (notas, [dtoNota.NotaExtractedInfo(**nota) for nota in notas], [NotaRecord.from_dict(nota) for nota in notas]):
+        normalized = NotaNormalizer().run(lot)
+        assert [nota.valor_total for nota in normalized] == [Decimal(numero) for numero in range(5)]
+
+def test_if_normalized_notas_are_valid_models():
+    nota = XmlNotaNormalizer().run([DELMIRO_NOTA])[0]
+
+    assert dtoNota.NotaNormalizedInfo.model_validate(nota.model_dump()) == nota
+
+def test_if_centavos_to_decimal_is_memoized():
+    assert centavos_to_decimal(500) is centavos_to_decimal(500)
+
+def test_if_run_raises_operation_error_when_the_input_is_not_a_list():
+    with pytest.raises(OperationError):
+        NotaNormalizer().run(ARAPIRACA_NOTA)
@@ -0,0 +1,26 @@
+import pytest
+
+from packag.modules.pipeline.tasks import NormalizeDataTask
+from packag.modules.pipeline.operation import Operation
+from packag.modules.pipeline.utils.exceptions import TaskError
+
+
+class UpperOperation(Operation):
+    def run(self, input_data):
+        return [value.upper() for value in input_data]
+
+
+def test_if_run_returns_the_output_of_the_operation_for_the_whole_list():
+    assert NormalizeDataTask(operation_cls=UpperOperation).run(['a', 'b']) == ['A', 'B']
+
+def test_if_private_validate_input_raise_type_error_when_input_is_not_a_list():
+    with pytest.raises(TypeError):
+        NormalizeDataTask(operation_cls=UpperOperation)._validate_input(input_data='a')
+
+def test_if_private_validate_output_raise_type_error_when_output_is_not_a_list():
+    with pytest.raises(TypeError):
+        NormalizeDataTask(operation_cls=UpperOperation)._validate_output(output_data='a')
+
+def test_if_run_raises_task_error_when_operation_cls_is_not_an_operation():
+    with pytest.raises(TaskError):
+        NormalizeDataTask(operation_cls=str).run(['a'])
@@ -0,0 +1,259 @@
+"""
+What should be tested:
+    - The pipeline should raise an exception if the tasks are not a dict of Task objects.
+    - The pipeline should raise an exception if a dependency is not a task of the pipeline.
+    - The pipeline should raise an exception if the graph has a cycle.
+    - Tasks without dependencies receive the input data; the others receive the results of their dependencies.
+    - Independent tasks run concurrently.
+    - The pipeline should raise an exception if any task fails.
+    - arun awaits the graph of tasks like run does.
+    - A DagPipeline runs over many inputs like a Pipeline, and its runs on many threads share a single executor.
+
+This test file should not depend on the implementation details of the Task class.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from unittest.mock import MagicMock
+
+from packag.modules.pipeline import DagPipeline, Pipeline, PipelineResult
+from packag.modules.pipeline import dagPipeline as dag_pipeline_module
+from packag.modules.pipeline.operation import Operation
+from packag.modules.pipeline.task import Task
+from packag.modules.pipeline.utils.exceptions import OperationError, PipelineError, TaskError
+from packag.modules.utils.messages import OperationErrorMessage
+
+
+class AddOneOperation(Operation):
+    def run(self, input_data=None):
+        return input_data + 1
+
+class DumpTask(Task):
+    def _validate_operation_cls(self, operation_cls):
+        return operation_cls
+    def _validate_input(self, input_data):
+        return input_data
+    def _validate_output(self, output_data):
+        return output_data
+
+class SumOperation(Operation):
+    def run(self, input_data=None):
+        return sum(input_data.values())
+
+class FailingOperation(Operation):
+    def run(self, input_data=None):
+        raise OperationError(
+            OperationErrorMessage(
+                operation_name='FailingOperation',
+                original_exception='always fails',
+            )
+        )
+
+class BranchesPipeline(DagPipeline):
+    def get_tasks(self):
+        return {
+            'left': DumpTask(AddOneOperation),
+            'right': DumpTask(AddOneOperation),
+        }
+
+class DiamondPipeline(DagPipeline):
+    def get_tasks(self):
+        return {
+            'source': DumpTask(AddOneOperation),
+            'left': DumpTask(AddOneOperation),
+            'right': DumpTask(AddOneOperation),
+            'total': DumpTask(SumOperation),
+        }
+
+    def get_dependencies(self):
+        return {
+            'left': ['source'],
+            'right': ['source'],
+            'total': ['left', 'right'],
+        }
+
+class FailingBranchPipeline(DagPipeline):
+    def get_tasks(self):
+        return {
+            'ok': DumpTask(AddOneOperation),
+            'error': DumpTask(FailingOperation),
+        }
+
+def mock_task(run):
+    task = MagicMock(Task)
+    task.run.side_effect = run
+    return task
+
+
+class TestDagPipeline:
+
+    def test_pipeline_with_non_dict_get_tasks_implementation_raises_an_exception(self):
+
+        class PipelineWithNonDictGetTasks(DagPipeline):
+            def get_tasks(self):
+                return [mock_task(lambda input_data: input_data)]
+
+        with pytest.raises(PipelineError):
+            PipelineWithNonDictGetTasks()
+
+    def test_pipeline_with_a_dict_of_non_task_objects_raises_an_exception(self):
+
+        class PipelineWithNonTaskObjects(DagPipeline):
+            def get_tasks(self):
+                return {'task': 'not a task object'}
+
+        with pytest.raises(PipelineError):
+            PipelineWithNonTaskObjects()
+
+    def test_pipeline_with_an_unknown_dependency_raises_an_exception(self):
+
+        class PipelineWithUnknownDependency(DagPipeline):
+            def get_tasks(self):
+                return {'task': mock_task(lambda input_data: input_data)}
+
+            def get_dependencies(self):
+                return {'task': ['unknown']}
+
+        with pytest.raises(PipelineError):
+            PipelineWithUnknownDependency()
+
+    def test_pipeline_with_a_cycle_raises_an_exception(self):
+
+        class PipelineWithCycle(DagPipeline):
+            def get_tasks(self):
+                return {
+                    'a': mock_task(lambda input_data: input_data),
+                    'b': mock_task(lambda input_data: input_data),
+                }
+
+            def get_dependencies(self):
+                return {'a': ['b'], 'b': ['a']}
+
+        with pytest.raises(PipelineError):
+            PipelineWithCycle()
+
+    def test_pipeline_with_an_unknown_backend_raises_a_value_error(self):
+        with pytest.raises(ValueError):
+            BranchesPipeline(backend='cluster')
+
+    @pytest.mark.parametrize('backend', ['serial', 'thread'])
+    def test_run_passes_the_results_of_the_dependencies_to_each_task(self, backend):
+
+        class DiamondPipeline(DagPipeline):
+            def get_tasks(self):
+                return {
+                    'source': mock_task(lambda input_data: input_data * 10),
+                    'left': mock_task(lambda input_data: input_data + 1),
+                    'right': mock_task(lambda input_data: input_data + 2),
+                    'join': mock_task(lambda input_data: input_data),
+                }
+
+            def get_dependencies(self):
+                return {
+                    'left': ['source'],
+                    'right': ['source'],
+                    'join': ['left', 'right'],
+                }
+
+        with DiamondPipeline(backend=backend) as pipeline:
+            result = pipeline.run(input_data=1)
+
+        assert result == {'join': {'left': 11, 'right': 12}}
+
+    def test_run_returns_the_results_of_all_the_independent_tasks(self):
+        with BranchesPipeline(backend='process', workers=2) as pipeline:
+            assert pipeline.run(input_data=1) == {'left': 2, 'right': 2}
+
+    def test_run_executes_independent_tasks_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait_for_the_other_branches(input_data):
+            # only returns if the three branches are running at the same time
+            barrier.wait()
+            return input_data
+
+        class ThreeBranchesPipeline(DagPipeline):
+            def get_tasks(self):
+                return {
+                    'nota': mock_task(wait_for_the_other_branches),
+                    'prestador': mock_task(wait_for_the_other_branches),
+                    'tomador': mock_task(wait_for_the_other_branches),
+                }
+
+        with ThreeBranchesPipeline(workers=3) as pipeline:
+            assert pipeline.run(input_data='file') == {'nota': 'file', 'prestador': 'file', 'tomador': 'file'}
+
+    def test_run_uses_the_join_method_to_build_the_result(self):
+
+        class PipelineWithJoin(BranchesPipeline):
+            def join(self, results):
+                return results['left'] + results['right']
+
+        with PipelineWithJoin() as pipeline:
+            assert pipeline.run(input_data=1) == 4
+
+    @pytest.mark.parametrize('backend', ['serial', 'thread'])
+    def test_run_method_raises_a_pipelineerror_if_any_task_raises_a_taskerror(self, backend):
+
+        def raise_task_error(input_data):
+            time.sleep(0.01)
+            raise TaskError(MagicMock())
+
+        class PipelineWithTaskThatRaisesATaskError(DagPipeline):
+            def get_tasks(self):
+                return {
+                    'ok': mock_task(lambda input_data: input_data),
+                    'error': mock_task(raise_task_error),
+                }
+
+        with PipelineWithTaskThatRaisesATaskError(backend=backend) as pipeline:
+            with pytest.raises(PipelineError):
+                pipeline.run(input_data=1)
+
+    def test_arun_passes_the_results_of_the_dependencies_to_each_task(self):
+        result = asyncio.run(DiamondPipeline().arun(input_data=1))
+
+        assert result == {'total': 6}
+
+    def test_arun_raises_a_pipelineerror_if_any_task_raises_a_taskerror(self):
+        with pytest.raises(PipelineError):
+            asyncio.run(FailingBranchPipeline().arun(input_data=1))
+
+    def test_dag_pipeline_is_a_pipeline(self):
+        assert isinstance(DiamondPipeline(), Pipeline)
+
+    @pytest.mark.parametrize('backend', ['serial', 'thread', 'process'])
+    def test_run_many_returns_the_results_in_the_order_of_the_inputs(self, backend):
+        with DiamondPipeline() as pipeline:
+            results = pipeline.run_many(range(5), workers=2, backend=backend)
+
+        assert all(isinstance(result, PipelineResult) and result.ok for result in results)
+        assert [result.output_data for result in results] == [{'total': (i + 2) * 2} for i in range(5)]
+
+    def test_run_many_keeps_the_error_of_a_failing_run(self):
+        results = FailingBranchPipeline().run_many([1, 2], workers=2, backend='thread')
+
+        assert [result.ok for result in results] == [False, False]
+        assert all(isinstance(result.error, PipelineError) for result in results)
+
+    def test_runs_on_many_threads_share_a_single_executor(self, monkeypatch):
+        executors = []
+
+        class SlowThreadPoolExecutor(dag_pipeline_module.ThreadPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                # widens the window in which another thread could create a second executor
+                time.sleep(0.05)
+                super().__init__(*args, **kwargs)
+                executors.append(self)
+
+        monkeypatch.setattr(dag_pipeline_module, 'ThreadPoolExecutor', SlowThreadPoolExecutor)
+
+        with BranchesPipeline(workers=2) as pipeline:
+            results = pipeline.run_many(range(8), workers=8, backend='thread')
+
+        assert all(result.ok for result in results)
+        assert len(executors) == 1
@@ -10,6 +10,7 @@ What should be tested:
 This test file should not depend on the implementation details of the Task class.
 """
 
+import asyncio
 import pytest
 
 from packag.modules.pipeline import Pipeline
@@ -110,5 +111,68 @@ class TestPipeline:
             
         with pytest.raises(PipelineError):
             PipelineWithTaskThatRaisesATaskError().run()
+            
+    def test_arun_method_returns_the_result_of_the_last_task(self):
         
-
+        mock_task = MagicMock(Task)
+        mock_task.arun.return_value = "result of the last task"
+        
+        class PipelineWithTwoTasks(Pipeline):
+            def get_tasks(self):
+                return [
+                    mock_task,
+                    mock_task
+                ]
+                
+        pipeline_result = asyncio.run(PipelineWithTwoTasks().arun(input_data='initial data'))
+        
+        assert pipeline_result == 'result of the last task'
+        assert mock_task.arun.await_count == 2
+        
+    def test_arun_method_raises_a_pipelineerror_if_any_task_raises_a_taskerror(self):
+        
+        mock_task = MagicMock(Task)
+        mock_task.arun.side_effect = TaskError(MagicMock())
+        
+        class PipelineWithTaskThatRaisesATaskError(Pipeline):
+            def get_tasks(self):
+                return [
+                    mock_task
+                ]
+            
+        with pytest.raises(PipelineError):
+            asyncio.run(PipelineWithTaskThatRaisesATaskError().arun())
+            
+    def test_get_tasks_is_called_only_once(self):
+        
+        mock_task = MagicMock(Task)
+        mock_task.run.return_value = "result of the last task"
+        
+        get_tasks = MagicMock(return_value=[mock_task])
+        
+        class PipelineWithOneTask(Pipeline):
+            def get_tasks(self):
+                return get_tasks()
+            
+        pipeline = PipelineWithOneTask()
+        
+        for _ in range(3):
+            pipeline.run(input_data='initial data')
+            
+        assert get_tasks.call_count == 1
+        assert mock_task.compile.call_count == 1
+        assert mock_task.run.call_count == 3
+        
+    def test_pipeline_with_a_task_that_fails_to_compile_raises_an_exception(self):
+        
+        mock_task = MagicMock(Task)
+        mock_task.compile.side_effect = TaskError(MagicMock())
+        
+        class PipelineWithInvalidTask(Pipeline):
+            def get_tasks(self):
+                return [
+                    mock_task
+                ]
+            
+        with pytest.raises(PipelineError):
+            PipelineWithInvalidTask()
@@ -0,0 +1,171 @@
+"""
+What should be tested:
+    - run_many returns one result per input, in the order of the inputs, on every backend.
+    - run_many keeps the PipelineError of a failing input and runs the other inputs.
+    - run_many keeps any other exception of a failing input, and the inputs of a dead worker fail without aborting the batch.
+    - iter_many yields every result.
+    - iter_many consumes the inputs lazily, with at most max_in_flight inputs in flight.
+    - an unknown backend or an invalid number of workers raises a ValueError.
+    - the process workers are recycled after max_tasks_per_worker inputs, or when they grow by more than max_worker_memory_mb.
+
+The dummy task and operation are defined at module level so the process backend can pickle them.
+"""
+
+import os
+import pickle
+import pytest
+
+from concurrent.futures.process import BrokenProcessPool
+
+from packag.modules.pipeline import Pipeline, PipelineResult
+from packag.modules.pipeline.operation import Operation
+from packag.modules.pipeline.task import Task
+from packag.modules.pipeline.utils.exceptions import PipelineError, OperationError
+from packag.modules.utils.messages import OperationErrorMessage
+
+
+class DoubleOperation(Operation):
+    def run(self, input_data=None):
+        if input_data < 0:
+            raise OperationError(
+                OperationErrorMessage(
+                    operation_name='DoubleOperation',
+                    original_exception='negative input',
+                )
+            )
+        return input_data * 2
+
+class DumpTask(Task):
+    def _validate_operation_cls(self, operation_cls):
+        return operation_cls
+    def _validate_input(self, input_data):
+        return input_data
+    def _validate_output(self, output_data):
+        return output_data
+
+class DoublePipeline(Pipeline):
+    def get_tasks(self):
+        return [DumpTask(DoubleOperation)]
+
+# memory kept by the worker processes across inputs (see LeakingPidOperation)
+_leaked = []
+
+class LeakingPidOperation(Operation):
+    """
+    Returns the pid of the worker, keeping input_data MB alive in the worker.
+    """
+    def run(self, input_data=None):
+        _leaked.append(bytearray(input_data * 1024 * 1024))
+        return os.getpid()
+
+class PidPipeline(Pipeline):
+    def get_tasks(self):
+        return [DumpTask(LeakingPidOperation)]
+
+class FragileOperation(Operation):
+    """
+    Fails with a ZeroDivisionError on 0 and kills its worker process on -1.
+    """
+    def run(self, input_data=None):
+        if input_data == -1:
+            os._exit(1)
+        return 10 // input_data
+
+class FragilePipeline(Pipeline):
+    def get_tasks(self):
+        return [DumpTask(FragileOperation)]
+
+
+class TestPipelineBatch:
+
+    @pytest.mark.parametrize('backend', ['serial', 'thread', 'process'])
+    def test_run_many_returns_the_results_in_the_order_of_the_inputs(self, backend):
+        results = DoublePipeline().run_many(range(10), workers=2, backend=backend)
+
+        assert [result.index for result in results] == list(range(10))
+        assert [result.output_data for result in results] == [i * 2 for i in range(10)]
+        assert all(isinstance(result, PipelineResult) and result.ok for result in results)
+
+    @pytest.mark.parametrize('backend', ['serial', 'thread', 'process'])
+    def test_run_many_keeps_the_error_of_a_failing_input_and_runs_the_others(self, backend):
+        results = DoublePipeline().run_many([1, -1, 3], workers=2, backend=backend)
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert [result.output_data for result in results] == [2, None, 6]
+        assert isinstance(results[1].error, PipelineError)
+        assert 'DoublePipeline' in str(results[1].error)
+
+    @pytest.mark.parametrize('backend', ['serial', 'thread', 'process'])
+    def test_run_many_keeps_an_error_that_is_not_a_pipeline_error_and_runs_the_others(self, backend):
+        results = FragilePipeline().run_many([1, 0, 5], workers=2, backend=backend)
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert [result.output_data for result in results] == [10, None, 2]
+        assert isinstance(results[1].error, ZeroDivisionError)
+
+    def test_run_many_keeps_the_error_of_the_inputs_of_a_dead_worker_and_runs_the_next_ones_on_a_new_pool(self):
+        results = list(FragilePipeline().iter_many([1, -1, 2, 5], workers=1, backend='process', max_in_flight=1))
+        results.sort(key=lambda result: result.index)
+
+        assert [result.ok for result in results] == [True, False, True, True]
+        assert [result.output_data for result in results] == [10, None, 5, 2]
+        assert isinstance(results[1].error, BrokenProcessPool)
+
+    def test_iter_many_yields_every_result(self):
+        results = list(DoublePipeline().iter_many([1, 2, 3], workers=2, backend='thread'))
+
+        assert sorted(result.output_data for result in results) == [2, 4, 6]
+
+    @pytest.mark.parametrize('backend', ['serial', 'thread'])
+    def test_iter_many_consumes_the_inputs_lazily(self, backend):
+        consumed = []
+
+        def inputs():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        results = DoublePipeline().iter_many(inputs(), workers=2, backend=backend, max_in_flight=2)
+
+        next(results)
+        assert len(consumed) <= 2
+
+        assert len(list(results)) == 99
+        assert len(consumed) == 100
+
+    def test_iter_many_raises_a_value_error_when_max_in_flight_is_not_positive(self):
+        with pytest.raises(ValueError):
+            DoublePipeline().iter_many([1], backend='thread', max_in_flight=0)
+
+    def test_run_many_raises_a_value_error_when_the_backend_is_unknown(self):
+        with pytest.raises(ValueError):
+            DoublePipeline().run_many([1], backend='cluster')
+
+    def test_run_many_raises_a_value_error_when_workers_is_not_positive(self):
+        with pytest.raises(ValueError):
+            DoublePipeline().run_many([1], workers=0, backend='thread')
+
+    def test_iter_many_recycles_the_workers_after_max_tasks_per_worker_inputs(self):
+        results = list(PidPipeline().iter_many([0] * 6, workers=1, backend='process', max_in_flight=1, max_tasks_per_worker=2))
+
+        assert len({result.output_data for result in results}) == 3
+
+    def test_iter_many_recycles_the_workers_when_they_grow_more_than_max_worker_memory_mb(self):
+        results = list(PidPipeline().iter_many([0, 0, 20, 0, 0], workers=1, backend='process', max_in_flight=1, max_worker_memory_mb=10))
+
+        pids = [result.output_data for result in results]
+
+        assert pids[0] == pids[1] == pids[2]
+        assert pids[3] == pids[4] != pids[2]
+
+    @pytest.mark.parametrize('recycling', [{'max_tasks_per_worker': 0}, {'max_worker_memory_mb': -1}])
+    def test_iter_many_raises_a_value_error_when_the_recycling_limits_are_not_positive(self, recycling):
+        with pytest.raises(ValueError):
+            DoublePipeline().iter_many([1], backend='process', **recycling)
+
+    def test_pipeline_error_can_be_pickled(self):
+        error = PipelineError(message='Something went wrong.', pipeline_name='DoublePipeline')
+
+        unpickled_error = pickle.loads(pickle.dumps(error))
+
+        assert str(unpickled_error) == str(error)
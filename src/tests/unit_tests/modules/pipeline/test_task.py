@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, MagicMock
 
@@ -242,4 +243,110 @@ class TestTask:
         
             
        
-   
\ No newline at end of file
+    
+    def test_task_arun_without_validation_error_and_valid_operation_returns_the_output_data(
+        self,
+        dump_task,
+    ):
+        """
+        ✅ Assert that the arun coroutine returns the output data of a synchronous operation (run on an executor)
+        """
+        
+        operation = MockOperation()
+        operation.run = MagicMock(return_value='hello')
+        
+        task_instance = dump_task(operation)
+        
+        output_data = asyncio.run(task_instance.arun(input_data=None))
+        
+        assert output_data == 'hello'
+        
+    def test_task_arun_awaits_the_arun_coroutine_of_the_operation(
+        self,
+        dump_task,
+    ):
+        """
+        ✅ Assert that the arun coroutine awaits the operation arun coroutine instead of running the run method
+        """
+        
+        class AsyncOperation(Operation):
+            def run(self, input_data=None):
+                raise AssertionError('run must not be called')
+            
+            async def arun(self, input_data=None):
+                return 'hello from arun'
+        
+        task_instance = dump_task(AsyncOperation)
+        
+        output_data = asyncio.run(task_instance.arun(input_data=None))
+        
+        assert output_data == 'hello from arun'
+        
+    def test_task_arun_with_operation_error_raises_a_taskerror(
+        self,
+        dump_task,
+    ):
+        """
+        ✅ Assert that the arun coroutine raises a TaskError if the operation raises an exception
+        """
+        
+        mock_operation_cls = MagicMock()
+        
+        mock_operation_instance = MagicMock()
+        mock_operation_instance.run.side_effect = OperationError(
+            OperationErrorMessage(
+                operation_name='MockOperation',
+                original_exception='TEST ERROR',
+            )
+        )
+        
+        mock_operation_cls.return_value = mock_operation_instance
+
+        task_instance = dump_task(mock_operation_cls)
+        
+        with pytest.raises(TaskError) as e:
+            asyncio.run(task_instance.arun(input_data=None))
+        
+        error_message = str(e.value).lower()
+        
+        for item in task_error_message_with_operation_error_must_contain(
+            task_name='DumpTask',
+            operation_name='MockOperation',
+        ):
+            assert item in error_message
+            
+    def test_task_validates_the_operation_cls_only_once(
+        self,
+        dump_task,
+    ):
+        """
+        ✅ Assert that the operation class is validated on the first run only, and again if it is replaced
+        """
+        
+        task_instance = dump_task(MockOperation)
+        task_instance._validate_operation_cls = MagicMock(side_effect=lambda operation_cls: operation_cls)
+        
+        for _ in range(3):
+            task_instance.run(input_data=None)
+            
+        assert task_instance._validate_operation_cls.call_count == 1
+        
+        task_instance.operation_cls = MockOperation()
+        task_instance.run(input_data=None)
+        
+        assert task_instance._validate_operation_cls.call_count == 2
+        
+    def test_task_compile_with_invalid_operation_cls_raises_a_taskerror(
+        self,
+        dump_task,
+    ):
+        """
+        ✅ Assert that the compile method raises a TaskError if the operation class is not valid
+        """
+        
+        task_instance = dump_task(MockOperation())
+        task_instance._validate_operation_cls = MagicMock(side_effect=TypeError())
+        
+        with pytest.raises(TaskError):
+            task_instance.compile()
+